@@ -9,6 +9,10 @@ from app.api.simulation_routes import simulation_bp
 def create_app():
     app = Flask(__name__, template_folder="templates", static_folder="../static")
 
+    # Parse uploads straight from a spooled buffer instead of a saved copy
+    from app.utils.upload_stream import SpooledUploadRequest
+    app.request_class = SpooledUploadRequest
+
     # Load configuration
     cfg = get_config()
     app.config.from_object(cfg)
@@ -44,13 +48,23 @@ def create_app():
     app.register_blueprint(advisory_bp, url_prefix="/ceo")
     app.register_blueprint(simulation_bp)
 
+    # Fail upload and forecast jobs left behind by a previous server process
+    from app.services import upload_job_service, forecast_job_service
+    upload_job_service.init_app(app)
+    forecast_job_service.init_app(app)
+
+    # Register CLI commands
+    from app.cli import register_commands
+    register_commands(app)
+
     # Setup logging
     from app.utils.logger import setup_logger
     setup_logger(app)
 
     # Start scheduler
-    from app.scheduler import start_scheduler
-    start_scheduler(app)
+    if not app.config.get("TESTING"):
+        from app.scheduler import start_scheduler
+        start_scheduler(app)
 
     app.jinja_env.globals.update(enumerate=enumerate)
 
@@ -0,0 +1,170 @@
+import numpy as np
+import pandas as pd
+from app.ai_engine.batch_forecaster import PERIOD_COLUMNS, forecast_periods, pivot_periods, series_factors
+from app.ai_engine.holt_winters import HW_MODELS, run_holt_winters
+
+# Error measures reported per horizon and overall
+METRICS = ("wape", "mape", "smape", "rmse", "coverage")
+
+# MAPE only scores actuals of at least this share of their series' average
+# scored actual; near-zero weeks or months would otherwise dominate it
+MATERIAL_SHARE = 0.1
+
+
+# ----------------------------------
+# WALK-FORWARD ENTRY
+# ----------------------------------
+def run_backtest(frame: pd.DataFrame, key: str, horizon: int = 6, cutoffs: int = 12,
+                 period_type: str = "monthly", min_revenue: float = 0.0, seasonal=None,
+                 model: str = None) -> dict:
+    """
+    Rolling-origin evaluation of the batch models for every distinct value
+    of `key`. frame: one row per (key, month_bucket) for monthly or per
+    (key, week_start) for weekly, with total_revenue and gross_profit.
+
+    The last `cutoffs` periods that still have at least one period after
+    them are used as forecast origins. At each origin every series is
+    forecast from the history up to and including it, and the next
+    `horizon` periods are scored against what actually sold. Returns
+    WAPE, MAPE (over material actuals), sMAPE, RMSE and 95% interval
+    coverage per horizon and overall.
+    model: None for the default models or a Holt-Winters model, whose
+    states are fitted at the first origin and carried forward.
+    """
+    if period_type not in PERIOD_COLUMNS:
+        return {"error": "Unsupported period type."}
+    if model is not None and model not in HW_MODELS:
+        return {"error": "Unsupported model."}
+    if frame.empty:
+        return {"error": "No sales data available."}
+
+    series, first_period, revenue, profit = pivot_periods(frame, key, period_type)
+    origins = origin_columns(revenue.shape[1], cutoffs)
+    if origins.size == 0:
+        return {"error": "Not enough periods to backtest."}
+
+    factors = series_factors(seasonal, series, period_type)
+    forecast, lower, upper = _walk_forward(
+        revenue, profit, origins, first_period, horizon, period_type, min_revenue, factors, model
+    )
+    actual = _actuals(revenue, origins, horizon, period_type)
+
+    # (cutoff, series, horizon) cubes: per horizon pools cutoffs and series
+    by_horizon = _metrics(forecast, lower, upper, actual, axis=(0, 1))
+    by_horizon["horizon"] = np.arange(1, horizon + 1)
+    overall = _metrics(forecast, lower, upper, actual, axis=None)
+    return {
+        "period_type": period_type,
+        "model": model or "default",
+        "horizon": horizon,
+        "cutoffs": [str(first_period + int(c)) for c in origins],
+        "series": len(series),
+        "by_horizon": by_horizon,
+        "overall": {name: value.item() for name, value in overall.items()},
+    }
+
+
+def origin_columns(n_periods: int, cutoffs: int) -> np.ndarray:
+    """Last `cutoffs` axis columns that leave at least one period to score."""
+    return np.arange(max(0, n_periods - 1 - cutoffs), n_periods - 1)
+
+
+# ----------------------------------
+# FORECASTS AND ACTUALS
+# ----------------------------------
+def _walk_forward(revenue, profit, origins, first_period, horizon, period_type, min_revenue,
+                  factors, model=None):
+    """
+    Forecast, lower and upper bound cubes (cutoff x series x horizon). Each
+    origin is one vectorized call over all series on the history truncated
+    at that origin, so no later period can leak into the fit. Holt-Winters
+    states move from one origin to the next like stored states do.
+    """
+    S = revenue.shape[0]
+    shape = (len(origins), S, horizon)
+    forecast = np.full(shape, np.nan)
+    lower = np.full(shape, np.nan)
+    upper = np.full(shape, np.nan)
+
+    states = None
+    for i, c in enumerate(origins):
+        if model is not None:
+            result = run_holt_winters(
+                revenue[:, :c + 1], profit[:, :c + 1], first_period,
+                period_type, horizon, HW_MODELS[model], states
+            )
+            states = result["state"]
+        else:
+            result = forecast_periods(
+                period_type, revenue[:, :c + 1], profit[:, :c + 1],
+                first_period, horizon, min_revenue, factors
+            )
+        forecast[i] = result["revenue"]
+        lower[i] = result["lower_bound"]
+        upper[i] = result["upper_bound"]
+
+    if period_type == "monthly" and model is None:
+        # the monthly model forecasts from each series' last usable month;
+        # only series that sold at the origin line up with its horizons
+        at_origin = revenue[:, origins].T
+        aligned = (np.isfinite(at_origin) & (at_origin > min_revenue))[:, :, None]
+        forecast = np.where(aligned, forecast, np.nan)
+    return forecast, lower, upper
+
+
+def _actuals(revenue, origins, horizon, period_type):
+    """
+    Realized revenue cube (cutoff x series x horizon); NaN past the end of
+    the data. Unsold weeks count as zero like in the weekly model, unsold
+    months are not scored since the monthly model skips them.
+    """
+    T = revenue.shape[1]
+    cols = origins[:, None] + np.arange(1, horizon + 1)[None, :]
+    available = cols < T
+    actual = revenue[:, np.minimum(cols, T - 1)].transpose(1, 0, 2)
+    if period_type == "weekly":
+        actual = np.where(np.isnan(actual), 0.0, actual)
+    return np.where(available[:, None, :], actual, np.nan)
+
+
+# ----------------------------------
+# ERROR MEASURES
+# ----------------------------------
+def _metrics(forecast, lower, upper, actual, axis) -> dict:
+    """
+    WAPE (total absolute error over total actuals), MAPE (over actuals of
+    at least MATERIAL_SHARE of their series' average), sMAPE, RMSE and
+    interval coverage over every scored (forecast, actual) pair along
+    `axis`, in percent except RMSE. NaN where nothing could be scored.
+    Cubes are (cutoff x series x horizon).
+    """
+    scored = np.isfinite(forecast) & np.isfinite(actual)
+    f = np.where(scored, forecast, 0.0)
+    a = np.where(scored, actual, 0.0)
+    error = np.abs(f - a)
+    count = scored.sum(axis=axis)
+
+    # each series' average scored actual sets what counts as material
+    level = np.abs(a).sum(axis=(0, 2)) / np.maximum(scored.sum(axis=(0, 2)), 1)
+    material = scored & (np.abs(a) > 0) & (np.abs(a) >= MATERIAL_SHARE * level[None, :, None])
+    denom = np.abs(f) + np.abs(a)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ape = np.where(material, error / np.where(material, np.abs(a), 1), 0.0)
+        sape = np.where(denom > 0, 2 * error / np.where(denom > 0, denom, 1), 0.0)
+        covered = scored & (a >= lower) & (a <= upper)
+
+        actual_total = np.abs(a).sum(axis=axis)
+        wape = np.where(actual_total > 0, 100 * error.sum(axis=axis) / actual_total, np.nan)
+        mape = np.where(material.sum(axis=axis) > 0, 100 * ape.sum(axis=axis) / material.sum(axis=axis), np.nan)
+        smape = np.where(count > 0, 100 * sape.sum(axis=axis) / count, np.nan)
+        rmse = np.where(count > 0, np.sqrt((error ** 2).sum(axis=axis) / count), np.nan)
+        coverage = np.where(count > 0, 100 * covered.sum(axis=axis) / count, np.nan)
+
+    return {
+        "wape": np.round(wape, 2),
+        "mape": np.round(mape, 2),
+        "smape": np.round(smape, 2),
+        "rmse": np.round(rmse, 2),
+        "coverage": np.round(coverage, 2),
+        "count": np.asarray(count),
+    }
@@ -0,0 +1,358 @@
+import numpy as np
+import pandas as pd
+from app.ai_engine.sales_forecaster import SEASONAL_INDEX
+
+# SEASONAL_INDEX as an array indexed by month - 1
+SEASONAL_VECTOR = np.array([SEASONAL_INDEX[m] for m in range(1, 13)])
+
+MIN_HISTORY = 3
+
+# Weekly model: seasonal slots, seasons needed to estimate them, history used
+SEASON_WEEKS = 52
+MIN_SEASONS = 2
+WEEKLY_HISTORY = 156
+
+# Slots of data-derived factors (seasonality_service): months, ISO weeks
+FACTOR_SLOTS = {"monthly": 12, "weekly": 53}
+# Floor for data-derived weekly factors, which the history is divided by
+MIN_FACTOR = 0.05
+
+# Column holding each period type's bucket in sales / rollup frames
+PERIOD_COLUMNS = {"monthly": "month_bucket", "weekly": "week_start"}
+
+
+# ----------------------------------
+# MATRIX FROM TOTALS
+# ----------------------------------
+def pivot_periods(frame: pd.DataFrame, key: str, period_type: str = "monthly"):
+    """
+    (key, month_bucket | week_start, total_revenue, gross_profit) rows ->
+    dense (series x period) revenue and profit matrices on one shared axis.
+    Periods a series did not sell in are NaN.
+    Returns (series_labels, first_period, revenue, profit).
+    """
+    codes, labels = pd.factorize(lexical(frame[key]), sort=True)
+    first_period, revenue, profit = period_matrices(codes, len(labels), frame, period_type)
+    return list(labels), first_period, revenue, profit
+
+
+def lexical(column: pd.Series) -> pd.Series:
+    """Categoricals sort by category order; re-sort categories by value."""
+    if isinstance(column.dtype, pd.CategoricalDtype):
+        return column.cat.reorder_categories(sorted(column.cat.categories))
+    return column
+
+
+def period_matrices(codes, n_series: int, frame: pd.DataFrame, period_type: str):
+    """
+    Scatters per-(series code, period bucket) totals into (n_series x period)
+    matrices. Returns (first_period, revenue, profit).
+    """
+    if period_type == "monthly":
+        bucket = frame["month_bucket"].to_numpy(dtype="int64")
+        ordinal = (bucket // 100 - 1970) * 12 + bucket % 100 - 1
+        freq = "M"
+    else:
+        ordinal = pd.PeriodIndex(pd.DatetimeIndex(frame["week_start"]), freq="W").asi8
+        freq = "W"
+
+    first = int(ordinal.min())
+    cols = ordinal - first
+    shape = (n_series, int(cols.max()) + 1)
+
+    rev = np.zeros(shape)
+    prof = np.zeros(shape)
+    seen = np.zeros(shape, dtype=bool)
+    np.add.at(rev, (codes, cols), frame["total_revenue"].to_numpy(dtype="float64"))
+    np.add.at(prof, (codes, cols), frame["gross_profit"].to_numpy(dtype="float64"))
+    seen[codes, cols] = True
+    rev[~seen] = np.nan
+    prof[~seen] = np.nan
+
+    return pd.Period(ordinal=first, freq=freq), rev, prof
+
+
+# ----------------------------------
+# SHARED MEASURES
+# ----------------------------------
+def _accuracy(actual, predicted, inside, n):
+    """R² as a 0-100 score (negative fits score 0) per row over `inside` cells."""
+    count = np.maximum(n, 1)
+    mean = np.where(inside, actual, 0.0).sum(axis=1) / count
+    ss_tot = (np.where(inside, actual - mean[:, None], 0.0) ** 2).sum(axis=1)
+    ss_res = (np.where(inside, actual - predicted, 0.0) ** 2).sum(axis=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        r2 = np.where(ss_tot > 0, 1 - ss_res / ss_tot, np.where(ss_res == 0, 1.0, 0.0))
+    return np.where(n >= 2, np.round(np.maximum(0, r2) * 100, 2), 0.0)
+
+
+def _std(values, inside, n):
+    """np.std per row over `inside` cells."""
+    count = np.maximum(n, 1)
+    mean = np.where(inside, values, 0.0).sum(axis=1) / count
+    return np.sqrt((np.where(inside, values - mean[:, None], 0.0) ** 2).sum(axis=1) / count)
+
+
+def _risk(revenue, inside, n):
+    """RISK ANALYSIS shared by both models: (stability_index, risk_score, volatility_level)."""
+    mean_rev = np.where(inside, revenue, 0.0).sum(axis=1) / np.maximum(n, 1)
+    return _risk_levels(mean_rev, _std(revenue, inside, n))
+
+
+def _risk_levels(mean_rev, std_hist):
+    """(stability_index, risk_score, volatility_level) from mean and std of revenue."""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        volatility_ratio = np.where(mean_rev > 0, std_hist / mean_rev, 0.0)
+    stability_index = np.clip(np.round((1 - volatility_ratio) * 100, 2), 0, 100)
+    risk_score = np.round(100 - stability_index, 2)
+    volatility_level = np.select([risk_score < 30, risk_score < 60], ["Low", "Moderate"], "High")
+    return stability_index, risk_score, volatility_level
+
+
+def _result(ok, forecast_start, n, revenue, profit, lower, upper, growth, accuracy,
+            stability_index, risk_score, volatility_level) -> dict:
+    blank = np.where(ok[:, None], 1.0, np.nan)
+    return {
+        "forecast_start": [start if good else None for start, good in zip(forecast_start, ok)],
+        "history_periods": n,
+        "revenue": np.round(revenue, 2) * blank,
+        "profit": np.round(profit, 2) * blank,
+        "lower_bound": np.round(lower, 2) * blank,
+        "upper_bound": np.round(upper, 2) * blank,
+        "growth_rate": np.where(ok, growth, np.nan),
+        "accuracy_score": np.where(ok, accuracy, np.nan),
+        "risk_score": np.where(ok, risk_score, np.nan),
+        "stability_index": np.where(ok, stability_index, np.nan),
+        "volatility_level": np.where(ok, volatility_level, None),
+        "status": np.where(ok, "ok", "insufficient_history"),
+    }
+
+
+# ----------------------------------
+# BATCH GROWTH MODEL (MONTHLY)
+# ----------------------------------
+def forecast_monthly_matrix(revenue: np.ndarray, profit: np.ndarray, first_period: pd.Period,
+                            periods: int = 6, min_revenue: float = 0.0, seasonal=None) -> dict:
+    """
+    Growth-Based Forecast + Seasonal Index for every row of a
+    (series x month) matrix at once; also serves the company-wide
+    forecast (sales_forecaster) as a single row.
+    Months with revenue <= min_revenue (or NaN) are dropped per series,
+    each series forecasts from its own last usable month, and series with
+    fewer than MIN_HISTORY usable months get status "insufficient_history".
+    seasonal: January..December factors, shared (12,) or per series
+    (S x 12); defaults to SEASONAL_INDEX.
+    """
+    S, T = revenue.shape
+    valid = np.isfinite(revenue) & (revenue > min_revenue)
+    n = valid.sum(axis=1)
+
+    # Left-justify each series' usable months, keeping their order
+    order = np.argsort(~valid, axis=1, kind="stable")
+    rev = np.take_along_axis(np.where(valid, revenue, np.nan), order, axis=1)
+    prof = np.take_along_axis(np.where(valid, profit, np.nan), order, axis=1)
+    inside = np.arange(T)[None, :] < n[:, None]
+
+    # -------- Growth Model --------
+    prev, cur = rev[:, :-1], rev[:, 1:]
+    pair = inside[:, 1:] & (prev > 0)
+    growth = np.where(pair, (cur - np.where(pair, prev, 0)) / np.where(pair, prev, 1), 0.0)
+    pairs = pair.sum(axis=1)
+    avg_growth = np.where(pairs > 0, growth.sum(axis=1) / np.maximum(pairs, 1), 0.0)
+    factor = (1 + avg_growth)[:, None]
+
+    # Historical reconstruction, multiplied step by step from the first month
+    steps = np.broadcast_to(factor, (S, max(T - 1, 0)))
+    y_pred = np.cumprod(np.concatenate([rev[:, :1], steps], axis=1), axis=1)
+
+    accuracy = _accuracy(rev, y_pred, inside, n)
+    std_dev = _std(rev - y_pred, inside, n)
+
+    # -------- Forecast --------
+    last = np.maximum(n - 1, 0)[:, None]
+    last_rev = np.take_along_axis(rev, last, axis=1)
+    last_profit = np.take_along_axis(prof, last, axis=1)
+    horizon = np.broadcast_to(factor, (S, periods))
+    base_rev = np.cumprod(np.concatenate([last_rev, horizon], axis=1), axis=1)[:, 1:]
+    base_profit = np.cumprod(np.concatenate([last_profit, horizon], axis=1), axis=1)[:, 1:]
+
+    # Calendar position of each series' last usable month on the shared axis
+    last_col = T - 1 - np.argmax(valid[:, ::-1], axis=1)
+    month0 = first_period.month - 1
+    future_month = (month0 + last_col[:, None] + np.arange(1, periods + 1)[None, :]) % 12
+    table = SEASONAL_VECTOR if seasonal is None else np.asarray(seasonal, dtype="float64")
+    seasonal = np.take_along_axis(np.broadcast_to(table, (S, 12)), future_month, axis=1)
+
+    adj_rev = np.maximum(0, base_rev * seasonal)
+    adj_profit = np.maximum(0, base_profit * seasonal)
+    band = 1.96 * std_dev[:, None]
+
+    start_index = first_period.ordinal + last_col + 1
+    return _result(
+        n >= MIN_HISTORY,
+        [str(pd.Period(ordinal=int(i), freq="M")) for i in start_index],
+        n, adj_rev, adj_profit, np.maximum(0, adj_rev - band), adj_rev + band,
+        avg_growth, accuracy, *_risk(rev, inside, n)
+    )
+
+
+# ----------------------------------
+# BATCH TREND + SEASONAL MODEL (WEEKLY)
+# ----------------------------------
+def _trend_season(y, inside, n, slots, seasonal_rows):
+    """
+    Least-squares linear trend per row plus additive week-of-year effects
+    (mean detrended value per slot, centered), all as matrix operations.
+    The trend is refit once on the deseasonalized series so seasonality
+    does not leak into the slope.
+    Returns (intercept, slope, xbar, sxx, season[S x SEASON_WEEKS]).
+    """
+    x = np.arange(y.shape[1], dtype="float64")
+    count = np.maximum(n, 1)
+    xbar = np.where(inside, x, 0.0).sum(axis=1) / count
+    dx = np.where(inside, x - xbar[:, None], 0.0)
+    sxx = (dx ** 2).sum(axis=1)
+    onehot = (slots[:, None] == np.arange(SEASON_WEEKS)[None, :]).astype("float64")
+    counts = inside.astype("float64") @ onehot
+
+    season = np.zeros((y.shape[0], SEASON_WEEKS))
+    for _ in range(2):
+        target = np.where(inside, y - season[:, slots], 0.0)
+        slope = np.where(sxx > 0, (dx * target).sum(axis=1) / np.where(sxx > 0, sxx, 1), 0.0)
+        intercept = target.sum(axis=1) / count - slope * xbar
+
+        detrended = np.where(inside, y - (intercept[:, None] + slope[:, None] * x), 0.0)
+        season = np.where(counts > 0, (detrended @ onehot) / np.maximum(counts, 1), 0.0)
+        season -= season.mean(axis=1, keepdims=True)
+        season *= seasonal_rows[:, None]
+    return intercept, slope, xbar, sxx, season
+
+
+def forecast_weekly_matrix(revenue: np.ndarray, profit: np.ndarray, first_period: pd.Period,
+                           periods: int = 6, seasonal=None) -> dict:
+    """
+    Linear trend + 52-week seasonality for every row of a (series x week)
+    matrix at once. Each series runs from its first sale (at most
+    WEEKLY_HISTORY weeks back) to the last week of the axis; weeks without
+    sales inside that span count as zero. Week-of-year effects are only
+    estimated once a series covers MIN_SEASONS full years. Bounds are
+    ±1.96 residual std, widened with distance from the fitted range.
+    seasonal: ISO week 1..53 factors, shared (53,) or per series (S x 53).
+    When given, the history is divided by them and only the trend is fit,
+    instead of estimating week effects from the series itself.
+    """
+    S, T = revenue.shape
+    observed = np.isfinite(revenue)
+    first_col = np.where(observed.any(axis=1), np.argmax(observed, axis=1), T)
+    start = np.maximum(first_col, T - WEEKLY_HISTORY)
+    inside = np.arange(T)[None, :] >= start[:, None]
+    n = inside.sum(axis=1)
+
+    rev = np.where(inside, np.nan_to_num(revenue), 0.0)
+    prof = np.where(inside, np.nan_to_num(profit), 0.0)
+
+    # ISO week of each week's Monday, as in seasonal_repo; calendar-anchored,
+    # so slots don't drift a day a year. Week 53 shares week 52's effect.
+    iso = pd.period_range(first_period, periods=T + periods, freq="W").start_time.isocalendar().week
+    iso = iso.to_numpy(dtype="int64")
+    slots = np.minimum(iso, SEASON_WEEKS) - 1
+    if seasonal is None:
+        seasonal_rows = n >= SEASON_WEEKS * MIN_SEASONS
+        scale = np.ones((S, T + periods))
+    else:
+        # multiplicative factors looked up by ISO week; no week effects fitted
+        seasonal_rows = np.zeros(S, dtype=bool)
+        table = np.maximum(np.broadcast_to(np.asarray(seasonal, dtype="float64"), (S, 53)), MIN_FACTOR)
+        scale = table[:, iso - 1]
+    hist_slots, future_slots = slots[:T], slots[T:]
+    hist_scale, future_scale = scale[:, :T], scale[:, T:]
+
+    rev_base = np.where(inside, rev / hist_scale, 0.0)
+    prof_base = np.where(inside, prof / hist_scale, 0.0)
+    a_rev, b_rev, xbar, sxx, s_rev = _trend_season(rev_base, inside, n, hist_slots, seasonal_rows)
+    a_prof, b_prof, _, _, s_prof = _trend_season(prof_base, inside, n, hist_slots, seasonal_rows)
+
+    # -------- Fit --------
+    x = np.arange(T, dtype="float64")
+    base_fit = a_rev[:, None] + b_rev[:, None] * x + s_rev[:, hist_slots]
+    accuracy = _accuracy(rev, base_fit * hist_scale, inside, n)
+    std_dev = _std(rev_base - base_fit, inside, n)
+
+    # -------- Forecast --------
+    future_x = T - 1 + np.arange(1, periods + 1, dtype="float64")
+    adj_rev = np.maximum(0, (a_rev[:, None] + b_rev[:, None] * future_x + s_rev[:, future_slots]) * future_scale)
+    adj_profit = np.maximum(0, (a_prof[:, None] + b_prof[:, None] * future_x + s_prof[:, future_slots]) * future_scale)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        spread = np.where(
+            sxx[:, None] > 0,
+            (future_x[None, :] - xbar[:, None]) ** 2 / np.where(sxx > 0, sxx, 1)[:, None],
+            0.0
+        )
+        band = 1.96 * std_dev[:, None] * np.sqrt(1 + 1 / np.maximum(n, 1)[:, None] + spread) * future_scale
+        mean_rev = rev.sum(axis=1) / np.maximum(n, 1)
+        # trend slope per week relative to the average weekly revenue
+        growth = np.where(mean_rev > 0, b_rev / mean_rev, 0.0)
+
+    forecast_start = str(pd.Period(ordinal=first_period.ordinal + T, freq="W"))
+    return _result(
+        n >= MIN_HISTORY, [forecast_start] * S,
+        n, adj_rev, adj_profit, np.maximum(0, adj_rev - band), adj_rev + band,
+        growth, accuracy, *_risk(rev, inside, n)
+    )
+
+
+def forecast_periods(period_type: str, revenue: np.ndarray, profit: np.ndarray,
+                     first_period: pd.Period, periods: int = 6, min_revenue: float = 0.0,
+                     seasonal=None) -> dict:
+    if period_type == "weekly":
+        return forecast_weekly_matrix(revenue, profit, first_period, periods, seasonal)
+    return forecast_monthly_matrix(revenue, profit, first_period, periods, min_revenue, seasonal)
+
+
+def series_factors(seasonal, labels: list, period_type: str):
+    """
+    Normalizes the `seasonal` argument of the batch runners: None, one
+    shared factor list, or {series label: factors} with the None key as
+    the fallback. Returns None, a shared (slots,) array or an
+    (S x slots) matrix aligned with `labels`.
+    """
+    if not isinstance(seasonal, dict):
+        return None if seasonal is None else np.asarray(seasonal, dtype="float64")
+
+    if period_type == "monthly":
+        fallback = SEASONAL_VECTOR
+    else:
+        # weekly without data-derived factors: flat (trend only)
+        fallback = np.ones(FACTOR_SLOTS[period_type])
+    default = seasonal.get(None)
+    default = fallback if default is None else default
+    return np.array([
+        seasonal[label] if seasonal.get(label) is not None else default
+        for label in labels
+    ], dtype="float64")
+
+
+def run_batch_forecast(frame: pd.DataFrame, key: str, periods: int = 6,
+                       min_revenue: float = 0.0, period_type: str = "monthly",
+                       seasonal=None) -> dict:
+    """
+    Forecast for every distinct value of `key` (e.g. product_name,
+    category). frame: one row per (key, month_bucket) for monthly or per
+    (key, week_start) for weekly, with total_revenue and gross_profit.
+    seasonal: optional data-derived factors, see series_factors.
+    Returns a columnar dict: "series" labels plus one array (or
+    series x periods matrix) per output field.
+    """
+    if period_type not in PERIOD_COLUMNS:
+        return {"error": "Unsupported period type."}
+    if frame.empty:
+        return {"error": "No sales data available."}
+
+    series, first_period, revenue, profit = pivot_periods(frame, key, period_type)
+    factors = series_factors(seasonal, series, period_type)
+    result = forecast_periods(period_type, revenue, profit, first_period, periods, min_revenue, factors)
+    result["series"] = series
+    result["period_type"] = period_type
+    result["periods"] = periods
+    return result
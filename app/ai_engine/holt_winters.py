@@ -0,0 +1,357 @@
+import numpy as np
+import pandas as pd
+from app.ai_engine.batch_forecaster import (
+    MIN_HISTORY, PERIOD_COLUMNS, _result, _risk_levels, lexical, period_matrices
+)
+
+# Selectable model name -> seasonal form
+HW_MODELS = {
+    "holt_winters_additive": "additive",
+    "holt_winters_multiplicative": "multiplicative",
+}
+
+SEASON_LENGTH = {"monthly": 12, "weekly": 52}
+
+# Smoothing grid searched per series when its state is first fitted
+ALPHAS = (0.1, 0.3, 0.5, 0.8)
+BETAS = (0.01, 0.1, 0.3)
+GAMMAS = (0.05, 0.2, 0.5)
+
+# Series fitted per grid pass; bounds memory to FIT_CHUNK x grid x periods
+FIT_CHUNK = 500
+
+# Floor for multiplicative seasonal factors, which observations are divided by
+MIN_SEASON = 0.01
+
+# Per-series state fields besides the season vector
+STATE_FIELDS = ("level", "trend", "alpha", "beta", "gamma", "margin", "n", "sse", "sum_y", "sum_y2")
+
+
+# ----------------------------------
+# BATCH ENTRY
+# ----------------------------------
+def run_holt_winters_batch(frame: pd.DataFrame, key: str, periods: int = 6,
+                           period_type: str = "monthly", kind: str = "additive",
+                           states: dict = None, partition: str = None) -> dict:
+    """
+    Holt-Winters forecast for every distinct value of `key`, or every
+    (partition, key) series when `partition` is given. frame: one row per
+    (partition,) key and month_bucket / week_start with total_revenue and
+    gross_profit.
+    states: stored states keyed by (partition value or "", series label);
+    series with a state are only advanced over the periods after it.
+    Returns the columnar batch result plus "state" (per series, None when
+    there is no history yet) and "state_changed".
+    """
+    if period_type not in PERIOD_COLUMNS:
+        return {"error": "Unsupported period type."}
+    if kind not in HW_MODELS.values():
+        return {"error": "Unsupported Holt-Winters model."}
+    if frame.empty:
+        return {"error": "No sales data available."}
+
+    if partition:
+        groups = frame.groupby([lexical(frame[partition]), lexical(frame[key])], sort=True, observed=True)
+        codes = groups.ngroup().to_numpy()
+        index = groups.size().index
+        partitions = [str(v) for v in index.get_level_values(0)]
+        series = [str(v) for v in index.get_level_values(1)]
+    else:
+        codes, labels = pd.factorize(lexical(frame[key]), sort=True)
+        series = [str(v) for v in labels]
+        partitions = [""] * len(series)
+    first_period, revenue, profit = period_matrices(codes, len(series), frame, period_type)
+
+    stored = None
+    if states:
+        stored = [states.get((p, s)) for p, s in zip(partitions, series)]
+    result = run_holt_winters(revenue, profit, first_period, period_type, periods, kind, stored)
+
+    if partition:
+        result["partition_by"] = partition
+        result["partition"] = partitions
+    result["series"] = series
+    result["period_type"] = period_type
+    result["periods"] = periods
+    return result
+
+
+def run_holt_winters(revenue: np.ndarray, profit: np.ndarray, first_period: pd.Period,
+                     period_type: str = "monthly", periods: int = 6, kind: str = "additive",
+                     states: list = None) -> dict:
+    """
+    Holt-Winters (level, trend, season) for every row of a
+    (series x period) matrix, vectorized across series.
+
+    The last period of the axis may still be filling up, so stored states
+    stop one period short of it: rows with a state (`states`, aligned with
+    rows) only fold in the closed periods after it, rows without one are
+    fitted over their closed history with a small smoothing-parameter
+    grid. The open period is then folded into a copy and the forecast
+    runs from there. Unsold months are skipped, unsold weeks count as
+    zero, as in the default models.
+    """
+    S, T = revenue.shape
+    m = SEASON_LENGTH[period_type]
+    fill_zero = period_type == "weekly"
+    closed = T - 1
+
+    state = _empty(S, m)
+    if states is not None:
+        _load(state, states, m)
+    before = state["through"].copy()
+    _advance(state, revenue, profit, first_period.ordinal, closed, m, kind, fill_zero)
+
+    started = np.isfinite(revenue[:, :closed]).any(axis=1) if closed else np.zeros(S, dtype=bool)
+    fresh = np.flatnonzero(~state["ready"] & started)
+    for lo in range(0, len(fresh), FIT_CHUNK):
+        rows = fresh[lo:lo + FIT_CHUNK]
+        fitted = _fit(revenue[rows, :closed], profit[rows, :closed], first_period.ordinal, m, kind, fill_zero)
+        for name, values in fitted.items():
+            state[name][rows] = values
+
+    changed = state["ready"] & (state["through"] != before)
+    stored_states = [_dump(state, i) if state["ready"][i] else None for i in range(S)]
+
+    current = {name: values.copy() for name, values in state.items()}
+    _advance(current, revenue, profit, first_period.ordinal, T, m, kind, fill_zero)
+    result = _forecast(current, periods, m, kind, first_period.freq)
+    result["state"] = stored_states
+    result["state_changed"] = changed
+    return result
+
+
+# ----------------------------------
+# STATE
+# ----------------------------------
+def _empty(S: int, m: int) -> dict:
+    state = {name: np.full(S, np.nan) for name in STATE_FIELDS}
+    state["season"] = np.full((S, m), np.nan)
+    state["through"] = np.full(S, -1, dtype="int64")
+    state["ready"] = np.zeros(S, dtype=bool)
+    return state
+
+
+def _load(state: dict, states: list, m: int):
+    """Copies stored per-series dicts into the state arrays (other season lengths are ignored)."""
+    for i, stored in enumerate(states):
+        if not stored or len(stored["season"]) != m:
+            continue
+        for name in STATE_FIELDS:
+            state[name][i] = np.nan if stored[name] is None else stored[name]
+        state["season"][i] = stored["season"]
+        state["through"][i] = stored["through"]
+        state["ready"][i] = True
+
+
+def _dump(state: dict, i: int) -> dict:
+    """One series' state as a JSON-ready dict; "through" is the last folded period ordinal."""
+    stored = {name: _clean(state[name][i]) for name in STATE_FIELDS}
+    stored["season"] = [float(v) for v in state["season"][i]]
+    stored["through"] = int(state["through"][i])
+    return stored
+
+
+def _clean(value):
+    value = float(value)
+    return None if np.isnan(value) else value
+
+
+# ----------------------------------
+# SMOOTHING
+# ----------------------------------
+def _advance(state: dict, revenue, profit, first_ordinal: int, stop: int, m: int,
+             kind: str, fill_zero: bool):
+    """
+    Folds columns after each ready row's "through" up to `stop`
+    (exclusive) into its state, one period at a time for all rows at
+    once. Cost is O(series x new periods).
+    """
+    start = np.where(state["ready"], state["through"] - first_ordinal + 1, stop)
+    if start.size == 0 or start.min() >= stop:
+        return
+
+    level, trend, season = state["level"], state["trend"], state["season"]
+    alpha, beta, gamma = state["alpha"], state["beta"], state["gamma"]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        for c in range(max(0, int(start.min())), stop):
+            active = start <= c
+            y, p = revenue[:, c], profit[:, c]
+            if fill_zero:
+                y, p = np.nan_to_num(y), np.nan_to_num(p)
+            observed = active & np.isfinite(y)
+
+            slot = (first_ordinal + c) % m
+            s = season[:, slot]
+            base = level + trend
+            if kind == "additive":
+                fit = base + s
+                new_level = alpha * (y - s) + (1 - alpha) * base
+            else:
+                fit = base * s
+                new_level = alpha * y / np.maximum(s, MIN_SEASON) + (1 - alpha) * base
+            new_trend = beta * (new_level - level) + (1 - beta) * trend
+            if kind == "additive":
+                new_season = gamma * (y - new_level) + (1 - gamma) * s
+            else:
+                new_season = np.where(new_level > 0, gamma * y / new_level + (1 - gamma) * s, s)
+
+            error = np.where(observed, y - fit, 0.0)
+            state["sse"] = np.where(observed, state["sse"] + error ** 2, state["sse"])
+            state["n"] = np.where(observed, state["n"] + 1, state["n"])
+            state["sum_y"] = np.where(observed, state["sum_y"] + y, state["sum_y"])
+            state["sum_y2"] = np.where(observed, state["sum_y2"] + y ** 2, state["sum_y2"])
+
+            sold = observed & (y > 0)
+            ratio = p / np.where(sold, y, 1.0)
+            margin = state["margin"]
+            state["margin"] = np.where(
+                sold, np.where(np.isnan(margin), ratio, alpha * ratio + (1 - alpha) * margin), margin
+            )
+
+            # periods without an observation carry the trend forward
+            level = np.where(observed, new_level, np.where(active, base, level))
+            trend = np.where(observed, new_trend, trend)
+            season[:, slot] = np.where(observed, new_season, s)
+            state["through"] = np.where(active, first_ordinal + c, state["through"])
+
+    state["level"], state["trend"] = level, trend
+
+
+def _fit(revenue, profit, first_ordinal: int, m: int, kind: str, fill_zero: bool) -> dict:
+    """
+    Initial state for rows without one: start values from the first two
+    seasons (level and trend only when less history exists), then one
+    smoothing pass per (alpha, beta, gamma) in the grid, all rows and
+    combinations at once; each row keeps the combination with the lowest
+    one-step-ahead squared error.
+    """
+    R, T = revenue.shape
+    grid = np.array([(a, b, g) for a in ALPHAS for b in BETAS for g in GAMMAS])
+    G = len(grid)
+    initial = _initial(revenue, first_ordinal, m, kind, fill_zero)
+
+    state = {name: np.repeat(values, G, axis=0) for name, values in initial.items()}
+    state["alpha"] = np.tile(grid[:, 0], R)
+    state["beta"] = np.tile(grid[:, 1], R)
+    state["gamma"] = np.where(np.repeat(initial["seasonal"], G), np.tile(grid[:, 2], R), 0.0)
+    for name in ("n", "sse", "sum_y", "sum_y2"):
+        state[name] = np.zeros(R * G)
+    state["margin"] = np.full(R * G, np.nan)
+    _advance(state, np.repeat(revenue, G, axis=0), np.repeat(profit, G, axis=0),
+             first_ordinal, T, m, kind, fill_zero)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        score = (state["sse"] / np.maximum(state["n"], 1)).reshape(R, G)
+    best = np.arange(R) * G + np.argmin(np.where(np.isfinite(score), score, np.inf), axis=1)
+    fitted = {name: state[name][best] for name in (*STATE_FIELDS, "season", "through")}
+    fitted["ready"] = np.ones(R, dtype=bool)
+    return fitted
+
+
+def _initial(revenue, first_ordinal: int, m: int, kind: str, fill_zero: bool) -> dict:
+    """
+    Start values per row, placed just before its first sale: level and
+    trend from the means of the first two seasons, seasonal factors from
+    the detrended values (centered on 0 / 1). Rows with under two seasons
+    start flat at their first value, with neutral seasonality.
+    """
+    R, T = revenue.shape
+    first = np.argmax(np.isfinite(revenue), axis=1)
+    steps = np.arange(2 * m)
+    cols = first[:, None] + steps[None, :]
+    inside = cols < T
+    window = np.take_along_axis(revenue, np.minimum(cols, T - 1), axis=1)
+    if fill_zero:
+        window = np.nan_to_num(window)
+    window = np.where(inside, window, np.nan)
+
+    mean1 = _nanmean(window[:, :m])
+    mean2 = _nanmean(window[:, m:])
+    seasonal = inside[:, -1] & np.isfinite(mean1) & np.isfinite(mean2)
+    if kind == "multiplicative":
+        seasonal &= (mean1 > 0) & (mean2 > 0)
+
+    trend = np.where(seasonal, (mean2 - mean1) / m, 0.0)
+    start = revenue[np.arange(R), first]
+    level = np.where(seasonal, mean1 - trend * (m + 1) / 2, start)
+
+    line = level[:, None] + trend[:, None] * (steps[None, :] + 1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        if kind == "additive":
+            deviation = window - line
+        else:
+            deviation = np.where(line > 0, window / line, np.nan)
+    position = _nanmean(np.stack([deviation[:, :m], deviation[:, m:]]), axis=0)
+    neutral = 0.0 if kind == "additive" else 1.0
+    position = np.where(seasonal[:, None] & np.isfinite(position), position, neutral)
+    if kind == "additive":
+        position -= position.mean(axis=1, keepdims=True)
+    else:
+        position = np.maximum(position, MIN_SEASON)
+        position /= position.mean(axis=1, keepdims=True)
+
+    # season vectors are stored by calendar slot, not by position after the first sale
+    season = np.empty((R, m))
+    slots = (first_ordinal + first[:, None] + np.arange(m)[None, :]) % m
+    np.put_along_axis(season, slots, position, axis=1)
+    return {
+        "level": level,
+        "trend": trend,
+        "season": season,
+        "through": first_ordinal + first - 1,
+        "ready": np.ones(R, dtype=bool),
+        "seasonal": seasonal,
+    }
+
+
+def _nanmean(values, axis=-1):
+    """np.nanmean without the empty-slice warning; NaN where nothing is finite."""
+    finite = np.isfinite(values)
+    count = finite.sum(axis=axis)
+    total = np.where(finite, values, 0.0).sum(axis=axis)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(count > 0, total / count, np.nan)
+
+
+# ----------------------------------
+# FORECAST
+# ----------------------------------
+def _forecast(state: dict, periods: int, m: int, kind: str, freq) -> dict:
+    """
+    h-step forecasts from each row's state. Bounds are ±1.96 one-step
+    error std, widened with the horizon by the usual additive
+    Holt-Winters variance multipliers.
+    """
+    S = len(state["level"])
+    h = np.arange(1, periods + 1)
+    slots = (state["through"][:, None] + h[None, :]) % m
+    season = np.take_along_axis(state["season"], slots, axis=1)
+    base = state["level"][:, None] + state["trend"][:, None] * h[None, :]
+    forecast = base + season if kind == "additive" else base * season
+    forecast = np.maximum(0, np.nan_to_num(forecast))
+    profit = forecast * np.nan_to_num(state["margin"])[:, None]
+
+    n = np.nan_to_num(state["n"])
+    count = np.maximum(n, 1)
+    sigma = np.sqrt(np.nan_to_num(state["sse"]) / count)
+    alpha, beta, gamma = (np.nan_to_num(state[p])[:, None] for p in ("alpha", "beta", "gamma"))
+    j = h[None, :-1]
+    step = alpha * (1 + j * beta) + gamma * (j % m == 0)
+    spread = np.concatenate([np.zeros((S, 1)), np.cumsum(step ** 2, axis=1)], axis=1)
+    band = 1.96 * sigma[:, None] * np.sqrt(1 + spread)
+
+    sum_y, sum_y2 = np.nan_to_num(state["sum_y"]), np.nan_to_num(state["sum_y2"])
+    ss_tot = np.maximum(sum_y2 - sum_y ** 2 / count, 0.0)
+    sse = np.nan_to_num(state["sse"])
+    with np.errstate(divide="ignore", invalid="ignore"):
+        r2 = np.where(ss_tot > 0, 1 - sse / ss_tot, np.where(sse == 0, 1.0, 0.0))
+        growth = np.where(state["level"] > 0, state["trend"] / state["level"], 0.0)
+    accuracy = np.where(n >= 2, np.round(np.maximum(0, r2) * 100, 2), 0.0)
+
+    return _result(
+        state["ready"] & (n >= MIN_HISTORY),
+        [str(pd.Period(ordinal=int(t) + 1, freq=freq)) for t in state["through"]],
+        n.astype("int64"), forecast, profit, np.maximum(0, forecast - band), forecast + band,
+        growth, accuracy, *_risk_levels(sum_y / count, np.sqrt(ss_tot / count))
+    )
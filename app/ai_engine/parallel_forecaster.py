@@ -0,0 +1,171 @@
+import math
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context, shared_memory
+import numpy as np
+import pandas as pd
+from app.ai_engine.batch_forecaster import (
+    PERIOD_COLUMNS, forecast_periods, lexical, period_matrices, series_factors
+)
+
+# Tasks per worker; more, smaller tasks even out uneven partitions
+TASKS_PER_WORKER = 4
+
+# One long-lived pool per process: spawning workers costs seconds of imports
+_pool = None
+_pool_workers = 0
+_pool_lock = threading.Lock()
+
+# Worker-side views onto the parent's shared matrices, keyed by block names
+_shared = {}
+
+
+# ----------------------------------
+# PARTITIONED ENTRY
+# ----------------------------------
+def run_partitioned_forecast(frame: pd.DataFrame, partition: str, key: str,
+                             periods: int = 6, workers: int = None,
+                             min_revenue: float = 0.0, period_type: str = "monthly",
+                             seasonal=None) -> dict:
+    """
+    Batch forecast for every (partition, key) series, e.g. each product in
+    each store. frame: one row per (partition, key, month_bucket) for
+    monthly or (partition, key, week_start) for weekly, with total_revenue
+    and gross_profit. seasonal: optional data-derived factors, shared or
+    keyed by `key` value (see series_factors).
+
+    Series are laid out partition by partition in one (series x period)
+    matrix held in shared memory; worker processes forecast row ranges
+    from it in place, so no DataFrame is pickled. Every row is forecast
+    independently and parts are merged in row order, so the result is
+    identical for any worker count.
+    """
+    if period_type not in PERIOD_COLUMNS:
+        return {"error": "Unsupported period type."}
+    if frame.empty:
+        return {"error": "No sales data available."}
+
+    groups = frame.groupby([lexical(frame[partition]), lexical(frame[key])], sort=True, observed=True)
+    codes = groups.ngroup().to_numpy()
+    index = groups.size().index
+    first_period, revenue, profit = period_matrices(codes, len(index), frame, period_type)
+    series = [str(v) for v in index.get_level_values(1)]
+    factors = series_factors(seasonal, series, period_type)
+
+    workers = max(1, workers or os.cpu_count() or 1)
+    tasks = _row_tasks(index.get_level_values(0), workers)
+    if workers == 1 or len(tasks) == 1:
+        result = forecast_periods(period_type, revenue, profit, first_period, periods, min_revenue, factors)
+    else:
+        parts = _run_pool(revenue, profit, tasks, workers, period_type, first_period, periods,
+                          min_revenue, factors)
+        result = _merge(parts)
+
+    result["partition_by"] = partition
+    result["partition"] = [str(v) for v in index.get_level_values(0)]
+    result["series"] = series
+    result["period_type"] = period_type
+    result["periods"] = periods
+    return result
+
+
+def _row_tasks(partitions, workers: int) -> list:
+    """
+    Contiguous (start, stop) row ranges that never cross a partition
+    boundary; partitions larger than the target size are split further.
+    """
+    codes = pd.factorize(partitions)[0]
+    bounds = np.flatnonzero(np.diff(codes)) + 1
+    edges = [0, *bounds.tolist(), len(codes)]
+    size = max(1, math.ceil(len(codes) / (workers * TASKS_PER_WORKER)))
+
+    tasks = []
+    for start, stop in zip(edges[:-1], edges[1:]):
+        for lo in range(start, stop, size):
+            tasks.append((lo, min(lo + size, stop)))
+    return tasks
+
+
+# ----------------------------------
+# PROCESS POOL
+# ----------------------------------
+def _get_pool(workers: int) -> ProcessPoolExecutor:
+    global _pool, _pool_workers
+    with _pool_lock:
+        if _pool is None or _pool_workers != workers:
+            if _pool is not None:
+                _pool.shutdown(wait=True)
+            # spawn, not fork: the web process runs threads (SocketIO, ingest pool).
+            # Spawned workers re-import the parent's __main__, so entry scripts
+            # skip app setup when imported as __mp_main__ (see run.py).
+            _pool = ProcessPoolExecutor(max_workers=workers, mp_context=get_context("spawn"))
+            _pool_workers = workers
+    return _pool
+
+
+def _run_pool(revenue, profit, tasks, workers, period_type, first_period, periods,
+              min_revenue, factors=None) -> list:
+    blocks = []
+    try:
+        for matrix in (revenue, profit):
+            block = shared_memory.SharedMemory(create=True, size=max(1, matrix.nbytes))
+            blocks.append(block)
+            np.ndarray(matrix.shape, dtype=matrix.dtype, buffer=block.buf)[:] = matrix
+
+        names = tuple(b.name for b in blocks)
+        jobs = [
+            (names, revenue.shape, period_type, first_period.ordinal, first_period.freqstr,
+             periods, min_revenue, _factor_rows(factors, start, stop), start, stop)
+            for start, stop in tasks
+        ]
+        # map() yields in task order, whatever order workers finish in
+        return list(_get_pool(workers).map(_forecast_rows, jobs))
+    finally:
+        for block in blocks:
+            block.close()
+            block.unlink()
+
+
+def _factor_rows(factors, start: int, stop: int):
+    """Per-series factors travel with their rows; a shared vector as is."""
+    if factors is None or factors.ndim == 1:
+        return factors
+    return factors[start:stop]
+
+
+def _attach(names, shape):
+    """Maps this job's shared blocks in the worker, dropping the previous job's."""
+    if _shared.get("names") != names:
+        for block in _shared.get("blocks", []):
+            block.close()
+        blocks = [shared_memory.SharedMemory(name=name) for name in names]
+        _shared["names"] = names
+        _shared["blocks"] = blocks
+        _shared["revenue"] = np.ndarray(shape, dtype="float64", buffer=blocks[0].buf)
+        _shared["profit"] = np.ndarray(shape, dtype="float64", buffer=blocks[1].buf)
+    return _shared["revenue"], _shared["profit"]
+
+
+def _forecast_rows(job):
+    names, shape, period_type, first_ordinal, freq, periods, min_revenue, factors, start, stop = job
+    revenue, profit = _attach(names, shape)
+    return forecast_periods(
+        period_type,
+        revenue[start:stop],
+        profit[start:stop],
+        pd.Period(ordinal=first_ordinal, freq=freq),
+        periods,
+        min_revenue,
+        factors
+    )
+
+
+def _merge(parts: list) -> dict:
+    merged = {}
+    for name, value in parts[0].items():
+        if isinstance(value, np.ndarray):
+            merged[name] = np.concatenate([p[name] for p in parts])
+        else:
+            merged[name] = [v for p in parts for v in p[name]]
+    return merged
@@ -3,23 +3,28 @@ import numpy as np
 from flask import current_app
 
 
-def analyze_profit_drivers(sales_data: list) -> dict:
+def analyze_profit_drivers(sales_data) -> dict:
     """
     Core AI engine for profit driver analysis.
-    Input: list of sale dicts from DB
+    Input: list of sale dicts from DB, or a typed sales DataFrame
     Output: structured profit driver report
     """
-    if not sales_data:
+    if isinstance(sales_data, pd.DataFrame):
+        if sales_data.empty:
+            return {"error": "No sales data available for analysis."}
+        df = sales_data.copy()
+        # labels only; groupby on categoricals would also emit unobserved groups
+        for col in df.select_dtypes("category").columns:
+            df[col] = df[col].astype(object)
+    elif not sales_data:
         return {"error": "No sales data available for analysis."}
+    else:
+        df = pd.DataFrame(sales_data)
 
-    df = pd.DataFrame(sales_data)
-
-    # Ensure numeric types
-    df["total_revenue"] = pd.to_numeric(df["total_revenue"], errors="coerce")
-    df["gross_profit"] = pd.to_numeric(df["gross_profit"], errors="coerce")
-    df["cost_price"] = pd.to_numeric(df["cost_price"], errors="coerce")
-    df["quantity_sold"] = pd.to_numeric(df["quantity_sold"], errors="coerce")
-    df["unit_price"] = pd.to_numeric(df["unit_price"], errors="coerce")
+    # Ensure numeric types (rows may be per-sale or pre-aggregated per product)
+    for col in ["total_revenue", "gross_profit", "cost_price", "quantity_sold", "unit_price"]:
+        if col in df.columns:
+            df[col] = pd.to_numeric(df[col], errors="coerce")
     df.dropna(subset=["total_revenue", "gross_profit"], inplace=True)
 
     total_profit = df["gross_profit"].sum()
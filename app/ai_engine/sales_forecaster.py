@@ -1,25 +1,6 @@
 import pandas as pd
 import numpy as np
 from flask import current_app
-from sklearn.metrics import r2_score
-
-
-# ----------------------------------
-# ACCURACY FUNCTION (R² BASED)
-# ----------------------------------
-def calculate_accuracy(actual, predicted):
-    actual = np.array(actual)
-    predicted = np.array(predicted)
-
-    if len(actual) < 2:
-        return 0
-
-    try:
-        score = r2_score(actual, predicted)
-        accuracy = max(0, score) * 100
-        return round(accuracy, 2)
-    except Exception:
-        return 0
 
 
 # ----------------------------------
@@ -40,11 +21,30 @@ SEASONAL_INDEX = {
     12: 1.10,
 }
 
+# Months at or below this revenue are dropped by the company-wide monthly
+# model (structural break fix: very small early months)
+MIN_MONTHLY_REVENUE = 100000.0
+
+
+EXECUTIVE_SIGNALS = {
+    "Low": "Stable growth trajectory with controlled fluctuations.",
+    "Moderate": "Growth present but revenue fluctuations detected.",
+    "High": "High volatility — expansion risk or unstable demand pattern.",
+}
+
 
 # ----------------------------------
 # MAIN ENTRY
 # ----------------------------------
-def run_forecast(sales_data: list, periods: int = 6, period_type: str = "monthly"):
+def run_forecast(sales_data: list, periods: int = 6, period_type: str = "monthly",
+                 seasonal_index: list = None, model: str = None):
+    """
+    seasonal_index: data-derived factors (index 0 = January for monthly,
+    ISO week 1 for weekly) replacing SEASONAL_INDEX / the fitted weekly
+    seasonality; None keeps the defaults.
+    model: None for the default models, or "holt_winters_additive" /
+    "holt_winters_multiplicative" (fitted from scratch; seasonal_index unused).
+    """
 
     if not sales_data:
         return {"error": "No sales data available."}
@@ -59,10 +59,17 @@ def run_forecast(sales_data: list, periods: int = 6, period_type: str = "monthly
         return {"error": "Need at least 5 records."}
 
     try:
+        if model is not None:
+            if period_type not in PERIOD_FREQ:
+                return {"error": "Unsupported period type."}
+            totals = _period_totals(df, PERIOD_FREQ[period_type])
+            result = _holt_winters_from_totals(totals, periods, period_type, model)
+            result.pop("model_state", None)
+            return result
         if period_type == "monthly":
-            return _monthly_forecast(df, periods)
+            return _monthly_forecast(df, periods, seasonal_index)
         elif period_type == "weekly":
-            return _weekly_forecast(df, periods)
+            return _weekly_forecast(df, periods, seasonal_index)
         else:
             return {"error": "Unsupported period type."}
     except Exception as e:
@@ -71,207 +78,184 @@ def run_forecast(sales_data: list, periods: int = 6, period_type: str = "monthly
 
 
 # ----------------------------------
-# MONTHLY FORECAST
+# PERIOD-AGGREGATED ENTRY
 # ----------------------------------
-def _monthly_forecast(df, periods):
+PERIOD_FREQ = {"monthly": "M", "weekly": "W"}
+
+
+def run_forecast_from_totals(period_labels, revenue, profit,
+                             periods: int = 6, period_type: str = "monthly",
+                             seasonal_index: list = None, model: str = None,
+                             state: dict = None):
+    """
+    Forecast from totals already aggregated per period (e.g. by SQL).
+    period_labels: "YYYY-MM" (monthly) or "YYYY-MM-DD/YYYY-MM-DD" (weekly),
+    aligned with the revenue and profit arrays.
+    Cost depends on the number of periods, not the number of sales rows.
+    With a Holt-Winters model, `state` is the stored state to continue
+    from and the result carries "model_state" ({"state", "changed"}) for
+    the caller to persist.
+    """
+    freq = PERIOD_FREQ.get(period_type)
+    if freq is None:
+        return {"error": "Unsupported period type."}
+    if len(period_labels) == 0:
+        return {"error": "No sales data available."}
+
+    try:
+        totals = pd.DataFrame({
+            "period": pd.PeriodIndex(list(period_labels), freq=freq),
+            "revenue": np.asarray(revenue, dtype="float64"),
+            "profit": np.asarray(profit, dtype="float64")
+        }).sort_values("period").reset_index(drop=True)
+
+        if model is not None:
+            return _holt_winters_from_totals(totals, periods, period_type, model, state)
+        if period_type == "monthly":
+            return _monthly_from_totals(totals, periods, seasonal_index)
+        return _weekly_from_totals(totals, periods, seasonal_index)
+    except Exception as e:
+        current_app.logger.error(str(e))
+        return {"error": str(e)}
 
-    df["period"] = df["date"].dt.to_period("M")
-    monthly = df.groupby("period").agg(
+
+def _period_totals(df, freq):
+    """Row-level frame -> one row per period with summed revenue/profit."""
+    df["period"] = df["date"].dt.to_period(freq)
+    return df.groupby("period").agg(
         revenue=("total_revenue", "sum"),
         profit=("gross_profit", "sum")
     ).reset_index()
 
-    monthly = monthly.sort_values("period")
-# Remove very small early months (structural break fix)
-    monthly = monthly[monthly["revenue"] > 100000]
-
-# If too few records remain, fallback to last 6 months
-    # Remove very small early months (structural break fix)
-    monthly = monthly[monthly["revenue"] > 100000]
-
-# If too few records remain, fallback to last 6 months
-    if len(monthly) < 3:
-        monthly = monthly.tail(6)
-
-    if len(monthly) < 3:
-        return {"error": "Need at least 3 months."}
-
-    monthly["period_str"] = monthly["period"].astype(str)
-
-    revenues = monthly["revenue"].values
-    profits = monthly["profit"].values
-
-    # -------- Growth Model --------
-    growth_rates = []
-    for i in range(1, len(revenues)):
-        if revenues[i - 1] > 0:
-            growth = (revenues[i] - revenues[i - 1]) / revenues[i - 1]
-            growth_rates.append(growth)
-
-    avg_growth = np.mean(growth_rates) if growth_rates else 0
-
-    # Reconstruct historical prediction
-    y_pred_rev = [revenues[0]]
-    for i in range(1, len(revenues)):
-        y_pred_rev.append(y_pred_rev[i - 1] * (1 + avg_growth))
-
-    y_pred_rev = np.array(y_pred_rev)
-
-    accuracy = calculate_accuracy(revenues, y_pred_rev)
-
-    std_dev = float(np.std(revenues - y_pred_rev))
-
-    last_period = monthly["period"].iloc[-1]
-
-    future_periods = []
-    future_revenue = []
-    future_profit = []
-    future_lower = []
-    future_upper = []
-
-    last_rev = revenues[-1]
-    last_profit = profits[-1]
-
-    for i in range(1, periods + 1):
-
-        next_period = last_period + i
-        month_num = next_period.month
 
-        base_rev = last_rev * (1 + avg_growth)
-        base_profit = last_profit * (1 + avg_growth)
-
-        last_rev = base_rev
-        last_profit = base_profit
-
-        seasonal = SEASONAL_INDEX.get(month_num, 1.0)
-
-        adj_rev = max(0, base_rev * seasonal)
-        adj_profit = max(0, base_profit * seasonal)
-
-        future_periods.append(str(next_period))
-        future_revenue.append(round(adj_rev, 2))
-        future_profit.append(round(adj_profit, 2))
-        future_lower.append(round(max(0, adj_rev - 1.96 * std_dev), 2))
-        future_upper.append(round(adj_rev + 1.96 * std_dev, 2))
+# ----------------------------------
+# MONTHLY FORECAST
+# ----------------------------------
+def _monthly_forecast(df, periods, seasonal_index=None):
+    return _monthly_from_totals(_period_totals(df, "M"), periods, seasonal_index)
 
-        # --------- RISK ANALYSIS ---------
 
-    mean_rev = np.mean(revenues)
-    std_hist = np.std(revenues)
+def _monthly_from_totals(monthly, periods, seasonal_index=None):
+    # Vectorized model shared with the batch engine (imported here: it imports this module)
+    from app.ai_engine.batch_forecaster import forecast_monthly_matrix
 
-    if mean_rev > 0:
-        volatility_ratio = std_hist / mean_rev
-    else:
-        volatility_ratio = 0
+    first, revenue, profit = _totals_matrix(monthly)
 
-    stability_index = max(0, min(100, round((1 - volatility_ratio) * 100, 2)))
-    risk_score = round(100 - stability_index, 2)
+    result = forecast_monthly_matrix(revenue, profit, first, periods, MIN_MONTHLY_REVENUE, seasonal_index)
+    if result["status"][0] != "ok":
+        return {"error": "Need at least 3 months."}
 
-    if risk_score < 30:
-        volatility_level = "Low"
-    elif risk_score < 60:
-        volatility_level = "Moderate"
-    else:
-        volatility_level = "High"
-
-    if volatility_level == "Low":
-        executive_signal = "Stable growth trajectory with controlled fluctuations."
-    elif volatility_level == "Moderate":
-        executive_signal = "Growth present but revenue fluctuations detected."
-    else:
-        executive_signal = "High volatility — expansion risk or unstable demand pattern."
-
-    return {
-        "period_type": "monthly",
-        "historical": {
-            "periods": monthly["period_str"].tolist(),
-            "revenue": [round(float(r), 2) for r in revenues],
-            "profit": [round(float(p), 2) for p in profits]
-        },
-        "forecast": {
-            "periods": future_periods,
-            "revenue": future_revenue,
-            "profit": future_profit,
-            "lower_bound": future_lower,
-            "upper_bound": future_upper
-        },
-        "accuracy_score": accuracy,
-        "model": "Growth-Based Forecast + Seasonal Index",
-        "summary": _forecast_summary(future_revenue, future_profit, accuracy),
-        "risk_analysis": {
-            "risk_score": risk_score,
-            "stability_index": stability_index,
-            "volatility_level": volatility_level,
-            "executive_signal": executive_signal
-        }
-    }
+    usable = np.flatnonzero(np.isfinite(revenue[0]) & (revenue[0] > MIN_MONTHLY_REVENUE))
+    return _matrix_response(
+        result, first, revenue, profit, usable, "monthly",
+        "Growth-Based Forecast + Seasonal Index", "data" if seasonal_index else "default"
+    )
 
 
 # ----------------------------------
 # WEEKLY FORECAST
 # ----------------------------------
-def _weekly_forecast(df, periods):
-
-    df["period"] = df["date"].dt.to_period("W")
-    weekly = df.groupby("period").agg(
-        revenue=("total_revenue", "sum"),
-        profit=("gross_profit", "sum")
-    ).reset_index()
+def _weekly_forecast(df, periods, seasonal_index=None):
+    return _weekly_from_totals(_period_totals(df, "W"), periods, seasonal_index)
 
-    weekly = weekly.sort_values("period").tail(12)
 
-    if len(weekly) < 3:
-        return {"error": "Need at least 3 weeks."}
-
-    weekly["period_str"] = weekly["period"].astype(str)
-
-    revenues = weekly["revenue"].values
-    profits = weekly["profit"].values
+def _weekly_from_totals(weekly, periods, seasonal_index=None):
+    # Vectorized model shared with the batch engine (imported here: it imports this module)
+    from app.ai_engine.batch_forecaster import forecast_weekly_matrix
 
-    accuracy = calculate_accuracy(revenues, revenues)
+    # Weeks without sales stay NaN (zero once the series has started)
+    first, revenue, profit = _totals_matrix(weekly)
 
-    last_period = weekly["period"].iloc[-1]
+    result = forecast_weekly_matrix(revenue, profit, first, periods, seasonal_index)
+    if result["status"][0] != "ok":
+        return {"error": "Need at least 3 weeks."}
 
-    future_periods = []
-    future_revenue = []
-    future_profit = []
+    used = int(result["history_periods"][0])
+    history = range(revenue.shape[1] - used, revenue.shape[1])
+    return _matrix_response(
+        result, first, revenue, profit, history, "weekly",
+        "Linear Trend + 52-Week Seasonality", "data" if seasonal_index else "fitted"
+    )
 
-    last_rev = revenues[-1]
-    last_profit = profits[-1]
 
-    for i in range(1, periods + 1):
+# ----------------------------------
+# HOLT-WINTERS FORECAST
+# ----------------------------------
+def _holt_winters_from_totals(totals, periods, period_type, model, state=None):
+    # Imported here: the engine imports the batch module, which imports this one
+    from app.ai_engine.holt_winters import HW_MODELS, run_holt_winters
+
+    if model not in HW_MODELS:
+        return {"error": f"Unsupported model. Use one of: {', '.join(HW_MODELS)}."}
+
+    first, revenue, profit = _totals_matrix(totals)
+    result = run_holt_winters(revenue, profit, first, period_type, periods, HW_MODELS[model], [state])
+    if result["status"][0] != "ok":
+        return {"error": "Need at least 3 periods."}
+
+    response = _matrix_response(
+        result, first, revenue, profit, range(revenue.shape[1]), period_type,
+        f"Holt-Winters ({HW_MODELS[model]})", "fitted"
+    )
+    response["model_state"] = {
+        "state": result["state"][0],
+        "changed": bool(result["state_changed"][0])
+    }
+    return response
 
-        next_period = last_period + i
 
-        future_periods.append(str(next_period))
-        future_revenue.append(round(last_rev, 2))
-        future_profit.append(round(last_profit, 2))
+# ----------------------------------
+# MATRIX HELPERS
+# ----------------------------------
+def _totals_matrix(totals):
+    """Per-period totals -> (first period, 1 x period revenue, profit) on a contiguous axis."""
+    totals = totals.sort_values("period")
+    first = totals["period"].iloc[0]
+    ordinals = np.array([p.ordinal for p in totals["period"]]) - first.ordinal
+    revenue = np.full((1, int(ordinals.max()) + 1), np.nan)
+    profit = np.full_like(revenue, np.nan)
+    revenue[0, ordinals] = totals["revenue"].values
+    profit[0, ordinals] = totals["profit"].values
+    return first, revenue, profit
+
+
+def _matrix_response(result, first, revenue, profit, history, period_type, model, seasonality):
+    """
+    Single-series response from row 0 of a batch engine result. `history`
+    are the axis columns the model used; the forecast follows the last one.
+    """
+    last_period = first + int(history[-1])
+
+    future_revenue = [float(v) for v in result["revenue"][0]]
+    future_periods = [str(last_period + i) for i in range(1, len(future_revenue) + 1)]
+    future_profit = [float(v) for v in result["profit"][0]]
+    accuracy = float(result["accuracy_score"][0])
+    volatility_level = str(result["volatility_level"][0])
 
     return {
-        "period_type": "weekly",
+        "period_type": period_type,
         "historical": {
-            "periods": weekly["period_str"].tolist(),
-            "revenue": [round(float(r), 2) for r in revenues],
-            "profit": [round(float(p), 2) for p in profits]
+            "periods": [str(first + c) for c in history],
+            "revenue": [round(float(np.nan_to_num(revenue[0, c])), 2) for c in history],
+            "profit": [round(float(np.nan_to_num(profit[0, c])), 2) for c in history]
         },
         "forecast": {
             "periods": future_periods,
             "revenue": future_revenue,
             "profit": future_profit,
-            "lower_bound": future_revenue,
-            "upper_bound": future_revenue
+            "lower_bound": [float(v) for v in result["lower_bound"][0]],
+            "upper_bound": [float(v) for v in result["upper_bound"][0]]
         },
         "accuracy_score": accuracy,
-        "model": "Flat Weekly Projection",
+        "model": model,
+        "seasonality": seasonality,
         "summary": _forecast_summary(future_revenue, future_profit, accuracy),
-        
         "risk_analysis": {
-            "risk_score": risk_score,
-            "stability_index": stability_index,
+            "risk_score": float(result["risk_score"][0]),
+            "stability_index": float(result["stability_index"][0]),
             "volatility_level": volatility_level,
-            "executive_signal": executive_signal
+            "executive_signal": EXECUTIVE_SIGNALS[volatility_level]
         }
-    
     }
 
 
@@ -1,15 +1,35 @@
+from datetime import datetime
 from flask import Blueprint, render_template, jsonify, request
-from flask_login import login_required
+from flask_login import login_required, current_user
 from app.utils.decorators import role_required
 from app.services.analytics_service import get_business_summary
 from app.services.profit_service import get_profit_driver_report
-from app.services.forecast_service import generate_forecast
+from app.services.forecast_service import generate_forecast, get_stored_batch_forecast, generate_backtest
+from app.services.forecast_job_service import enqueue_batch_forecast, get_job_status
+from app.services.seasonality_service import get_seasonal_profile
 from app.ai_engine.executive_chatbot import generate_ceo_response
 from app.services.risk_service import generate_risk_index
 from app.services.stress_service import generate_market_stress
 
 ceo_bp = Blueprint("ceo", __name__)
 
+
+def _analytics_filters(args) -> dict:
+    """
+    Reads ?start=YYYY-MM-DD&end=YYYY-MM-DD&region=..&store_id=.. from the
+    query string. Raises ValueError on a malformed date or inverted range.
+    """
+    filters = {}
+    for key in ("start", "end"):
+        if args.get(key):
+            filters[key] = datetime.strptime(args[key], "%Y-%m-%d").date()
+    for key in ("region", "store_id"):
+        if args.get(key):
+            filters[key] = args[key].strip()
+    if filters.get("start") and filters.get("end") and filters["start"] > filters["end"]:
+        raise ValueError("start must be on or before end")
+    return filters
+
 # =========================
 # DASHBOARD
 # =========================
@@ -27,7 +47,11 @@ def dashboard():
 @login_required
 @role_required("CEO")
 def analytics():
-    summary = get_business_summary()
+    try:
+        filters = _analytics_filters(request.args)
+    except ValueError:
+        filters = {}
+    summary = get_business_summary(**filters)
     return render_template("ceo/analytics.html", data=summary)
 
 
@@ -104,7 +128,12 @@ def ceo_chat():
 @login_required
 @role_required("CEO")
 def api_analytics():
-    summary = get_business_summary()
+    try:
+        filters = _analytics_filters(request.args)
+    except ValueError as e:
+        return jsonify({"error": f"Invalid filter: {e}"}), 400
+
+    summary = get_business_summary(**filters)
     return jsonify(summary)
 
 
@@ -139,6 +168,97 @@ def api_risk_index():
 def api_forecast():
     period_type = request.args.get("period_type", "monthly")
     periods = int(request.args.get("periods", 6))
+    model = request.args.get("model") or None
 
-    result = generate_forecast(period_type=period_type, periods=periods)
-    return jsonify(result)
\ No newline at end of file
+    result = generate_forecast(period_type=period_type, periods=periods, model=model)
+    return jsonify(result)
+
+
+@ceo_bp.route("/api/forecast/batch", methods=["GET"])
+@login_required
+@role_required("CEO")
+def api_batch_forecast():
+    """Latest stored batch; POST to the same URL computes a new one."""
+    try:
+        params = _batch_params(request.args)
+    except ValueError as e:
+        return jsonify({"error": f"Invalid parameter: {e}"}), 400
+    result = get_stored_batch_forecast(**params)
+    if result is None:
+        return jsonify({"error": "No batch forecast stored yet. POST to this URL to queue one."}), 404
+    status = 400 if "error" in result else 200
+    return jsonify(result), status
+
+
+@ceo_bp.route("/api/forecast/batch", methods=["POST"])
+@login_required
+@role_required("CEO")
+def api_queue_batch_forecast():
+    try:
+        params = _batch_params(request.get_json(silent=True) or request.form)
+    except ValueError as e:
+        return jsonify({"error": f"Invalid parameter: {e}"}), 400
+    success, message, job = enqueue_batch_forecast(**params, requested_by=current_user.id)
+    if not success:
+        return jsonify({"error": message}), 400
+    return jsonify({"message": message, "job": job.to_dict()}), 202
+
+
+@ceo_bp.route("/api/forecast/jobs/<int:job_id>")
+@login_required
+@role_required("CEO")
+def api_forecast_job(job_id):
+    job = get_job_status(job_id)
+    if job is None:
+        return jsonify({"error": "Forecast job not found."}), 404
+    return jsonify(job)
+
+
+def _batch_params(values) -> dict:
+    """
+    Batch forecast parameters from a query string, form or JSON body.
+    Raises ValueError when periods is not a whole number; ranges and
+    names are checked by forecast_service.batch_params_error.
+    """
+    try:
+        periods = int(str(values.get("periods", 6)).strip())
+    except ValueError:
+        raise ValueError("periods must be a whole number") from None
+    return {
+        "level": values.get("level", "product_name"),
+        "periods": periods,
+        "partition_by": values.get("by") or None,
+        "period_type": values.get("period_type", "monthly"),
+        "model": values.get("model") or None,
+    }
+
+
+@ceo_bp.route("/api/forecast/backtest")
+@login_required
+@role_required("CEO")
+def api_forecast_backtest():
+    level = request.args.get("level", "total")
+    period_type = request.args.get("period_type", "monthly")
+    horizon = int(request.args.get("horizon", 6))
+    cutoffs = int(request.args.get("cutoffs", 12))
+    model = request.args.get("model") or None
+
+    result = generate_backtest(level=level, period_type=period_type, horizon=horizon,
+                               cutoffs=cutoffs, model=model)
+    status = 400 if "error" in result else 200
+    return jsonify(result), status
+
+
+@ceo_bp.route("/api/seasonality")
+@login_required
+@role_required("CEO")
+def api_seasonality():
+    category = request.args.get("category")
+    region = request.args.get("region")
+    if category:
+        profile = get_seasonal_profile("category", category)
+    elif region:
+        profile = get_seasonal_profile("region", region)
+    else:
+        profile = get_seasonal_profile()
+    return jsonify(profile)
\ No newline at end of file
@@ -1,9 +1,27 @@
 from flask import Blueprint
+from flask_login import login_required
+from app.utils.decorators import role_required
 from app.utils.response_helper import success_response
+from app.services.cache_service import get_cache_stats
+from app.services.forecast_service import get_forecast_cache_stats
 
 health_bp = Blueprint("health", __name__)
 
 
 @health_bp.route("/ping", methods=["GET"])
 def ping():
-    return success_response(message="SmartMart API is running.")
\ No newline at end of file
+    return success_response(message="SmartMart API is running.")
+
+
+@health_bp.route("/cache", methods=["GET"])
+@login_required
+@role_required("CEO")
+def cache_stats():
+    return success_response(data=get_cache_stats(), message="Analytics cache statistics.")
+
+
+@health_bp.route("/forecast-cache", methods=["GET"])
+@login_required
+@role_required("CEO")
+def forecast_cache_stats():
+    return success_response(data=get_forecast_cache_stats(), message="Forecast cache statistics (this worker process).")
\ No newline at end of file
@@ -1,7 +1,10 @@
-from flask import Blueprint, render_template, request, flash, redirect, url_for
+from flask import Blueprint, render_template, request, flash, redirect, url_for, jsonify
 from flask_login import login_required, current_user
 from app.utils.decorators import role_required
-from app.services.ingestion_service import handle_upload
+from app.utils.response_helper import error_response
+from app.services.upload_job_service import (
+    enqueue_upload, get_job_status, get_upload_history
+)
 
 hr_bp = Blueprint("hr", __name__)
 
@@ -20,16 +23,37 @@ def upload():
     if request.method == "POST":
         data_type = request.form.get("data_type")
         file = request.files.get("file")
+        skip_invalid = request.form.get("skip_invalid") == "on"
+        dedupe = request.form.get("dedupe") == "on"
 
-        success, message, row_count = handle_upload(
-            file, data_type, current_user.id
+        success, message, job = enqueue_upload(
+            file, data_type, current_user.id,
+            skip_invalid=skip_invalid, dedupe=dedupe
         )
 
         if success:
-            flash(f"✅ {message}", "success")
-        else:
-            flash(f"❌ {message}", "danger")
+            flash(f"⏳ {message}", "info")
+            return redirect(url_for("hr.upload_history"))
 
+        flash(f"❌ {message}", "danger")
         return redirect(url_for("hr.upload"))
 
-    return render_template("hr/upload.html")
\ No newline at end of file
+    return render_template("hr/upload.html")
+
+
+@hr_bp.route("/upload/history")
+@login_required
+@role_required("HR")
+def upload_history():
+    jobs = get_upload_history()
+    return render_template("hr/upload_history.html", jobs=jobs)
+
+
+@hr_bp.route("/api/upload-jobs/<int:job_id>")
+@login_required
+@role_required("HR")
+def api_upload_job(job_id):
+    job = get_job_status(job_id)
+    if job is None:
+        return error_response("Upload job not found.", 404)
+    return jsonify(job)
@@ -0,0 +1,212 @@
+import click
+import pandas as pd
+from flask import current_app
+from flask.cli import with_appcontext
+from sqlalchemy import select, update
+
+from app.extensions import db
+from app.models.sales import Sale
+
+
+def register_commands(app):
+    app.cli.add_command(backfill_sales_hashes)
+    app.cli.add_command(rebuild_sales_rollup)
+    app.cli.add_command(check_sales_rollup)
+    app.cli.add_command(batch_forecast)
+    app.cli.add_command(rebuild_seasonal_factors)
+    app.cli.add_command(backtest_forecast)
+
+
+@click.command("backfill-sales-hashes")
+@click.option("--batch-size", default=10000, show_default=True)
+@with_appcontext
+def backfill_sales_hashes(batch_size):
+    """Fingerprint sales rows uploaded before deduplication existed."""
+    from app.services.ingestion_service import sales_row_hash, _existing_hashes
+
+    last_id, hashed, duplicates = 0, 0, 0
+    # repeated rows get successive occurrence numbers, as in one upload
+    occurrences = {}
+    while True:
+        rows = db.session.execute(
+            select(
+                Sale.id, Sale.date, Sale.product_name, Sale.category, Sale.region,
+                Sale.store_id, Sale.quantity_sold, Sale.unit_price
+            ).where(Sale.row_hash.is_(None), Sale.id > last_id)
+             .order_by(Sale.id)
+             .limit(batch_size)
+        ).all()
+        if not rows:
+            break
+        last_id = rows[-1].id
+
+        frame = pd.DataFrame(rows, columns=[
+            "id", "date", "product_name", "category", "region",
+            "store_id", "quantity_sold", "unit_price"
+        ])
+        frame["date"] = pd.to_datetime(frame["date"])
+        frame["row_hash"] = sales_row_hash(frame, occurrences)
+
+        # Fingerprints an upload already stored stay with that row
+        fresh = frame[~frame["row_hash"].isin(_existing_hashes(frame["row_hash"]))]
+        duplicates += len(frame) - len(fresh)
+
+        if len(fresh):
+            db.session.execute(
+                update(Sale),
+                [{"id": int(i), "row_hash": int(h)} for i, h in zip(fresh["id"], fresh["row_hash"])]
+            )
+        db.session.commit()
+        hashed += len(fresh)
+        click.echo(f"... {hashed} rows fingerprinted (up to id {last_id})")
+
+    current_app.logger.info(
+        f"Sales hash backfill: {hashed} fingerprinted | {duplicates} duplicates left unhashed"
+    )
+    click.echo(f"Done: {hashed} rows fingerprinted, {duplicates} duplicates left unhashed.")
+
+
+@click.command("rebuild-sales-rollup")
+@click.option("--start", type=click.DateTime(formats=["%Y-%m-%d"]), default=None)
+@click.option("--end", type=click.DateTime(formats=["%Y-%m-%d"]), default=None)
+@click.option("--days", default=31, show_default=True, help="Dates rebuilt per transaction.")
+@with_appcontext
+def rebuild_sales_rollup(start, end, days):
+    """Recompute sales_daily_rollup from the raw sales table."""
+    from app.repositories.rollup_repo import rebuild_rollup, sales_date_range, date_windows
+    from app.repositories.dataset_version_repo import bump_version
+
+    first, last = sales_date_range()
+    if first is None:
+        click.echo("No sales rows to roll up.")
+        return
+    start = start.date() if start else first
+    end = end.date() if end else last
+
+    rows = 0
+    for window_start, window_end in date_windows(start, end, days):
+        rows += rebuild_rollup(window_start, window_end)
+        db.session.commit()
+        click.echo(f"... {window_start} to {window_end} rolled up")
+
+    if rows:
+        # cached analytics and forecasts are keyed on the sales version
+        bump_version("sales")
+        db.session.commit()
+
+    current_app.logger.info(f"Sales rollup rebuilt: {start} to {end} | {rows} rollup rows")
+    click.echo(f"Done: {rows} rollup rows written for {start} to {end}.")
+
+
+@click.command("check-sales-rollup")
+@click.option("--start", type=click.DateTime(formats=["%Y-%m-%d"]), default=None)
+@click.option("--end", type=click.DateTime(formats=["%Y-%m-%d"]), default=None)
+@click.option("--repair", is_flag=True, help="Rebuild the days that do not match.")
+@with_appcontext
+def check_sales_rollup(start, end, repair):
+    """Compare sales_daily_rollup with the raw sales table, day by day."""
+    from app.repositories.rollup_repo import check_rollup, rebuild_rollup
+    from app.repositories.dataset_version_repo import bump_version
+
+    start = start.date() if start else None
+    end = end.date() if end else None
+    mismatches = check_rollup(start, end)
+    if not mismatches:
+        click.echo("Sales rollup is consistent with the sales table.")
+        return
+
+    for m in mismatches:
+        click.echo(f"{m['date']}: expected {m['expected']} got {m['actual']}")
+
+    if repair:
+        for m in mismatches:
+            rebuild_rollup(m["date"], m["date"])
+        bump_version("sales")
+        db.session.commit()
+        current_app.logger.warning(f"Sales rollup repaired for {len(mismatches)} day(s).")
+        click.echo(f"Repaired {len(mismatches)} day(s).")
+        return
+
+    current_app.logger.warning(f"Sales rollup mismatch on {len(mismatches)} day(s).")
+    raise SystemExit(1)
+
+
+@click.command("batch-forecast")
+@click.option("--level", type=click.Choice(["product_name", "category"]), default="product_name", show_default=True)
+@click.option("--periods", default=6, show_default=True)
+@click.option("--by", "partition_by", type=click.Choice(["store_id", "region"]), default=None,
+              help="Forecast each series per store or region in a process pool.")
+@click.option("--period-type", type=click.Choice(["monthly", "weekly"]), default="monthly", show_default=True)
+@click.option("--model", type=click.Choice(["holt_winters_additive", "holt_winters_multiplicative"]), default=None,
+              help="Forecast model; the default growth / trend models when omitted.")
+@with_appcontext
+def batch_forecast(level, periods, partition_by, period_type, model):
+    """Forecast every product (or category) and store the batch."""
+    from app.services.forecast_service import generate_batch_forecast
+
+    result = generate_batch_forecast(level=level, periods=periods, partition_by=partition_by,
+                                     period_type=period_type, model=model)
+    if "error" in result:
+        click.echo(result["error"])
+        raise SystemExit(1)
+
+    ok = sum(1 for s in result["status"] if s == "ok")
+    click.echo(
+        f"Batch {result['batch_id']}: {len(result['series'])} {period_type} {level} series"
+        f"{' per ' + partition_by if partition_by else ''}, "
+        f"{ok} forecast, {len(result['series']) - ok} with insufficient history."
+    )
+
+
+@click.command("rebuild-seasonal-factors")
+@with_appcontext
+def rebuild_seasonal_factors():
+    """Recompute the seasonal statistics and factors behind forecast seasonality from the rollup."""
+    from app.repositories.seasonal_repo import rebuild_seasonal_stats
+    from app.repositories.dataset_version_repo import bump_version
+    from app.services.seasonality_service import refresh_seasonal_factors
+
+    rows = rebuild_seasonal_stats()
+    refresh_seasonal_factors()
+    # stored forecasts are keyed on the sales version
+    bump_version("sales")
+    db.session.commit()
+
+    current_app.logger.info(f"Seasonal statistics rebuilt: {rows} rows")
+    click.echo(f"Done: {rows} seasonal statistic rows written.")
+
+
+@click.command("backtest-forecast")
+@click.option("--level", type=click.Choice(["total", "product_name", "category"]), default="total", show_default=True)
+@click.option("--period-type", type=click.Choice(["monthly", "weekly"]), default="monthly", show_default=True)
+@click.option("--horizon", default=6, show_default=True, help="Periods ahead scored at each cutoff.")
+@click.option("--cutoffs", default=12, show_default=True, help="Forecast origins, walking back from the latest period.")
+@click.option("--model", type=click.Choice(["holt_winters_additive", "holt_winters_multiplicative"]), default=None,
+              help="Forecast model; the default growth / trend models when omitted.")
+@with_appcontext
+def backtest_forecast(level, period_type, horizon, cutoffs, model):
+    """Score the forecast model out of sample with a walk-forward backtest."""
+    from app.ai_engine.backtester import METRICS
+    from app.services.forecast_service import generate_backtest
+
+    result = generate_backtest(level=level, period_type=period_type, horizon=horizon,
+                               cutoffs=cutoffs, model=model)
+    if "error" in result:
+        click.echo(result["error"])
+        raise SystemExit(1)
+
+    click.echo(
+        f"{result['model']} model, {result['series']} {level} series, cutoffs {result['cutoffs'][0]} to {result['cutoffs'][-1]}"
+    )
+    click.echo(f"{'horizon':>8}" + "".join(f"{name:>12}" for name in METRICS) + f"{'count':>10}")
+    rows = result["by_horizon"]
+    for i, h in enumerate(rows["horizon"]):
+        cells = "".join(f"{_metric(rows[name][i]):>12}" for name in METRICS)
+        click.echo(f"{h:>8}{cells}{rows['count'][i]:>10}")
+    overall = result["overall"]
+    cells = "".join(f"{_metric(overall[name]):>12}" for name in METRICS)
+    click.echo(f"{'all':>8}{cells}{overall['count']:>10}")
+
+
+def _metric(value) -> str:
+    return "-" if value is None else f"{value:,.2f}"
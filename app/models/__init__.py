@@ -7,4 +7,13 @@ from app.models.expense import Expense
 from app.models.news_cache import NewsCache
 from app.models.ai_decision_log import AIDecisionLog
 from app.models.forecast import Forecast
-from app.models.simulation import Simulation
\ No newline at end of file
+from app.models.simulation import Simulation
+from app.models.ingest_checkpoint import IngestCheckpoint
+from app.models.upload_job import UploadJob
+from app.models.sales_rollup import SalesDailyRollup
+from app.models.dataset_version import DatasetVersion
+from app.models.series_forecast import SeriesForecast
+from app.models.seasonal_stat import SeasonalStat
+from app.models.seasonal_factor import SeasonalFactor
+from app.models.forecast_state import ForecastState
+from app.models.forecast_job import ForecastJob
\ No newline at end of file
@@ -0,0 +1,15 @@
+from app.extensions import db
+from datetime import datetime
+
+
+class DatasetVersion(db.Model):
+    __tablename__ = "dataset_versions"
+
+    id = db.Column(db.Integer, primary_key=True)
+    dataset = db.Column(db.String(50), unique=True, nullable=False)
+    # sales / inventory / employees / expenses / news
+    version = db.Column(db.BigInteger, nullable=False, default=0)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+    def __repr__(self):
+        return f"<DatasetVersion {self.dataset} v{self.version}>"
\ No newline at end of file
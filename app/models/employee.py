@@ -19,5 +19,9 @@ class Employee(db.Model):
     uploaded_by = db.Column(db.Integer, db.ForeignKey("users.id"), nullable=True)
     uploaded_at = db.Column(db.DateTime, default=datetime.utcnow)
 
+    __table_args__ = (
+        db.Index("ix_employees_active_department", "is_active", "department"),
+    )
+
     def __repr__(self):
         return f"<Employee {self.full_name} - {self.department}>"
\ No newline at end of file
@@ -6,7 +6,7 @@ class Expense(db.Model):
     __tablename__ = "expenses"
 
     id = db.Column(db.Integer, primary_key=True)
-    date = db.Column(db.Date, nullable=False)
+    date = db.Column(db.Date, nullable=False, index=True)
     category = db.Column(db.String(100), nullable=False)  # rent, utilities, salaries, etc.
     description = db.Column(db.String(255), nullable=True)
     amount = db.Column(db.Numeric(12, 2), nullable=False)
@@ -15,5 +15,9 @@ class Expense(db.Model):
     uploaded_by = db.Column(db.Integer, db.ForeignKey("users.id"), nullable=True)
     uploaded_at = db.Column(db.DateTime, default=datetime.utcnow)
 
+    __table_args__ = (
+        db.Index("ix_expenses_category_amount", "category", "amount"),
+    )
+
     def __repr__(self):
         return f"<Expense {self.category} - {self.amount} on {self.date}>"
\ No newline at end of file
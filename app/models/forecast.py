@@ -15,9 +15,20 @@ class Forecast(db.Model):
     # JSON string of forecast values
     accuracy_score = db.Column(db.Numeric(6, 2), nullable=True)
     seasonal_adjustment = db.Column(db.Boolean, default=False)
+    periods = db.Column(db.Integer, nullable=True)
+    # number of future periods forecast
+    data_version = db.Column(db.BigInteger, nullable=True)
+    # sales dataset version the forecast was computed from
+    compute_ms = db.Column(db.Integer, nullable=True)
+    model = db.Column(db.String(50), nullable=True)
+    # NULL for the default model, else e.g. holt_winters_additive
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
 
     user = db.relationship("User", back_populates="forecasts")
 
+    __table_args__ = (
+        db.Index("ix_forecasts_lookup", "forecast_type", "period", "periods", "data_version"),
+    )
+
     def __repr__(self):
         return f"<Forecast {self.forecast_type} - {self.period}>"
\ No newline at end of file
@@ -0,0 +1,47 @@
+from app.extensions import db
+from datetime import datetime
+
+
+class ForecastJob(db.Model):
+    __tablename__ = "forecast_jobs"
+
+    id = db.Column(db.Integer, primary_key=True)
+    level = db.Column(db.String(50), nullable=False)
+    period_type = db.Column(db.String(50), nullable=False)
+    periods = db.Column(db.Integer, nullable=False)
+    partition_by = db.Column(db.String(50), nullable=True)
+    model = db.Column(db.String(50), nullable=True)
+
+    status = db.Column(db.String(20), nullable=False, default="queued")
+    # queued / running / success / failed
+    batch_id = db.Column(db.String(32), nullable=True)
+    # series_forecasts batch the job produced (or reused)
+    message = db.Column(db.Text, nullable=True)
+
+    requested_by = db.Column(db.Integer, db.ForeignKey("users.id"), nullable=True)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    started_at = db.Column(db.DateTime, nullable=True)
+    finished_at = db.Column(db.DateTime, nullable=True)
+
+    __table_args__ = (
+        db.Index("ix_forecast_jobs_status", "status"),
+    )
+
+    def to_dict(self):
+        return {
+            "id": self.id,
+            "level": self.level,
+            "period_type": self.period_type,
+            "periods": self.periods,
+            "partition_by": self.partition_by,
+            "model": self.model,
+            "status": self.status,
+            "batch_id": self.batch_id,
+            "message": self.message,
+            "created_at": self.created_at.isoformat() if self.created_at else None,
+            "started_at": self.started_at.isoformat() if self.started_at else None,
+            "finished_at": self.finished_at.isoformat() if self.finished_at else None
+        }
+
+    def __repr__(self):
+        return f"<ForecastJob {self.id} {self.level} {self.status}>"
@@ -0,0 +1,30 @@
+from app.extensions import db
+from datetime import datetime
+
+
+class ForecastState(db.Model):
+    __tablename__ = "forecast_states"
+
+    id = db.Column(db.Integer, primary_key=True)
+    model = db.Column(db.String(50), nullable=False)
+    # holt_winters_additive / holt_winters_multiplicative
+    level = db.Column(db.String(50), nullable=False)
+    # total / product_name / category
+    period = db.Column(db.String(50), nullable=False)
+    partition_by = db.Column(db.String(50), nullable=False, default="")
+    partition_key = db.Column(db.String(100), nullable=False, default="")
+    series_key = db.Column(db.String(150), nullable=False)
+    through_date = db.Column(db.Date, nullable=False)
+    # first day of the last period folded into the state
+    state = db.Column(db.Text, nullable=False)
+    # JSON: level / trend / season / smoothing parameters / error sums
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+    __table_args__ = (
+        db.UniqueConstraint("model", "level", "period", "partition_by", "partition_key", "series_key",
+                            name="uq_forecast_states_series"),
+        db.Index("ix_forecast_states_through", "period", "through_date"),
+    )
+
+    def __repr__(self):
+        return f"<ForecastState {self.model} {self.level}={self.series_key} - {self.period}>"
\ No newline at end of file
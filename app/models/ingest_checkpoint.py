@@ -0,0 +1,24 @@
+from app.extensions import db
+from datetime import datetime
+
+
+class IngestCheckpoint(db.Model):
+    __tablename__ = "ingest_checkpoints"
+
+    id = db.Column(db.Integer, primary_key=True)
+    file_key = db.Column(db.String(64), nullable=False)
+    # sha256 of data type + size + head/tail bytes of the uploaded file
+    data_type = db.Column(db.String(50), nullable=False)
+    filename = db.Column(db.String(255), nullable=True)
+    rows_committed = db.Column(db.BigInteger, nullable=False, default=0)
+    chunks_committed = db.Column(db.Integer, nullable=False, default=0)
+    uploaded_by = db.Column(db.Integer, db.ForeignKey("users.id"), nullable=True)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+    __table_args__ = (
+        db.UniqueConstraint("file_key", "data_type", name="uq_ingest_checkpoint_file"),
+    )
+
+    def __repr__(self):
+        return f"<IngestCheckpoint {self.filename} rows:{self.rows_committed}>"
@@ -18,4 +18,8 @@ class Inventory(db.Model):
     uploaded_at = db.Column(db.DateTime, default=datetime.utcnow)
 
     def __repr__(self):
-        return f"<Inventory {self.product_name} SKU:{self.sku}>"
\ No newline at end of file
+        return f"<Inventory {self.product_name} SKU:{self.sku}>"
+
+
+# the low-stock query filters on stock headroom (current_stock - reorder_level <= 0)
+db.Index("ix_inventory_stock_headroom", Inventory.current_stock - Inventory.reorder_level)
@@ -8,9 +8,9 @@ class NewsCache(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     headline = db.Column(db.String(500), nullable=False)
     source = db.Column(db.String(150), nullable=True)
-    url = db.Column(db.String(500), nullable=True)
-    published_at = db.Column(db.DateTime, nullable=True)
-    fetched_at = db.Column(db.DateTime, default=datetime.utcnow)
+    url = db.Column(db.String(500), nullable=True, index=True)
+    published_at = db.Column(db.DateTime, nullable=True, index=True)
+    fetched_at = db.Column(db.DateTime, default=datetime.utcnow, index=True)
 
     # AI Classification Fields
     category = db.Column(db.String(100), nullable=True)
@@ -23,5 +23,9 @@ class NewsCache(db.Model):
     # mapped business variable
     is_processed = db.Column(db.Boolean, default=False)
 
+    __table_args__ = (
+        db.Index("ix_news_cache_processed_fetched", "is_processed", "fetched_at"),
+    )
+
     def __repr__(self):
         return f"<NewsCache {self.category} - {self.severity}>"
\ No newline at end of file
@@ -1,14 +1,25 @@
 from app.extensions import db
 from datetime import datetime
+from app.utils.periods import month_bucket_of, week_start_of
+
+
+def _default_month_bucket(context):
+    day = context.get_current_parameters().get("date")
+    return month_bucket_of(day) if day else None
+
+
+def _default_week_start(context):
+    day = context.get_current_parameters().get("date")
+    return week_start_of(day) if day else None
 
 
 class Sale(db.Model):
     __tablename__ = "sales"
 
     id = db.Column(db.Integer, primary_key=True)
-    date = db.Column(db.Date, nullable=False)
-    product_name = db.Column(db.String(150), nullable=False)
-    category = db.Column(db.String(100), nullable=False)
+    date = db.Column(db.Date, nullable=False, index=True)
+    product_name = db.Column(db.String(150), nullable=False, index=True)
+    category = db.Column(db.String(100), nullable=False, index=True)
     quantity_sold = db.Column(db.Integer, nullable=False)
     unit_price = db.Column(db.Numeric(10, 2), nullable=False)
     total_revenue = db.Column(db.Numeric(12, 2), nullable=False)
@@ -18,6 +29,12 @@ class Sale(db.Model):
     store_id = db.Column(db.String(50), nullable=True)
     uploaded_by = db.Column(db.Integer, db.ForeignKey("users.id"), nullable=True)
     uploaded_at = db.Column(db.DateTime, default=datetime.utcnow)
+    row_hash = db.Column(db.BigInteger, nullable=True, unique=True, index=True)
+    # fingerprint of the sale fields and its repeat number, used to skip re-uploads
+    month_bucket = db.Column(db.Integer, nullable=True, index=True, default=_default_month_bucket)
+    # YYYYMM, e.g. 202403 — trend queries group on this instead of extract()
+    week_start = db.Column(db.Date, nullable=True, index=True, default=_default_week_start)
+    # Monday of the sale's week
 
     def __repr__(self):
         return f"<Sale {self.product_name} on {self.date}>"
\ No newline at end of file
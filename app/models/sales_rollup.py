@@ -0,0 +1,39 @@
+from app.extensions import db
+from datetime import datetime
+
+
+class SalesDailyRollup(db.Model):
+    __tablename__ = "sales_daily_rollup"
+
+    id = db.Column(db.Integer, primary_key=True)
+    date = db.Column(db.Date, nullable=False, index=True)
+    product_name = db.Column(db.String(150), nullable=False)
+    category = db.Column(db.String(100), nullable=False)
+    region = db.Column(db.String(100), nullable=False, default="")
+    store_id = db.Column(db.String(50), nullable=False, default="")
+    # missing region/store are stored as "" so the unique key still matches
+    month_bucket = db.Column(db.Integer, nullable=True)
+    week_start = db.Column(db.Date, nullable=True)
+    revenue = db.Column(db.Numeric(16, 2), nullable=False, default=0)
+    profit = db.Column(db.Numeric(16, 2), nullable=False, default=0)
+    units = db.Column(db.BigInteger, nullable=False, default=0)
+    row_count = db.Column(db.Integer, nullable=False, default=0)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+    __table_args__ = (
+        db.UniqueConstraint(
+            "date", "product_name", "category", "region", "store_id",
+            name="uq_sales_daily_rollup_key"
+        ),
+        # covering indexes for the dashboard group-bys
+        db.Index("ix_sales_daily_rollup_product", "product_name", "category", "revenue", "profit", "units"),
+        db.Index("ix_sales_daily_rollup_category_month", "category", "month_bucket", "revenue", "profit", "units", "row_count"),
+        db.Index("ix_sales_daily_rollup_month", "month_bucket", "revenue", "profit"),
+        db.Index("ix_sales_daily_rollup_week", "week_start", "revenue", "profit"),
+        # filtered analytics: region / store slices over a date range
+        db.Index("ix_sales_daily_rollup_region_date", "region", "date"),
+        db.Index("ix_sales_daily_rollup_store_date", "store_id", "date"),
+    )
+
+    def __repr__(self):
+        return f"<SalesDailyRollup {self.product_name} on {self.date}>"
\ No newline at end of file
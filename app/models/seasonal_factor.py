@@ -0,0 +1,23 @@
+from app.extensions import db
+from datetime import datetime
+
+
+class SeasonalFactor(db.Model):
+    __tablename__ = "seasonal_factors"
+
+    id = db.Column(db.Integer, primary_key=True)
+    scope = db.Column(db.String(20), nullable=False)
+    # all / category / region
+    scope_key = db.Column(db.String(150), nullable=False, default="")
+    grain = db.Column(db.String(10), nullable=False)
+    # month / week
+    factors = db.Column(db.Text, nullable=False)
+    # JSON list, index 0 = January / ISO week 1
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+    __table_args__ = (
+        db.UniqueConstraint("scope", "scope_key", "grain", name="uq_seasonal_factors_key"),
+    )
+
+    def __repr__(self):
+        return f"<SeasonalFactor {self.scope}={self.scope_key} {self.grain}>"
@@ -0,0 +1,25 @@
+from app.extensions import db
+from datetime import datetime
+
+
+class SeasonalStat(db.Model):
+    __tablename__ = "seasonal_stats"
+
+    id = db.Column(db.Integer, primary_key=True)
+    scope = db.Column(db.String(20), nullable=False)
+    # all / category / region
+    scope_key = db.Column(db.String(150), nullable=False, default="")
+    grain = db.Column(db.String(10), nullable=False)
+    period = db.Column(db.BigInteger, nullable=False)
+    # month: YYYYMM / week: its Monday in days since the epoch
+    slot = db.Column(db.SmallInteger, nullable=False)
+    # month (slot 1-12) / week (ISO week 1-53)
+    revenue = db.Column(db.Numeric(18, 2), nullable=False, default=0)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+    __table_args__ = (
+        db.UniqueConstraint("scope", "scope_key", "grain", "period", name="uq_seasonal_stats_key"),
+    )
+
+    def __repr__(self):
+        return f"<SeasonalStat {self.scope}={self.scope_key} {self.grain}:{self.period}>"
\ No newline at end of file
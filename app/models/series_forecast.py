@@ -0,0 +1,36 @@
+from app.extensions import db
+from datetime import datetime
+
+
+class SeriesForecast(db.Model):
+    __tablename__ = "series_forecasts"
+
+    id = db.Column(db.Integer, primary_key=True)
+    batch_id = db.Column(db.String(32), nullable=False, index=True)
+    # one batch = one run over every series of a level
+    level = db.Column(db.String(50), nullable=False)
+    # product_name / category
+    partition_by = db.Column(db.String(50), nullable=True)
+    partition_key = db.Column(db.String(100), nullable=True)
+    # store_id / region and its value for partitioned runs
+    series_key = db.Column(db.String(150), nullable=False)
+    period = db.Column(db.String(50), nullable=False)
+    periods = db.Column(db.Integer, nullable=False)
+    data_version = db.Column(db.BigInteger, nullable=True)
+    model = db.Column(db.String(50), nullable=True)
+    # NULL for the default model, else e.g. holt_winters_additive
+    forecast_start = db.Column(db.String(20), nullable=True)
+    forecast_data = db.Column(db.Text, nullable=True)
+    # JSON: revenue / profit / lower_bound / upper_bound lists
+    growth_rate = db.Column(db.Float, nullable=True)
+    accuracy_score = db.Column(db.Numeric(6, 2), nullable=True)
+    risk_score = db.Column(db.Numeric(6, 2), nullable=True)
+    status = db.Column(db.String(30), nullable=False, default="ok")
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+    __table_args__ = (
+        db.Index("ix_series_forecasts_lookup", "level", "period", "periods", "data_version", "partition_by"),
+    )
+
+    def __repr__(self):
+        return f"<SeriesForecast {self.level}={self.series_key} - {self.period}>"
\ No newline at end of file
@@ -0,0 +1,44 @@
+from app.extensions import db
+from datetime import datetime
+
+
+class UploadJob(db.Model):
+    __tablename__ = "upload_jobs"
+
+    id = db.Column(db.Integer, primary_key=True)
+    filename = db.Column(db.String(255), nullable=False)
+    data_type = db.Column(db.String(50), nullable=False)
+    skip_invalid = db.Column(db.Boolean, default=False)
+    dedupe = db.Column(db.Boolean, default=False)
+
+    status = db.Column(db.String(20), nullable=False, default="queued")
+    # queued / running / success / failed
+    rows_parsed = db.Column(db.BigInteger, nullable=False, default=0)
+    rows_validated = db.Column(db.BigInteger, nullable=False, default=0)
+    rows_inserted = db.Column(db.BigInteger, nullable=False, default=0)
+    rows_skipped = db.Column(db.BigInteger, nullable=False, default=0)
+    message = db.Column(db.Text, nullable=True)
+
+    uploaded_by = db.Column(db.Integer, db.ForeignKey("users.id"), nullable=True)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    started_at = db.Column(db.DateTime, nullable=True)
+    finished_at = db.Column(db.DateTime, nullable=True)
+
+    def to_dict(self):
+        return {
+            "id": self.id,
+            "filename": self.filename,
+            "data_type": self.data_type,
+            "status": self.status,
+            "rows_parsed": self.rows_parsed,
+            "rows_validated": self.rows_validated,
+            "rows_inserted": self.rows_inserted,
+            "rows_skipped": self.rows_skipped,
+            "message": self.message,
+            "created_at": self.created_at.isoformat() if self.created_at else None,
+            "started_at": self.started_at.isoformat() if self.started_at else None,
+            "finished_at": self.finished_at.isoformat() if self.finished_at else None
+        }
+
+    def __repr__(self):
+        return f"<UploadJob {self.id} {self.data_type} {self.status}>"
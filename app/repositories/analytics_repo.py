@@ -1,50 +1,82 @@
-from sqlalchemy import func, extract
+from sqlalchemy import func
 from app.extensions import db
-from app.models.sales import Sale
+from app.models.sales_rollup import SalesDailyRollup
 from app.models.inventory import Inventory
 from app.models.employee import Employee
 from app.models.expense import Expense
+from app.utils.periods import format_month, format_week
 
 
-def get_total_revenue():
-    result = db.session.query(func.sum(Sale.total_revenue)).scalar()
+def _filter_sales(query, start=None, end=None, region=None, store_id=None):
+    """
+    Applies the optional date range / region / store predicates to a rollup
+    query before aggregation, so indexes on (date), (region, date) and
+    (store_id, date) bound the scan to the selected slice.
+    """
+    if start is not None:
+        query = query.filter(SalesDailyRollup.date >= start)
+    if end is not None:
+        query = query.filter(SalesDailyRollup.date <= end)
+    if region is not None:
+        query = query.filter(SalesDailyRollup.region == region)
+    if store_id is not None:
+        query = query.filter(SalesDailyRollup.store_id == store_id)
+    return query
+
+
+def _filter_expenses(query, start=None, end=None):
+    if start is not None:
+        query = query.filter(Expense.date >= start)
+    if end is not None:
+        query = query.filter(Expense.date <= end)
+    return query
+
+
+def get_total_revenue(start=None, end=None, region=None, store_id=None):
+    query = db.session.query(func.sum(SalesDailyRollup.revenue))
+    result = _filter_sales(query, start, end, region, store_id).scalar()
     return float(result or 0)
 
 
-def get_total_profit():
-    result = db.session.query(func.sum(Sale.gross_profit)).scalar()
+def get_total_profit(start=None, end=None, region=None, store_id=None):
+    query = db.session.query(func.sum(SalesDailyRollup.profit))
+    result = _filter_sales(query, start, end, region, store_id).scalar()
     return float(result or 0)
 
 
-def get_total_expenses():
-    result = db.session.query(func.sum(Expense.amount)).scalar()
+def get_total_expenses(start=None, end=None):
+    query = db.session.query(func.sum(Expense.amount))
+    result = _filter_expenses(query, start, end).scalar()
     return float(result or 0)
 
 
-def get_total_units_sold():
-    result = db.session.query(func.sum(Sale.quantity_sold)).scalar()
+def get_total_units_sold(start=None, end=None, region=None, store_id=None):
+    query = db.session.query(func.sum(SalesDailyRollup.units))
+    result = _filter_sales(query, start, end, region, store_id).scalar()
     return int(result or 0)
 
 
-def get_top_products(limit=5):
-    results = db.session.query(
-        Sale.product_name,
-        func.sum(Sale.total_revenue).label("revenue"),
-        func.sum(Sale.quantity_sold).label("units")
-    ).group_by(Sale.product_name)\
-     .order_by(func.sum(Sale.total_revenue).desc())\
+def get_top_products(limit=5, start=None, end=None, region=None, store_id=None):
+    query = db.session.query(
+        SalesDailyRollup.product_name,
+        func.sum(SalesDailyRollup.revenue).label("revenue"),
+        func.sum(SalesDailyRollup.units).label("units")
+    )
+    results = _filter_sales(query, start, end, region, store_id).group_by(SalesDailyRollup.product_name)\
+     .order_by(func.sum(SalesDailyRollup.revenue).desc())\
      .limit(limit).all()
     return [{"product": r.product_name, "revenue": float(r.revenue), "units": int(r.units)} for r in results]
 
 
-def get_category_performance():
-    results = db.session.query(
-        Sale.category,
-        func.sum(Sale.total_revenue).label("revenue"),
-        func.sum(Sale.gross_profit).label("profit"),
-        func.sum(Sale.quantity_sold).label("units")
-    ).group_by(Sale.category)\
-     .order_by(func.sum(Sale.total_revenue).desc()).all()
+def get_category_performance(start=None, end=None, region=None, store_id=None):
+    query = db.session.query(
+        SalesDailyRollup.category,
+        func.sum(SalesDailyRollup.revenue).label("revenue"),
+        func.sum(SalesDailyRollup.profit).label("profit"),
+        func.sum(SalesDailyRollup.units).label("units")
+    )
+    results = _filter_sales(query, start, end, region, store_id).group_by(SalesDailyRollup.category)\
+     .order_by(func.sum(SalesDailyRollup.revenue).desc()).all()
     return [
         {
             "category": r.category,
@@ -55,17 +87,36 @@ def get_category_performance():
     ]
 
 
-def get_monthly_trend():
-    results = db.session.query(
-        extract("year", Sale.date).label("year"),
-        extract("month", Sale.date).label("month"),
-        func.sum(Sale.total_revenue).label("revenue"),
-        func.sum(Sale.gross_profit).label("profit")
-    ).group_by("year", "month")\
-     .order_by("year", "month").all()
+def get_monthly_trend(start=None, end=None, region=None, store_id=None):
+    query = db.session.query(
+        SalesDailyRollup.month_bucket,
+        func.sum(SalesDailyRollup.revenue).label("revenue"),
+        func.sum(SalesDailyRollup.profit).label("profit")
+    )
+    results = _filter_sales(query, start, end, region, store_id)\
+     .group_by(SalesDailyRollup.month_bucket)\
+     .order_by(SalesDailyRollup.month_bucket).all()
+    return [
+        {
+            "period": format_month(r.month_bucket),
+            "revenue": float(r.revenue),
+            "profit": float(r.profit)
+        } for r in results
+    ]
+
+
+def get_weekly_trend(start=None, end=None, region=None, store_id=None):
+    query = db.session.query(
+        SalesDailyRollup.week_start,
+        func.sum(SalesDailyRollup.revenue).label("revenue"),
+        func.sum(SalesDailyRollup.profit).label("profit")
+    )
+    results = _filter_sales(query, start, end, region, store_id)\
+     .group_by(SalesDailyRollup.week_start)\
+     .order_by(SalesDailyRollup.week_start).all()
     return [
         {
-            "period": f"{int(r.year)}-{int(r.month):02d}",
+            "period": format_week(r.week_start),
             "revenue": float(r.revenue),
             "profit": float(r.profit)
         } for r in results
@@ -73,8 +124,14 @@ def get_monthly_trend():
 
 
 def get_low_stock_items(threshold=50):
-    results = Inventory.query.filter(
-        Inventory.current_stock <= Inventory.reorder_level
+    results = db.session.query(
+        Inventory.product_name,
+        Inventory.sku,
+        Inventory.current_stock,
+        Inventory.reorder_level
+    ).filter(
+        # same expression as ix_inventory_stock_headroom, so the index is seeked
+        Inventory.current_stock - Inventory.reorder_level <= 0
     ).all()
     return [
         {
@@ -86,11 +143,12 @@ def get_low_stock_items(threshold=50):
     ]
 
 
-def get_expense_by_category():
-    results = db.session.query(
+def get_expense_by_category(start=None, end=None):
+    query = db.session.query(
         Expense.category,
         func.sum(Expense.amount).label("total")
-    ).group_by(Expense.category)\
+    )
+    results = _filter_expenses(query, start, end).group_by(Expense.category)\
      .order_by(func.sum(Expense.amount).desc()).all()
     return [{"category": r.category, "total": float(r.total)} for r in results]
 
@@ -115,13 +173,93 @@ def get_employee_kpi_summary():
     ]
 
 
-def get_profit_margin():
-    revenue = get_total_revenue()
-    profit = get_total_profit()
+def get_profit_margin(start=None, end=None, region=None, store_id=None):
+    revenue = get_total_revenue(start, end, region, store_id)
+    profit = get_total_profit(start, end, region, store_id)
     if revenue == 0:
         return 0.0
     return round((profit / revenue) * 100, 2)
 
 
-def get_sales_count():
-    return db.session.query(func.count(Sale.id)).scalar() or 0
\ No newline at end of file
+def get_sales_count(start=None, end=None, region=None, store_id=None):
+    query = db.session.query(func.sum(SalesDailyRollup.row_count))
+    return int(_filter_sales(query, start, end, region, store_id).scalar() or 0)
+
+
+def get_sales_summary(top_limit=5, start=None, end=None, region=None, store_id=None):
+    """
+    All sales aggregates for the business summary in two grouped scans
+    of sales_daily_rollup.
+    Totals, transaction count, category performance and the monthly trend
+    are rolled up from a single (category, month_bucket) grouping; top
+    products need their own grouping by product name.
+    Optional filters are applied in SQL before either grouping.
+    """
+    query = db.session.query(
+        SalesDailyRollup.category,
+        SalesDailyRollup.month_bucket,
+        func.sum(SalesDailyRollup.revenue).label("revenue"),
+        func.sum(SalesDailyRollup.profit).label("profit"),
+        func.sum(SalesDailyRollup.units).label("units"),
+        func.sum(SalesDailyRollup.row_count).label("transactions")
+    )
+    groups = _filter_sales(query, start, end, region, store_id).group_by(SalesDailyRollup.category, SalesDailyRollup.month_bucket).all()
+
+    totals = {"revenue": 0, "profit": 0, "units": 0, "transactions": 0}
+    categories = {}
+    months = {}
+    for g in groups:
+        revenue, profit, units = g.revenue or 0, g.profit or 0, g.units or 0
+        totals["revenue"] += revenue
+        totals["profit"] += profit
+        totals["units"] += units
+        totals["transactions"] += g.transactions
+
+        cat = categories.setdefault(g.category, {"revenue": 0, "profit": 0, "units": 0})
+        cat["revenue"] += revenue
+        cat["profit"] += profit
+        cat["units"] += units
+
+        mon = months.setdefault(int(g.month_bucket), {"revenue": 0, "profit": 0})
+        mon["revenue"] += revenue
+        mon["profit"] += profit
+
+    revenue = float(totals["revenue"])
+    profit = float(totals["profit"])
+    return {
+        "total_revenue": revenue,
+        "total_profit": profit,
+        "total_units": int(totals["units"]),
+        "sales_count": int(totals["transactions"]),
+        "profit_margin": round((profit / revenue) * 100, 2) if revenue else 0.0,
+        "top_products": get_top_products(top_limit, start, end, region, store_id),
+        "category_performance": [
+            {
+                "category": category,
+                "revenue": float(c["revenue"]),
+                "profit": float(c["profit"]),
+                "units": int(c["units"])
+            } for category, c in sorted(categories.items(), key=lambda kv: kv[1]["revenue"], reverse=True)
+        ],
+        "monthly_trend": [
+            {
+                "period": format_month(bucket),
+                "revenue": float(months[bucket]["revenue"]),
+                "profit": float(months[bucket]["profit"])
+            } for bucket in sorted(months)
+        ]
+    }
+
+
+def get_expense_summary(start=None, end=None):
+    """Total expenses and per-category breakdown from one grouped scan."""
+    query = db.session.query(
+        Expense.category,
+        func.sum(Expense.amount).label("total")
+    )
+    results = _filter_expenses(query, start, end).group_by(Expense.category)\
+     .order_by(func.sum(Expense.amount).desc()).all()
+    return {
+        "total_expenses": float(sum(r.total or 0 for r in results)),
+        "expense_breakdown": [{"category": r.category, "total": float(r.total)} for r in results]
+    }
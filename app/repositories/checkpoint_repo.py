@@ -0,0 +1,36 @@
+from datetime import datetime
+from app.extensions import db
+from app.models.ingest_checkpoint import IngestCheckpoint
+
+
+def get_checkpoint(file_key: str, data_type: str):
+    return IngestCheckpoint.query.filter_by(
+        file_key=file_key, data_type=data_type
+    ).first()
+
+
+def create_checkpoint(file_key: str, data_type: str, filename: str,
+                      uploaded_by: int) -> IngestCheckpoint:
+    checkpoint = IngestCheckpoint(
+        file_key=file_key,
+        data_type=data_type,
+        filename=filename,
+        rows_committed=0,
+        chunks_committed=0,
+        uploaded_by=uploaded_by
+    )
+    db.session.add(checkpoint)
+    db.session.commit()
+    return checkpoint
+
+
+def advance_checkpoint(checkpoint: IngestCheckpoint, rows: int, chunks: int):
+    """Staged only — committed together with the chunk it describes."""
+    checkpoint.rows_committed = rows
+    checkpoint.chunks_committed = chunks
+    checkpoint.updated_at = datetime.utcnow()
+
+
+def delete_checkpoint(checkpoint: IngestCheckpoint):
+    db.session.delete(checkpoint)
+    db.session.commit()
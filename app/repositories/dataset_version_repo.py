@@ -0,0 +1,29 @@
+from datetime import datetime
+from sqlalchemy import select
+from app.extensions import db
+from app.models.dataset_version import DatasetVersion
+from app.repositories.rollup_repo import increment_rows
+
+DATASETS = ["sales", "inventory", "employees", "expenses", "news"]
+
+
+def get_versions(datasets: list) -> dict:
+    """Current version per dataset; datasets never written report 0."""
+    rows = db.session.execute(
+        select(DatasetVersion.dataset, DatasetVersion.version)
+        .where(DatasetVersion.dataset.in_(datasets))
+    ).all()
+    versions = dict.fromkeys(datasets, 0)
+    versions.update({r.dataset: int(r.version) for r in rows})
+    return versions
+
+
+def bump_version(dataset: str):
+    """
+    Staged only — committed together with the data change it announces,
+    so readers never see a new version before the new rows. A native
+    upsert, so concurrent first bumps of a dataset don't both insert.
+    """
+    increment_rows(DatasetVersion.__table__, ["dataset"], ["version"], [
+        {"dataset": dataset, "version": 1, "updated_at": datetime.utcnow()}
+    ])
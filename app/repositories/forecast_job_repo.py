@@ -0,0 +1,48 @@
+from app.extensions import db
+from app.repositories import job_repo
+from app.models.forecast_job import ForecastJob
+
+
+def create_job(level: str, period_type: str, periods: int, partition_by: str = None,
+               model: str = None, requested_by: int = None) -> ForecastJob:
+    job = ForecastJob(
+        level=level,
+        period_type=period_type,
+        periods=periods,
+        partition_by=partition_by,
+        model=model,
+        status="queued",
+        requested_by=requested_by
+    )
+    db.session.add(job)
+    db.session.commit()
+    return job
+
+
+def get_job(job_id: int):
+    return db.session.get(ForecastJob, job_id)
+
+
+def get_active_job(level: str, period_type: str, periods: int,
+                   partition_by: str = None, model: str = None):
+    """A queued or running job for the same parameters, if any."""
+    return ForecastJob.query.filter(
+        ForecastJob.status.in_(job_repo.UNFINISHED),
+        ForecastJob.level == level,
+        ForecastJob.period_type == period_type,
+        ForecastJob.periods == periods,
+        ForecastJob.partition_by.is_(None) if partition_by is None else ForecastJob.partition_by == partition_by,
+        ForecastJob.model.is_(None) if model is None else ForecastJob.model == model
+    ).order_by(ForecastJob.id.desc()).first()
+
+
+def mark_job_started(job_id: int):
+    job_repo.mark_job_started(ForecastJob, job_id)
+
+
+def mark_job_finished(job_id: int, success: bool, message: str, batch_id: str = None):
+    job_repo.mark_job_finished(ForecastJob, job_id, success, message, batch_id=batch_id)
+
+
+def fail_unfinished_jobs(message: str) -> int:
+    return job_repo.fail_unfinished_jobs(ForecastJob, message)
@@ -4,14 +4,20 @@ from app.models.forecast import Forecast
 
 
 def save_forecast(user_id: int, forecast_type: str, period: str,
-                  forecast_data: dict, accuracy: float, seasonal: bool) -> Forecast:
+                  forecast_data: dict, accuracy: float, seasonal: bool,
+                  periods: int = None, data_version: int = None,
+                  compute_ms: int = None, model: str = None) -> Forecast:
     record = Forecast(
         user_id=user_id,
         forecast_type=forecast_type,
         period=period,
         forecast_data=json.dumps(forecast_data),
         accuracy_score=accuracy,
-        seasonal_adjustment=seasonal
+        seasonal_adjustment=seasonal,
+        periods=periods,
+        data_version=data_version,
+        compute_ms=compute_ms,
+        model=model
     )
     db.session.add(record)
     db.session.commit()
@@ -28,4 +34,16 @@ def get_latest_forecast(forecast_type: str = "revenue", period: str = "monthly")
 def get_all_forecasts(limit: int = 10):
     return Forecast.query.order_by(
         Forecast.created_at.desc()
-    ).limit(limit).all()
\ No newline at end of file
+    ).limit(limit).all()
+
+
+def get_cached_forecast(forecast_type: str, period: str, periods: int, data_version: int,
+                        model: str = None):
+    """Latest forecast computed from this exact sales version, horizon and model, if any."""
+    return Forecast.query.filter_by(
+        forecast_type=forecast_type,
+        period=period,
+        periods=periods,
+        data_version=data_version,
+        model=model
+    ).order_by(Forecast.created_at.desc()).first()
\ No newline at end of file
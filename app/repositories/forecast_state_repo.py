@@ -0,0 +1,74 @@
+import json
+from datetime import datetime
+import pandas as pd
+from flask import current_app
+from sqlalchemy import and_, delete, insert, or_
+from app.extensions import db
+from app.models.forecast_state import ForecastState
+
+# Period type -> frequency of its buckets; states record their last bucket's first day
+PERIOD_FREQ = {"monthly": "M", "weekly": "W"}
+
+
+def get_forecast_states(model: str, level: str, period: str, partition_by: str = None) -> dict:
+    """Stored per-series states of one model scope keyed by (partition_key, series_key)."""
+    rows = db.session.query(
+        ForecastState.partition_key,
+        ForecastState.series_key,
+        ForecastState.state
+    ).filter_by(model=model, level=level, period=period, partition_by=partition_by or "").all()
+    return {(r.partition_key, r.series_key): json.loads(r.state) for r in rows}
+
+
+def replace_forecast_states(model: str, level: str, period: str, partition_by: str,
+                            partitions: list, series: list, states: list) -> int:
+    """
+    Replaces the stored states of one model scope with `states` (aligned
+    with partitions / series; None entries are skipped). Staged only.
+    """
+    table = ForecastState.__table__
+    partition_by = partition_by or ""
+    db.session.execute(delete(table).where(
+        table.c.model == model,
+        table.c.level == level,
+        table.c.period == period,
+        table.c.partition_by == partition_by
+    ))
+
+    now = datetime.utcnow()
+    freq = PERIOD_FREQ[period]
+    records = [
+        {
+            "model": model,
+            "level": level,
+            "period": period,
+            "partition_by": partition_by,
+            "partition_key": partition_key,
+            "series_key": series_key,
+            "through_date": pd.Period(ordinal=state["through"], freq=freq).start_time.date(),
+            "state": json.dumps(state),
+            "updated_at": now
+        } for partition_key, series_key, state in zip(partitions, series, states) if state is not None
+    ]
+    chunk_size = current_app.config.get("INGEST_CHUNK_SIZE", 5000)
+    for start in range(0, len(records), chunk_size):
+        db.session.execute(insert(table), records[start:start + chunk_size])
+    return len(records)
+
+
+def invalidate_forecast_states(first_date) -> int:
+    """
+    Drops states that already include the period of `first_date` or a
+    later one: backfilled sales change periods those states summarize, so
+    the series are refitted on their next forecast. Sales for newer
+    periods leave states alone. Staged only.
+    """
+    day = pd.Timestamp(first_date)
+    month_start = day.replace(day=1).date()
+    week_start = (day - pd.Timedelta(days=day.weekday())).date()
+    table = ForecastState.__table__
+    result = db.session.execute(delete(table).where(or_(
+        and_(table.c.period == "monthly", table.c.through_date >= month_start),
+        and_(table.c.period == "weekly", table.c.through_date >= week_start)
+    )))
+    return result.rowcount
@@ -0,0 +1,43 @@
+from datetime import datetime
+from app.extensions import db
+
+# Job statuses that still have work ahead of them
+UNFINISHED = ("queued", "running")
+
+
+def update_job(model, job_id: int, **fields):
+    """
+    Writes fields of a background job row (UploadJob, ForecastJob) on its
+    own connection, so pollers see them while the job's transaction is
+    still open.
+    """
+    table = model.__table__
+    with db.engine.begin() as conn:
+        conn.execute(table.update().where(table.c.id == job_id).values(**fields))
+
+
+def mark_job_started(model, job_id: int):
+    update_job(model, job_id, status="running", started_at=datetime.utcnow())
+
+
+def mark_job_finished(model, job_id: int, success: bool, message: str, **fields):
+    update_job(
+        model,
+        job_id,
+        status="success" if success else "failed",
+        message=message,
+        finished_at=datetime.utcnow(),
+        **fields
+    )
+
+
+def fail_unfinished_jobs(model, message: str) -> int:
+    """Marks every queued or running job failed. Returns the number of jobs."""
+    table = model.__table__
+    with db.engine.begin() as conn:
+        result = conn.execute(
+            table.update()
+            .where(table.c.status.in_(UNFINISHED))
+            .values(status="failed", message=message, finished_at=datetime.utcnow())
+        )
+    return result.rowcount
@@ -1,5 +1,6 @@
 from app.models.news_cache import NewsCache
 from app.extensions import db
+from app.repositories.dataset_version_repo import bump_version
 
 def headline_exists(url):
     return NewsCache.query.filter_by(url=url).first() is not None
@@ -19,6 +20,7 @@ def save_news(news_dict):
         is_processed=False
     )
     db.session.add(news)
+    bump_version("news")
     db.session.commit()
 
 
@@ -0,0 +1,213 @@
+from datetime import datetime, timedelta
+from decimal import Decimal
+import numpy as np
+import pandas as pd
+from flask import current_app
+from sqlalchemy import func, select, insert, delete
+from app.extensions import db
+from app.models.sales import Sale
+from app.models.sales_rollup import SalesDailyRollup
+
+ROLLUP_KEY = ["date", "product_name", "category", "region", "store_id"]
+ROLLUP_MEASURES = ["revenue", "profit", "units", "row_count"]
+ROLLUP_BUCKETS = ["month_bucket", "week_start"]
+
+
+def add_sales_to_rollup(frame: pd.DataFrame) -> int:
+    """
+    Folds freshly inserted sales rows into the daily rollup.
+    Staged only — committed in the same transaction as the sales rows.
+    Returns the number of rollup keys touched.
+    """
+    if frame.empty:
+        return 0
+    records = _aggregate(frame)
+    _increment(records)
+    return len(records)
+
+
+def _aggregate(frame: pd.DataFrame) -> list:
+    """Groups sales rows by rollup key, summing money in integer cents."""
+    keys = frame[["date", "product_name", "category"] + ROLLUP_BUCKETS].copy()
+    keys["region"] = frame["region"].fillna("")
+    keys["store_id"] = frame["store_id"].fillna("")
+    keys["revenue"] = np.round(frame["total_revenue"].astype("float64") * 100).astype("int64")
+    keys["profit"] = np.round(frame["gross_profit"].astype("float64") * 100).astype("int64")
+    keys["units"] = frame["quantity_sold"].astype("int64")
+
+    # buckets depend only on date, so grouping on them never splits a key
+    grouped = keys.groupby(ROLLUP_KEY + ROLLUP_BUCKETS, sort=False).agg(
+        revenue=("revenue", "sum"),
+        profit=("profit", "sum"),
+        units=("units", "sum"),
+        row_count=("units", "size")
+    ).reset_index()
+
+    now = datetime.utcnow()
+    return [
+        {
+            "date": r.date,
+            "product_name": r.product_name,
+            "category": r.category,
+            "region": r.region,
+            "store_id": r.store_id,
+            "month_bucket": int(r.month_bucket),
+            "week_start": r.week_start,
+            "revenue": Decimal(int(r.revenue)).scaleb(-2),
+            "profit": Decimal(int(r.profit)).scaleb(-2),
+            "units": int(r.units),
+            "row_count": int(r.row_count),
+            "updated_at": now
+        } for r in grouped.itertuples(index=False)
+    ]
+
+
+def _increment(records: list):
+    increment_rows(SalesDailyRollup.__table__, ROLLUP_KEY, ROLLUP_MEASURES, records)
+
+
+def increment_rows(table, key: list, measures: list, records: list):
+    """
+    Adds `measures` onto existing rows matching `key` (inserting new keys)
+    with a native upsert, so concurrent ingestion workers never lose each
+    other's increments.
+    """
+    dialect = db.session.get_bind().dialect.name
+    chunk_size = current_app.config.get("INGEST_CHUNK_SIZE", 5000)
+
+    if dialect == "mysql":
+        from sqlalchemy.dialects.mysql import insert as mysql_insert
+        stmt = mysql_insert(table)
+        stmt = stmt.on_duplicate_key_update(
+            updated_at=stmt.inserted.updated_at,
+            **{m: table.c[m] + stmt.inserted[m] for m in measures}
+        )
+    elif dialect in ("sqlite", "postgresql"):
+        if dialect == "sqlite":
+            from sqlalchemy.dialects.sqlite import insert as upsert_insert
+        else:
+            from sqlalchemy.dialects.postgresql import insert as upsert_insert
+        stmt = upsert_insert(table)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=key,
+            set_={
+                "updated_at": stmt.excluded.updated_at,
+                **{m: table.c[m] + stmt.excluded[m] for m in measures}
+            }
+        )
+    else:
+        _increment_portable(table, key, measures, records)
+        return
+
+    for start in range(0, len(records), chunk_size):
+        db.session.execute(stmt, records[start:start + chunk_size])
+
+
+def _increment_portable(table, key: list, measures: list, records: list):
+    """Read-modify-write fallback for dialects without an upsert."""
+    for record in records:
+        match = [table.c[k] == record[k] for k in key]
+        row = db.session.execute(
+            select(*[table.c[m] for m in measures]).where(*match).with_for_update()
+        ).first()
+        if row is None:
+            db.session.execute(insert(table), [record])
+            continue
+        db.session.execute(
+            table.update().where(*match).values(
+                updated_at=record["updated_at"],
+                **{m: getattr(row, m) + record[m] for m in measures}
+            )
+        )
+
+
+def rebuild_rollup(start=None, end=None) -> int:
+    """
+    Recomputes rollup rows for sales dates in [start, end] (both optional)
+    straight from the raw table. Staged only — the caller commits.
+    """
+    table = SalesDailyRollup.__table__
+    region = func.coalesce(Sale.region, "")
+    store = func.coalesce(Sale.store_id, "")
+
+    source = select(
+        Sale.date, Sale.product_name, Sale.category, region, store,
+        func.sum(Sale.total_revenue), func.sum(Sale.gross_profit),
+        func.sum(Sale.quantity_sold), func.count(Sale.id),
+        func.max(Sale.month_bucket), func.max(Sale.week_start)
+    ).group_by(Sale.date, Sale.product_name, Sale.category, region, store)
+    purge = delete(table)
+
+    if start is not None:
+        source = source.where(Sale.date >= start)
+        purge = purge.where(table.c.date >= start)
+    if end is not None:
+        source = source.where(Sale.date <= end)
+        purge = purge.where(table.c.date <= end)
+
+    db.session.execute(purge)
+    result = db.session.execute(
+        insert(table).from_select(ROLLUP_KEY + ROLLUP_MEASURES + ROLLUP_BUCKETS, source)
+    )
+    return result.rowcount
+
+
+def sales_date_range():
+    """(first, last) sale date, or (None, None) when there are no sales."""
+    return db.session.query(func.min(Sale.date), func.max(Sale.date)).one()
+
+
+def check_rollup(start=None, end=None, tolerance=Decimal("0.01")) -> list:
+    """
+    Compares per-day totals of the rollup against the raw sales table.
+    Returns one entry per mismatching day, empty when consistent.
+    """
+    raw = _daily_totals(
+        Sale.date, Sale.total_revenue, Sale.gross_profit,
+        Sale.quantity_sold, func.count(Sale.id), start, end
+    )
+    rolled = _daily_totals(
+        SalesDailyRollup.date, SalesDailyRollup.revenue, SalesDailyRollup.profit,
+        SalesDailyRollup.units, func.sum(SalesDailyRollup.row_count), start, end
+    )
+
+    mismatches = []
+    for day in sorted(set(raw) | set(rolled)):
+        expected = raw.get(day, (0, 0, 0, 0))
+        actual = rolled.get(day, (0, 0, 0, 0))
+        money_ok = all(abs(Decimal(e) - Decimal(a)) <= tolerance
+                       for e, a in zip(expected[:2], actual[:2]))
+        if not money_ok or tuple(expected[2:]) != tuple(actual[2:]):
+            mismatches.append({
+                "date": day,
+                "expected": dict(zip(ROLLUP_MEASURES, expected)),
+                "actual": dict(zip(ROLLUP_MEASURES, actual))
+            })
+    return mismatches
+
+
+def _daily_totals(date_col, revenue_col, profit_col, units_col, count_expr, start, end) -> dict:
+    query = db.session.query(
+        date_col,
+        func.sum(revenue_col),
+        func.sum(profit_col),
+        func.sum(units_col),
+        count_expr
+    ).group_by(date_col)
+    if start is not None:
+        query = query.filter(date_col >= start)
+    if end is not None:
+        query = query.filter(date_col <= end)
+    return {
+        r[0]: (r[1] or 0, r[2] or 0, int(r[3] or 0), int(r[4] or 0))
+        for r in query.all()
+    }
+
+
+def date_windows(start, end, days: int):
+    """Splits [start, end] into consecutive windows of at most `days` days."""
+    while start <= end:
+        stop = min(start + timedelta(days=days - 1), end)
+        yield start, stop
+        start = stop + timedelta(days=1)
+
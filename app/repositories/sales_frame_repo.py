@@ -0,0 +1,131 @@
+import numpy as np
+import pandas as pd
+from pandas.api.types import union_categoricals
+from sqlalchemy import Float, func, select, type_coerce
+from app.extensions import db
+from app.models.sales import Sale
+from app.models.sales_rollup import SalesDailyRollup
+
+# name -> (column, kind). Rollup measures are also exposed under the raw
+# sales names so callers can switch source without renaming columns.
+SALES_COLUMNS = {
+    "date": (Sale.date, "date"),
+    "product_name": (Sale.product_name, "category"),
+    "category": (Sale.category, "category"),
+    "region": (Sale.region, "category"),
+    "store_id": (Sale.store_id, "category"),
+    "quantity_sold": (Sale.quantity_sold, "int"),
+    "unit_price": (Sale.unit_price, "money"),
+    "total_revenue": (Sale.total_revenue, "money"),
+    "cost_price": (Sale.cost_price, "money"),
+    "gross_profit": (Sale.gross_profit, "money"),
+    "month_bucket": (Sale.month_bucket, "bucket"),
+    "week_start": (Sale.week_start, "date"),
+}
+
+ROLLUP_COLUMNS = {
+    "date": (SalesDailyRollup.date, "date"),
+    "product_name": (SalesDailyRollup.product_name, "category"),
+    "category": (SalesDailyRollup.category, "category"),
+    "region": (SalesDailyRollup.region, "category"),
+    "store_id": (SalesDailyRollup.store_id, "category"),
+    "total_revenue": (SalesDailyRollup.revenue, "money"),
+    "gross_profit": (SalesDailyRollup.profit, "money"),
+    "quantity_sold": (SalesDailyRollup.units, "int"),
+    "row_count": (SalesDailyRollup.row_count, "int"),
+    "month_bucket": (SalesDailyRollup.month_bucket, "bucket"),
+    "week_start": (SalesDailyRollup.week_start, "date"),
+}
+
+SOURCES = {
+    "sales": (Sale, SALES_COLUMNS),
+    "rollup": (SalesDailyRollup, ROLLUP_COLUMNS),
+}
+
+MEASURE_KINDS = {"money", "int"}
+
+
+def load_sales_frame(columns: list, start=None, end=None, store_id=None,
+                     region=None, by: list = None, source: str = "sales",
+                     chunk_rows: int = 50000) -> pd.DataFrame:
+    """
+    Streams only `columns` from sales (or sales_daily_rollup with
+    source="rollup") through a server-side cursor and builds a compact
+    frame chunk by chunk: categoricals for text, float64 for money,
+    datetime64 for dates. Date range / store / region filters are applied
+    in SQL. With `by`, measure columns are summed per `by` group in SQL
+    and the frame has one row per group.
+    """
+    model, available = SOURCES[source]
+    by = list(by or [])
+    unknown = [c for c in by + list(columns) if c not in available]
+    if unknown:
+        raise ValueError(f"Unknown {source} column(s): {', '.join(unknown)}")
+
+    names = by + [c for c in columns if c not in by]
+    kinds = [available[name][1] for name in names]
+    selected = []
+    for name, kind in zip(names, kinds):
+        column = available[name][0]
+        if by and name not in by:
+            if kind not in MEASURE_KINDS:
+                raise ValueError(f"Column {name} cannot be summed; add it to by.")
+            column = func.sum(column)
+        if kind == "money":
+            # floats straight from the driver instead of Decimal objects
+            column = type_coerce(column, Float(asdecimal=False))
+        selected.append(column.label(name))
+
+    stmt = select(*selected)
+    stmt = _apply_filters(stmt, model, start, end, store_id, region)
+    if by:
+        stmt = stmt.group_by(*[available[name][0] for name in by])
+
+    result = db.session.execute(stmt.execution_options(yield_per=chunk_rows))
+    parts = {name: [] for name in names}
+    for rows in result.partitions():
+        for name, kind, values in zip(names, kinds, zip(*rows)):
+            parts[name].append(_typed(values, kind))
+
+    frame = pd.DataFrame({
+        name: _combine(parts[name], kind) for name, kind in zip(names, kinds)
+    })
+    if by:
+        # SQLite sums NUMERIC as REAL; keep sums at cent precision like DECIMAL
+        money = [name for name, kind in zip(names, kinds) if kind == "money"]
+        frame[money] = frame[money].round(2)
+    return frame
+
+
+def _apply_filters(stmt, model, start, end, store_id, region):
+    if start is not None:
+        stmt = stmt.where(model.date >= start)
+    if end is not None:
+        stmt = stmt.where(model.date <= end)
+    if store_id is not None:
+        stmt = stmt.where(model.store_id == store_id)
+    if region is not None:
+        stmt = stmt.where(model.region == region)
+    return stmt
+
+
+def _typed(values: tuple, kind: str):
+    if kind == "category":
+        return pd.Categorical(values)
+    if kind == "date":
+        return np.array(values, dtype="datetime64[D]").astype("datetime64[ns]")
+    if kind == "money":
+        return np.array(values, dtype="float64")
+    if kind == "bucket":
+        return pd.array(values, dtype="Int32")
+    return np.array(values, dtype="int64")
+
+
+def _combine(chunks: list, kind: str):
+    if not chunks:
+        return _typed((), kind)
+    if kind == "category":
+        return union_categoricals(chunks) if len(chunks) > 1 else chunks[0]
+    if kind == "bucket":
+        return pd.concat([pd.Series(c) for c in chunks], ignore_index=True).array
+    return np.concatenate(chunks)
@@ -0,0 +1,172 @@
+import json
+from datetime import datetime
+from decimal import Decimal
+import numpy as np
+import pandas as pd
+from flask import current_app
+from sqlalchemy import and_, delete, insert, or_
+from app.extensions import db
+from app.models.seasonal_factor import SeasonalFactor
+from app.models.seasonal_stat import SeasonalStat
+from app.repositories.rollup_repo import increment_rows
+from app.repositories.sales_frame_repo import load_sales_frame
+
+SCOPES = ["all", "category", "region"]
+GRAINS = {"month": 12, "week": 53}
+STAT_KEY = ["scope", "scope_key", "grain", "period"]
+STAT_MEASURES = ["revenue"]
+
+
+def add_sales_to_seasonal_stats(frame: pd.DataFrame) -> int:
+    """
+    Folds freshly ingested sales into the per-period revenue totals behind
+    the seasonal factors (one row per month / week and scope), so the
+    cost follows the upload, not the history. Staged only.
+    Returns the number of stat rows touched.
+    """
+    if frame.empty:
+        return 0
+    daily = _daily(frame["category"], frame["region"], frame["date"], frame["total_revenue"])
+    stats = _period_totals(daily)
+    increment_rows(SeasonalStat.__table__, STAT_KEY, STAT_MEASURES, _records(stats))
+    return len(stats)
+
+
+def rebuild_seasonal_stats() -> int:
+    """
+    Recomputes every seasonal statistic from the rollup and drops the
+    stored factors (see seasonality_service.refresh_seasonal_factors).
+    Staged only.
+    """
+    table = SeasonalStat.__table__
+    db.session.execute(delete(table))
+    db.session.execute(delete(SeasonalFactor.__table__))
+
+    frame = load_sales_frame(["total_revenue"], by=["category", "region", "date"], source="rollup")
+    if frame.empty:
+        return 0
+    stats = _period_totals(_daily(frame["category"], frame["region"], frame["date"], frame["total_revenue"]))
+
+    records = _records(stats)
+    chunk_size = current_app.config.get("INGEST_CHUNK_SIZE", 5000)
+    for start in range(0, len(records), chunk_size):
+        db.session.execute(insert(table), records[start:start + chunk_size])
+    return len(records)
+
+
+def stat_scopes(frame: pd.DataFrame = None) -> list:
+    """
+    (scope, scope_key) pairs whose statistics `frame` touches, or every
+    stored pair without a frame.
+    """
+    if frame is None:
+        return db.session.query(SeasonalStat.scope, SeasonalStat.scope_key).distinct().all()
+    scopes = [("all", "")]
+    for scope in SCOPES[1:]:
+        keys = pd.Series(np.asarray(frame[scope], dtype=object)).dropna().astype(str)
+        scopes += [(scope, key) for key in sorted(keys[keys != ""].unique())]
+    return scopes
+
+
+def get_period_stats(grain: str, scope: str = "all", scope_key: str = "") -> list:
+    """(period, slot, revenue) rows for one scope and grain, oldest first."""
+    return db.session.query(
+        SeasonalStat.period,
+        SeasonalStat.slot,
+        SeasonalStat.revenue
+    ).filter_by(scope=scope, scope_key=scope_key, grain=grain)\
+     .order_by(SeasonalStat.period).all()
+
+
+def get_seasonal_factors(grain: str, scope: str = "all", scope_key: str = ""):
+    """Stored factors for one scope and grain, or None when not yet estimable."""
+    factors = db.session.query(SeasonalFactor.factors)\
+        .filter_by(scope=scope, scope_key=scope_key, grain=grain).scalar()
+    return json.loads(factors) if factors is not None else None
+
+
+def replace_seasonal_factors(factors: dict) -> int:
+    """
+    Replaces the stored factors of every (scope, scope_key, grain) key in
+    `factors`; None values only remove the stored row. Staged only.
+    """
+    if not factors:
+        return 0
+    table = SeasonalFactor.__table__
+    db.session.execute(delete(table).where(or_(*(
+        and_(table.c.scope == scope, table.c.scope_key == scope_key, table.c.grain == grain)
+        for scope, scope_key, grain in factors
+    ))))
+
+    now = datetime.utcnow()
+    records = [
+        {
+            "scope": scope,
+            "scope_key": scope_key,
+            "grain": grain,
+            "factors": json.dumps(values),
+            "updated_at": now
+        } for (scope, scope_key, grain), values in factors.items() if values is not None
+    ]
+    if records:
+        db.session.execute(insert(table), records)
+    return len(records)
+
+
+def _daily(category, region, dates, revenue) -> pd.DataFrame:
+    """Per-(category, region, day) revenue in integer cents."""
+    daily = pd.DataFrame({
+        "category": np.asarray(category, dtype=object),
+        "region": pd.Series(np.asarray(region, dtype=object)).fillna("").to_numpy(),
+        "date": pd.to_datetime(np.asarray(dates)).normalize(),
+        "revenue": np.round(np.asarray(revenue, dtype="float64") * 100).astype("int64")
+    })
+    return daily.groupby(["category", "region", "date"], sort=False).revenue.sum().reset_index()
+
+
+def _period_totals(daily: pd.DataFrame) -> pd.DataFrame:
+    """
+    Revenue per (scope, scope_key, grain, period) with the period's slot.
+    Periods are integers: YYYYMM and the week's Monday as days since the
+    epoch.
+    """
+    dates = daily["date"]
+    monday = dates - pd.to_timedelta(dates.dt.weekday, unit="D")
+    grains = {
+        "month": (dates.dt.year * 100 + dates.dt.month, dates.dt.month),
+        "week": (monday.to_numpy(dtype="datetime64[D]").astype("int64"), monday.dt.isocalendar().week),
+    }
+
+    parts = []
+    for scope in SCOPES:
+        key = "" if scope == "all" else daily[scope]
+        for grain, (period, slot) in grains.items():
+            part = pd.DataFrame({
+                "scope_key": key,
+                "period": np.asarray(period, dtype="int64"),
+                "slot": np.asarray(slot, dtype="int64"),
+                "revenue": daily["revenue"].to_numpy()
+            })
+            if scope != "all":
+                # missing region / category is not a scope of its own
+                part = part[part["scope_key"] != ""]
+            part = part.groupby(["scope_key", "period", "slot"], sort=False).revenue.sum().reset_index()
+            part["scope"] = scope
+            part["grain"] = grain
+            parts.append(part)
+    return pd.concat(parts, ignore_index=True)
+
+
+def _records(stats: pd.DataFrame) -> list:
+    now = datetime.utcnow()
+    return [
+        {
+            "scope": r.scope,
+            "scope_key": r.scope_key,
+            "grain": r.grain,
+            "period": int(r.period),
+            "slot": int(r.slot),
+            "revenue": Decimal(int(r.revenue)).scaleb(-2),
+            "updated_at": now
+        } for r in stats.itertuples(index=False)
+    ]
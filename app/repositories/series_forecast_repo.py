@@ -0,0 +1,110 @@
+import json
+import math
+from datetime import datetime
+from flask import current_app
+from app.extensions import db
+from app.models.series_forecast import SeriesForecast
+
+SERIES_FIELDS = ["revenue", "profit", "lower_bound", "upper_bound"]
+
+
+def _clean(value):
+    """float or None; NaN (series without enough history) becomes None."""
+    if value is None:
+        return None
+    value = float(value)
+    return None if math.isnan(value) else value
+
+
+def save_series_forecasts(batch_id: str, level: str, period: str, periods: int,
+                          data_version: int, columns: dict, model: str = None) -> int:
+    """
+    Persists a columnar batch forecast (one row per series) with Core
+    executemany inserts, INGEST_CHUNK_SIZE rows at a time. Partitioned
+    batches carry "partition_by" and a "partition" list. Caller commits.
+    """
+    chunk_size = current_app.config.get("INGEST_CHUNK_SIZE", 5000)
+    created_at = datetime.utcnow()
+    table = SeriesForecast.__table__
+    count = len(columns["series"])
+    partition_by = columns.get("partition_by")
+    partitions = columns.get("partition")
+
+    for start in range(0, count, chunk_size):
+        records = []
+        for i in range(start, min(start + chunk_size, count)):
+            records.append({
+                "batch_id": batch_id,
+                "level": level,
+                "partition_by": partition_by,
+                "partition_key": partitions[i] if partitions else None,
+                "series_key": columns["series"][i],
+                "period": period,
+                "periods": periods,
+                "data_version": data_version,
+                "model": model,
+                "forecast_start": columns["forecast_start"][i],
+                "forecast_data": json.dumps({
+                    field: [_clean(v) for v in columns[field][i]] for field in SERIES_FIELDS
+                }),
+                "growth_rate": _clean(columns["growth_rate"][i]),
+                "accuracy_score": _clean(columns["accuracy_score"][i]),
+                "risk_score": _clean(columns["risk_score"][i]),
+                "status": columns["status"][i],
+                "created_at": created_at
+            })
+        db.session.execute(table.insert(), records)
+    return count
+
+
+def get_series_forecasts(level: str, period: str, periods: int, data_version: int = None,
+                         partition_by: str = None, model: str = None):
+    """
+    Latest stored batch for this level, horizon, sales version (any
+    version when data_version is None), partitioning and model as a
+    columnar dict (rows in the order they were computed), or None when no
+    such batch exists.
+    """
+    query = db.session.query(SeriesForecast.batch_id, SeriesForecast.data_version).filter_by(
+        level=level,
+        period=period,
+        periods=periods,
+        partition_by=partition_by,
+        model=model
+    )
+    if data_version is not None:
+        query = query.filter_by(data_version=data_version)
+    latest = query.order_by(SeriesForecast.created_at.desc(), SeriesForecast.id.desc()).first()
+    if latest is None:
+        return None
+
+    rows = db.session.query(
+        SeriesForecast.partition_key,
+        SeriesForecast.series_key,
+        SeriesForecast.forecast_start,
+        SeriesForecast.forecast_data,
+        SeriesForecast.growth_rate,
+        SeriesForecast.accuracy_score,
+        SeriesForecast.risk_score,
+        SeriesForecast.status
+    ).filter(SeriesForecast.batch_id == latest.batch_id)\
+     .order_by(SeriesForecast.id).all()
+
+    columns = {name: [] for name in ["series", "forecast_start", *SERIES_FIELDS,
+                                     "growth_rate", "accuracy_score", "risk_score", "status"]}
+    if partition_by is not None:
+        columns["partition_by"] = partition_by
+        columns["partition"] = [r.partition_key for r in rows]
+    for r in rows:
+        data = json.loads(r.forecast_data)
+        columns["series"].append(r.series_key)
+        columns["forecast_start"].append(r.forecast_start)
+        for field in SERIES_FIELDS:
+            columns[field].append(data[field])
+        columns["growth_rate"].append(r.growth_rate)
+        columns["accuracy_score"].append(_clean(r.accuracy_score))
+        columns["risk_score"].append(_clean(r.risk_score))
+        columns["status"].append(r.status)
+    columns["batch_id"] = latest.batch_id
+    columns["data_version"] = latest.data_version
+    return columns
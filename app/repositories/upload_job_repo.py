@@ -0,0 +1,46 @@
+from app.extensions import db
+from app.repositories import job_repo
+from app.models.upload_job import UploadJob
+
+
+def create_job(filename: str, data_type: str, uploaded_by: int,
+               skip_invalid: bool = False,
+               dedupe: bool = False) -> UploadJob:
+    job = UploadJob(
+        filename=filename,
+        data_type=data_type,
+        skip_invalid=skip_invalid,
+        dedupe=dedupe,
+        status="queued",
+        uploaded_by=uploaded_by
+    )
+    db.session.add(job)
+    db.session.commit()
+    return job
+
+
+def get_job(job_id: int):
+    return db.session.get(UploadJob, job_id)
+
+
+def get_recent_jobs(limit: int = 50):
+    return UploadJob.query.order_by(
+        UploadJob.created_at.desc()
+    ).limit(limit).all()
+
+
+def update_job(job_id: int, **fields):
+    """Progress is visible to pollers while the ingest transaction is still open."""
+    job_repo.update_job(UploadJob, job_id, **fields)
+
+
+def mark_job_started(job_id: int):
+    job_repo.mark_job_started(UploadJob, job_id)
+
+
+def mark_job_finished(job_id: int, success: bool, message: str):
+    job_repo.mark_job_finished(UploadJob, job_id, success, message)
+
+
+def fail_unfinished_jobs(message: str) -> int:
+    return job_repo.fail_unfinished_jobs(UploadJob, message)
@@ -1,42 +1,53 @@
 from flask import current_app
+from app.services.cache_service import cached_by_version
 from app.repositories.analytics_repo import (
-    get_total_revenue, get_total_profit,
-    get_total_expenses, get_total_units_sold,
-    get_top_products, get_category_performance,
-    get_monthly_trend, get_low_stock_items,
-    get_expense_by_category, get_employee_kpi_summary,
-    get_profit_margin, get_sales_count
+    get_sales_summary, get_expense_summary,
+    get_low_stock_items, get_employee_kpi_summary
 )
 
 
-def get_business_summary():
+@cached_by_version(["sales", "expenses", "inventory", "employees"])
+def get_business_summary(start=None, end=None, region=None, store_id=None):
     """
     Returns complete internal business analytics summary.
     Used by CEO dashboard and Executive Advisory Engine.
+    Sales aggregates come from two grouped scans, expenses from one.
+    Optional date range / region / store filters narrow the sales figures;
+    expenses follow the date range only. Inventory and employee KPIs are
+    current snapshots and are never filtered.
     """
     try:
-        revenue = get_total_revenue()
-        profit = get_total_profit()
-        expenses = get_total_expenses()
-        net_profit = profit - expenses
-        margin = get_profit_margin()
+        sales = get_sales_summary(
+            top_limit=5, start=start, end=end, region=region, store_id=store_id
+        )
+        expenses = get_expense_summary(start=start, end=end)
+        revenue = sales["total_revenue"]
+        profit = sales["total_profit"]
+        total_expenses = expenses["total_expenses"]
+        net_profit = profit - total_expenses
 
         summary = {
             "financials": {
                 "total_revenue": revenue,
                 "total_gross_profit": profit,
-                "total_expenses": expenses,
+                "total_expenses": total_expenses,
                 "net_profit": net_profit,
-                "profit_margin_percent": margin,
-                "total_units_sold": get_total_units_sold(),
-                "total_transactions": get_sales_count()
+                "profit_margin_percent": sales["profit_margin"],
+                "total_units_sold": sales["total_units"],
+                "total_transactions": sales["sales_count"]
             },
-            "top_products": get_top_products(5),
-            "category_performance": get_category_performance(),
-            "monthly_trend": get_monthly_trend(),
+            "top_products": sales["top_products"],
+            "category_performance": sales["category_performance"],
+            "monthly_trend": sales["monthly_trend"],
             "low_stock_alerts": get_low_stock_items(5),
-            "expense_breakdown": get_expense_by_category(),
-            "employee_kpis": get_employee_kpi_summary()
+            "expense_breakdown": expenses["expense_breakdown"],
+            "employee_kpis": get_employee_kpi_summary(),
+            "filters": {
+                "start": start.isoformat() if start else None,
+                "end": end.isoformat() if end else None,
+                "region": region,
+                "store_id": store_id
+            }
         }
 
         current_app.logger.info("Business analytics summary generated.")
@@ -0,0 +1,205 @@
+import functools
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from flask import current_app
+
+from app.repositories.dataset_version_repo import get_versions
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+class LRUBackend:
+    """In-process LRU; right for a single worker."""
+
+    name = "lru"
+    # entries and counters are this process's only
+    scope = "process"
+
+    def __init__(self, max_entries: int = 128):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._stats = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, versions: str, value: bytes):
+        with self._lock:
+            self._entries[key] = (versions, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def record(self, name: str, hit: bool):
+        with self._lock:
+            stats = self._stats.setdefault(name, {"hits": 0, "misses": 0})
+            stats["hits" if hit else "misses"] += 1
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {name: dict(s) for name, s in self._stats.items()}
+
+    def size(self) -> int:
+        return len(self._entries)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+class SQLiteBackend:
+    """
+    Cache shared by every worker on the host through one SQLite file.
+    Hit/miss counters live in the same file so stats cover all workers.
+    """
+
+    name = "sqlite"
+    scope = "host"
+
+    def __init__(self, path: str, max_entries: int = 128):
+        self.path = path
+        self.max_entries = max_entries
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache_entries ("
+                "key TEXT PRIMARY KEY, versions TEXT NOT NULL, "
+                "value BLOB NOT NULL, used_at REAL NOT NULL)"
+            )
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache_stats ("
+                "name TEXT PRIMARY KEY, hits INTEGER NOT NULL DEFAULT 0, "
+                "misses INTEGER NOT NULL DEFAULT 0)"
+            )
+
+    def _connect(self):
+        # One short-lived connection per call: safe across threads and processes
+        return sqlite3.connect(self.path, timeout=5)
+
+    def get(self, key: str):
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT versions, value FROM cache_entries WHERE key = ?", (key,)
+            ).fetchone()
+            if row is not None:
+                conn.execute("UPDATE cache_entries SET used_at = ? WHERE key = ?", (time.time(), key))
+        return row
+
+    def set(self, key: str, versions: str, value: bytes):
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO cache_entries (key, versions, value, used_at) VALUES (?, ?, ?, ?)",
+                (key, versions, value, time.time())
+            )
+            conn.execute(
+                "DELETE FROM cache_entries WHERE key NOT IN ("
+                "SELECT key FROM cache_entries ORDER BY used_at DESC LIMIT ?)",
+                (self.max_entries,)
+            )
+
+    def record(self, name: str, hit: bool):
+        column = "hits" if hit else "misses"
+        with self._connect() as conn:
+            conn.execute("INSERT OR IGNORE INTO cache_stats (name) VALUES (?)", (name,))
+            conn.execute(f"UPDATE cache_stats SET {column} = {column} + 1 WHERE name = ?", (name,))
+
+    def stats(self) -> dict:
+        with self._connect() as conn:
+            rows = conn.execute("SELECT name, hits, misses FROM cache_stats").fetchall()
+        return {name: {"hits": hits, "misses": misses} for name, hits, misses in rows}
+
+    def size(self) -> int:
+        with self._connect() as conn:
+            return conn.execute("SELECT COUNT(*) FROM cache_entries").fetchone()[0]
+
+    def clear(self):
+        with self._connect() as conn:
+            conn.execute("DELETE FROM cache_entries")
+
+
+def _get_cache(app):
+    """Builds the configured backend once per process; None when disabled."""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            backend = app.config.get("ANALYTICS_CACHE_BACKEND", "lru")
+            max_entries = app.config.get("ANALYTICS_CACHE_MAX_ENTRIES", 128)
+            if backend == "sqlite":
+                _cache = SQLiteBackend(app.config["ANALYTICS_CACHE_PATH"], max_entries)
+            elif backend == "lru":
+                _cache = LRUBackend(max_entries)
+            else:
+                _cache = False
+    return _cache or None
+
+
+def cached_by_version(datasets: list):
+    """
+    Caches a function's result until any of `datasets` changes version.
+    Entries are keyed on function name + arguments and carry the dataset
+    versions they were computed from; a version mismatch is a miss.
+    None and {"error": ...} results are never cached.
+    """
+    def decorator(fn):
+        name = fn.__name__
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            cache = _get_cache(current_app)
+            if cache is None:
+                return fn(*args, **kwargs)
+
+            key = f"{name}:{args!r}:{sorted(kwargs.items())!r}"
+            versions = repr(sorted(get_versions(datasets).items()))
+            entry = cache.get(key)
+            if entry is not None and entry[0] == versions:
+                cache.record(name, hit=True)
+                return pickle.loads(entry[1])
+
+            cache.record(name, hit=False)
+            result = fn(*args, **kwargs)
+            if result is not None and not (isinstance(result, dict) and "error" in result):
+                cache.set(key, versions, pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL))
+            return result
+
+        return wrapper
+    return decorator
+
+
+def get_cache_stats() -> dict:
+    """
+    Per-function hit/miss counts plus overall hit rate for the active
+    backend. "scope" says whether they cover this process ("process", with
+    its "pid") or every worker on the host ("host").
+    """
+    cache = _get_cache(current_app)
+    if cache is None:
+        return {"backend": "disabled"}
+
+    functions = cache.stats()
+    hits = sum(s["hits"] for s in functions.values())
+    misses = sum(s["misses"] for s in functions.values())
+    for s in functions.values():
+        total = s["hits"] + s["misses"]
+        s["hit_rate"] = round(s["hits"] / total, 4) if total else 0.0
+    return {
+        "backend": cache.name,
+        "scope": cache.scope,
+        "pid": os.getpid(),
+        "entries": cache.size(),
+        "hits": hits,
+        "misses": misses,
+        "hit_rate": round(hits / (hits + misses), 4) if hits + misses else 0.0,
+        "functions": functions
+    }
@@ -0,0 +1,89 @@
+from flask import current_app
+
+from app.extensions import db
+from app.repositories.forecast_job_repo import (
+    create_job, get_job, get_active_job,
+    mark_job_started, mark_job_finished,
+    fail_unfinished_jobs
+)
+from app.services.forecast_service import batch_params_error, generate_batch_forecast
+from app.services.job_executor import JobExecutor
+
+_jobs = JobExecutor("forecast", "FORECAST_JOB_WORKERS", 1, "forecast")
+
+
+def init_app(app):
+    """Fails the forecast jobs a previous server process left unfinished."""
+    _jobs.recover_on_first_request(app, fail_interrupted_jobs)
+
+
+def fail_interrupted_jobs() -> int:
+    """Called once when a server process starts serving (see init_app)."""
+    count = fail_unfinished_jobs("Interrupted by a server restart. Please request it again.")
+    if count:
+        current_app.logger.warning(f"Marked {count} interrupted forecast job(s) as failed.")
+    return count
+
+
+def enqueue_batch_forecast(level: str = "product_name", periods: int = 6,
+                           partition_by: str = None, period_type: str = "monthly",
+                           model: str = None, requested_by: int = None):
+    """
+    Queues a batch forecast for the background worker. A request matching
+    a job that is still queued or running returns that job instead, so
+    retries don't start the same computation twice.
+    Returns (success: bool, message: str, job: ForecastJob | None)
+    """
+    error = batch_params_error(level, periods, partition_by, period_type, model)
+    if error:
+        return False, error, None
+
+    job = get_active_job(level, period_type, periods, partition_by, model)
+    if job is not None:
+        return True, f"Batch forecast already queued as job #{job.id}.", job
+
+    job = create_job(level, period_type, periods, partition_by, model, requested_by)
+    app = current_app._get_current_object()
+    _jobs.submit(app, _run_job, job.id)
+
+    current_app.logger.info(
+        f"Batch forecast queued: job {job.id} | {level} {period_type} | user_id:{requested_by}"
+    )
+    return True, f"Batch forecast queued as job #{job.id}.", job
+
+
+def get_job_status(job_id: int):
+    job = get_job(job_id)
+    return job.to_dict() if job else None
+
+
+def _run_job(app, job_id: int):
+    with app.app_context():
+        job = None
+        success, message, batch_id = False, "Forecast job stopped unexpectedly.", None
+        try:
+            job = get_job(job_id)
+            if job is None:
+                return
+            params = {
+                "level": job.level, "periods": job.periods, "partition_by": job.partition_by,
+                "period_type": job.period_type, "model": job.model
+            }
+            db.session.remove()
+
+            mark_job_started(job_id)
+            result = generate_batch_forecast(**params)
+            if "error" in result:
+                message = result["error"]
+            else:
+                success, batch_id = True, result["batch_id"]
+                message = f"Forecast {len(result['series'])} series."
+        except Exception as e:
+            db.session.rollback()
+            app.logger.error(f"Forecast job {job_id} crashed: {str(e)}")
+            message = f"Unexpected error: {str(e)}"
+        finally:
+            db.session.remove()
+            if job is not None:
+                mark_job_finished(job_id, success, message, batch_id)
+                app.logger.info(f"Forecast job {job_id} finished: {message}")
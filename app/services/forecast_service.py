@@ -1,48 +1,366 @@
+import json
+import os
+import threading
+import time
+import uuid
+import numpy as np
 from flask import current_app
 from flask_login import current_user
-from app.models.sales import Sale
-from app.ai_engine.sales_forecaster import run_forecast
-from app.repositories.forecast_repo import save_forecast
+from app.extensions import db
+from app.ai_engine.sales_forecaster import MIN_MONTHLY_REVENUE, run_forecast_from_totals
+from app.ai_engine.batch_forecaster import PERIOD_COLUMNS, run_batch_forecast
+from app.ai_engine.parallel_forecaster import run_partitioned_forecast
+from app.ai_engine.backtester import run_backtest
+from app.ai_engine.holt_winters import HW_MODELS, run_holt_winters_batch
+from app.repositories.forecast_repo import save_forecast, get_cached_forecast
+from app.repositories.series_forecast_repo import save_series_forecasts, get_series_forecasts
+from app.repositories.forecast_state_repo import get_forecast_states, replace_forecast_states
+from app.repositories.sales_frame_repo import load_sales_frame
+from app.repositories.analytics_repo import get_monthly_trend, get_weekly_trend
+from app.repositories.dataset_version_repo import get_versions
+from app.services.cache_service import cached_by_version
+from app.services.seasonality_service import get_seasonal_index
 
+_stats = {"hits": 0, "misses": 0, "compute_ms_spent": 0, "compute_ms_saved": 0}
+_stats_lock = threading.Lock()
 
-def generate_forecast(period_type: str = "monthly", periods: int = 6) -> dict:
+BATCH_LEVELS = ("product_name", "category")
+BATCH_PARTITIONS = ("store_id", "region")
+# Longest batch horizon served: two years of weeks
+MAX_BATCH_PERIODS = 104
+# "total" backtests the company-wide series behind generate_forecast
+BACKTEST_LEVELS = ("total",) + BATCH_LEVELS
+
+# Forecast period type -> seasonal_stats grain
+FACTOR_GRAINS = {"monthly": "month", "weekly": "week"}
+
+
+def generate_forecast(period_type: str = "monthly", periods: int = 6, model: str = None) -> dict:
     """
-    Fetches sales data, runs forecast engine, saves result.
+    Serves the latest stored forecast for (sales data version, period_type,
+    periods) when one exists. Otherwise fetches per-period revenue/profit
+    totals (grouped in SQL on the persisted month/week buckets), runs
+    forecast engine with the data-derived seasonal factors (when enough
+    history exists) and saves the result tagged with that version.
+    With a Holt-Winters model the company total continues from its stored
+    state, which only folds in the periods added since it was saved.
     """
+    if model is not None and model not in HW_MODELS:
+        return {"error": f"Unsupported model. Use one of: {', '.join(HW_MODELS)}."}
+
     try:
-        sales = Sale.query.all()
-        if not sales:
-            return {"error": "No sales data found. Ask HR to upload data first."}
+        data_version = get_versions(["sales"])["sales"]
+        cached = get_cached_forecast("revenue", period_type, periods, data_version, model)
+        if cached is not None:
+            _record(hit=True, compute_ms=cached.compute_ms or 0)
+            return json.loads(cached.forecast_data)
+
+        started = time.perf_counter()
+        if period_type == "monthly":
+            totals = get_monthly_trend()
+        elif period_type == "weekly":
+            totals = get_weekly_trend()
+        else:
+            return {"error": "Unsupported period type."}
 
-        sales_data = [
-            {
-                "date": str(s.date),
-                "total_revenue": float(s.total_revenue),
-                "gross_profit": float(s.gross_profit),
-                "quantity_sold": s.quantity_sold,
-                "category": s.category,
-                "product_name": s.product_name
-            }
-            for s in sales
-        ]
+        if not totals:
+            return {"error": "No sales data found. Ask HR to upload data first."}
 
-        result = run_forecast(sales_data, periods=periods, period_type=period_type)
+        state = None
+        if model is not None:
+            state = get_forecast_states(model, "total", period_type).get(("", "total"))
+        result = run_forecast_from_totals(
+            [t["period"] for t in totals],
+            [t["revenue"] for t in totals],
+            [t["profit"] for t in totals],
+            periods=periods,
+            period_type=period_type,
+            seasonal_index=None if model else get_seasonal_index(FACTOR_GRAINS[period_type]),
+            model=model,
+            state=state
+        )
+        model_state = result.pop("model_state", None)
+        compute_ms = int((time.perf_counter() - started) * 1000)
+        _record(hit=False, compute_ms=compute_ms)
 
         if "error" not in result:
+            if model_state and model_state["changed"]:
+                # committed by save_forecast together with the forecast
+                replace_forecast_states(model, "total", period_type, None, [""], ["total"],
+                                        [model_state["state"]])
             save_forecast(
                 user_id=current_user.id,
                 forecast_type="revenue",
                 period=period_type,
                 forecast_data=result,
                 accuracy=result.get("accuracy_score", 0),
-                seasonal=result.get("seasonal_adjustment", False)
+                seasonal=result.get("seasonal_adjustment", False),
+                periods=periods,
+                data_version=data_version,
+                compute_ms=compute_ms,
+                model=model
             )
             current_app.logger.info(
-                f"Forecast generated: {period_type} | accuracy: {result.get('accuracy_score')}%"
+                f"Forecast generated: {period_type} | accuracy: {result.get('accuracy_score')}% "
+                f"| {compute_ms} ms"
             )
 
         return result
 
     except Exception as e:
+        db.session.rollback()
         current_app.logger.error(f"Forecast service error: {str(e)}")
-        return {"error": str(e)}
\ No newline at end of file
+        return {"error": str(e)}
+
+
+def generate_batch_forecast(level: str = "product_name", periods: int = 6,
+                            partition_by: str = None, period_type: str = "monthly",
+                            model: str = None) -> dict:
+    """
+    Monthly or weekly forecast for every product (or category) in one
+    vectorized pass over per-(series, period) totals grouped in SQL from
+    the rollup.
+    With partition_by ("store_id" / "region") every series is forecast per
+    store or region, spread over a FORECAST_WORKERS process pool.
+    Seasonality comes from the stored seasonal factors: per category at
+    the category level, company-wide otherwise.
+    With a Holt-Winters model every series continues from its stored state
+    (run in this process; the recursion is cheap once states exist) and
+    the advanced states are saved with the batch.
+    Batches are stored per sales data version and reused like single
+    forecasts. Returns columnar output: "series" plus one list per field.
+    """
+    error = batch_params_error(level, periods, partition_by, period_type, model)
+    if error:
+        return {"error": error}
+
+    try:
+        data_version = get_versions(["sales"])["sales"]
+        columns = get_series_forecasts(level, period_type, periods, data_version, partition_by, model)
+        if columns is not None:
+            _record(hit=True, compute_ms=0)
+            return _batch_response(columns, level, period_type, periods, data_version, model)
+
+        started = time.perf_counter()
+        frame = load_sales_frame(
+            ["total_revenue", "gross_profit"],
+            by=[c for c in (partition_by, level, PERIOD_COLUMNS[period_type]) if c],
+            source="rollup"
+        )
+        if model is not None:
+            states = get_forecast_states(model, level, period_type, partition_by)
+            result = run_holt_winters_batch(
+                frame, level, periods=periods, period_type=period_type,
+                kind=HW_MODELS[model], states=states, partition=partition_by
+            )
+        elif partition_by:
+            seasonal = _batch_seasonal(frame, level, period_type)
+            result = run_partitioned_forecast(
+                frame, partition_by, level, periods=periods,
+                workers=current_app.config.get("FORECAST_WORKERS") or None,
+                period_type=period_type, seasonal=seasonal
+            )
+        else:
+            result = run_batch_forecast(frame, level, periods=periods, period_type=period_type,
+                                        seasonal=_batch_seasonal(frame, level, period_type))
+        if "error" in result:
+            return result
+
+        states = result.pop("state", None)
+        if states is not None and result.pop("state_changed").any():
+            replace_forecast_states(model, level, period_type, partition_by,
+                                    result.get("partition") or [""] * len(states), result["series"], states)
+
+        columns = _to_columns(result)
+        columns["batch_id"] = uuid.uuid4().hex
+        save_series_forecasts(columns["batch_id"], level, period_type, periods, data_version, columns, model)
+        db.session.commit()
+
+        compute_ms = int((time.perf_counter() - started) * 1000)
+        _record(hit=False, compute_ms=compute_ms)
+        current_app.logger.info(
+            f"Batch forecast generated: {level} {period_type} | {len(columns['series'])} series | {compute_ms} ms"
+        )
+        return _batch_response(columns, level, period_type, periods, data_version, model)
+
+    except Exception as e:
+        db.session.rollback()
+        current_app.logger.error(f"Batch forecast service error: {str(e)}")
+        return {"error": str(e)}
+
+
+def batch_params_error(level: str, periods: int = 6, partition_by: str = None,
+                       period_type: str = "monthly", model: str = None):
+    """Why a batch forecast request is invalid, or None."""
+    if level not in BATCH_LEVELS:
+        return f"Unsupported level. Use one of: {', '.join(BATCH_LEVELS)}."
+    if not 1 <= periods <= MAX_BATCH_PERIODS:
+        return f"periods must be between 1 and {MAX_BATCH_PERIODS}."
+    if partition_by is not None and partition_by not in BATCH_PARTITIONS:
+        return f"Unsupported partition. Use one of: {', '.join(BATCH_PARTITIONS)}."
+    if period_type not in PERIOD_COLUMNS:
+        return "Unsupported period type."
+    if model is not None and model not in HW_MODELS:
+        return f"Unsupported model. Use one of: {', '.join(HW_MODELS)}."
+    return None
+
+
+def get_stored_batch_forecast(level: str = "product_name", periods: int = 6,
+                              partition_by: str = None, period_type: str = "monthly",
+                              model: str = None) -> dict:
+    """
+    Latest stored batch for these parameters, read only. A batch computed
+    from older sales data is still returned, flagged "stale"; None when no
+    batch was ever stored (queue one with forecast_job_service).
+    """
+    error = batch_params_error(level, periods, partition_by, period_type, model)
+    if error:
+        return {"error": error}
+
+    data_version = get_versions(["sales"])["sales"]
+    columns = get_series_forecasts(level, period_type, periods, None, partition_by, model)
+    if columns is None:
+        return None
+    response = _batch_response(columns, level, period_type, periods, columns["data_version"], model)
+    response["stale"] = columns["data_version"] != data_version
+    return response
+
+
+@cached_by_version(["sales"])
+def generate_backtest(level: str = "total", period_type: str = "monthly",
+                      horizon: int = 6, cutoffs: int = 12, model: str = None) -> dict:
+    """
+    Walk-forward backtest of the forecast model on the stored sales:
+    out-of-sample WAPE, MAPE, sMAPE, RMSE and interval coverage per
+    horizon for the company total, every category or every product, for
+    the default or a Holt-Winters model. The company-wide monthly model
+    drops the same small months as generate_forecast. The default models
+    use their built-in seasonality; the stored seasonal factors are
+    computed from all sales, including the periods being scored.
+    """
+    if level not in BACKTEST_LEVELS:
+        return {"error": f"Unsupported level. Use one of: {', '.join(BACKTEST_LEVELS)}."}
+    if period_type not in PERIOD_COLUMNS:
+        return {"error": "Unsupported period type."}
+    if horizon < 1 or cutoffs < 1:
+        return {"error": "horizon and cutoffs must be positive."}
+    if model is not None and model not in HW_MODELS:
+        return {"error": f"Unsupported model. Use one of: {', '.join(HW_MODELS)}."}
+
+    try:
+        started = time.perf_counter()
+        key = "series" if level == "total" else level
+        frame = load_sales_frame(
+            ["total_revenue", "gross_profit"],
+            by=[c for c in (level, PERIOD_COLUMNS[period_type]) if c != "total"],
+            source="rollup"
+        )
+        if level == "total":
+            frame[key] = "total"
+
+        # the total is served by run_forecast_from_totals, batches keep every month
+        min_revenue = MIN_MONTHLY_REVENUE if level == "total" else 0.0
+        result = run_backtest(frame, key, horizon=horizon, cutoffs=cutoffs, period_type=period_type,
+                              min_revenue=min_revenue, model=model)
+        if "error" in result:
+            return result
+
+        compute_ms = int((time.perf_counter() - started) * 1000)
+        current_app.logger.info(
+            f"Forecast backtest: {level} {period_type} {result['model']} | {result['series']} series x "
+            f"{len(result['cutoffs'])} cutoffs | {compute_ms} ms"
+        )
+        result["level"] = level
+        result["by_horizon"] = _to_columns(result["by_horizon"])
+        result["overall"] = {
+            name: None if isinstance(value, float) and np.isnan(value) else value
+            for name, value in result["overall"].items()
+        }
+        return result
+
+    except Exception as e:
+        current_app.logger.error(f"Forecast backtest error: {str(e)}")
+        return {"error": str(e)}
+
+
+def _batch_seasonal(frame, level: str, period_type: str):
+    """
+    Seasonal factors for a batch: one shared list, or per category with the
+    company-wide factors as the fallback (None key). None leaves the
+    engine's built-in seasonality.
+    """
+    grain = FACTOR_GRAINS[period_type]
+    default = get_seasonal_index(grain)
+    if level != "category" or frame.empty:
+        return default
+
+    factors = {
+        str(category): get_seasonal_index(grain, "category", str(category))
+        for category in frame[level].unique()
+    }
+    if default is None and not any(f is not None for f in factors.values()):
+        return None
+    factors[None] = default
+    return factors
+
+
+def _to_columns(result: dict) -> dict:
+    """NumPy engine output -> JSON-ready lists; NaN becomes None."""
+    columns = {}
+    for name, value in result.items():
+        if isinstance(value, np.ndarray):
+            if value.dtype.kind == "f":
+                value = np.where(np.isnan(value), None, value.astype(object))
+            value = value.tolist()
+        columns[name] = value
+    return columns
+
+
+def _batch_response(columns: dict, level: str, period_type: str, periods: int, data_version: int,
+                    model: str = None) -> dict:
+    response = {
+        "level": level,
+        "model": model or "default",
+        "period_type": period_type,
+        "periods": periods,
+        "data_version": data_version,
+        "batch_id": columns["batch_id"],
+        "series": columns["series"],
+        "forecast_start": columns["forecast_start"],
+        "revenue": columns["revenue"],
+        "profit": columns["profit"],
+        "lower_bound": columns["lower_bound"],
+        "upper_bound": columns["upper_bound"],
+        "growth_rate": columns["growth_rate"],
+        "accuracy_score": columns["accuracy_score"],
+        "risk_score": columns["risk_score"],
+        "status": columns["status"]
+    }
+    if columns.get("partition_by"):
+        response["partition_by"] = columns["partition_by"]
+        response["partition"] = columns["partition"]
+    return response
+
+
+def _record(hit: bool, compute_ms: int):
+    with _stats_lock:
+        if hit:
+            _stats["hits"] += 1
+            _stats["compute_ms_saved"] += compute_ms
+        else:
+            _stats["misses"] += 1
+            _stats["compute_ms_spent"] += compute_ms
+
+
+def get_forecast_cache_stats() -> dict:
+    """
+    Hit rate and compute time saved by reusing stored forecasts. Counted
+    in memory, so they cover this worker process only ("scope", "pid").
+    """
+    with _stats_lock:
+        stats = dict(_stats)
+    stats["scope"] = "process"
+    stats["pid"] = os.getpid()
+    total = stats["hits"] + stats["misses"]
+    stats["hit_rate"] = round(stats["hits"] / total, 4) if total else 0.0
+    return stats
\ No newline at end of file
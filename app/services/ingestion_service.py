@@ -1,7 +1,12 @@
+import hashlib
+import io
 import os
+import time
+import numpy as np
 import pandas as pd
 from datetime import datetime
 from flask import current_app
+from sqlalchemy import select, update
 from werkzeug.utils import secure_filename
 
 from app import db
@@ -9,176 +14,739 @@ from app.models.sales import Sale
 from app.models.inventory import Inventory
 from app.models.employee import Employee
 from app.models.expense import Expense
-from app.utils.csv_validator import validate_file
+from app.repositories.checkpoint_repo import (
+    get_checkpoint, create_checkpoint,
+    advance_checkpoint, delete_checkpoint
+)
+from app.repositories.rollup_repo import add_sales_to_rollup
+from app.repositories.seasonal_repo import add_sales_to_seasonal_stats, stat_scopes
+from app.repositories.forecast_state_repo import invalidate_forecast_states
+from app.repositories.dataset_version_repo import bump_version
+from app.utils.csv_validator import (
+    COLUMN_TYPES, MAX_REPORTED_LINES,
+    coerce_and_validate, normalize_columns
+)
 from app.utils.validators import allowed_file
+from app.utils.periods import month_bucket, week_start
+from app.services.seasonality_service import refresh_seasonal_factors
 
 
-def handle_upload(file, data_type: str, uploaded_by: int):
+def handle_upload(file, data_type: str, uploaded_by: int,
+                  skip_invalid: bool = False, dedupe: bool = False):
     """
     Main entry point for file upload.
+    With skip_invalid=True, rows that fail validation are skipped and
+    reported by line number instead of rejecting the whole file.
+    With dedupe=True, sales rows already in the database are skipped.
     Returns (success: bool, message: str, row_count: int)
     """
+    ok, message, source = stage_upload(file)
+    if not ok:
+        return False, message, 0
+
+    try:
+        return ingest_file(source, file.filename, data_type, uploaded_by, skip_invalid, dedupe)
+    finally:
+        source.close()
+
+
+def stage_upload(file):
+    """
+    Takes ownership of the upload's spooled stream (see SpooledUploadRequest)
+    so it can be parsed in place, with no copy to UPLOAD_FOLDER, and can
+    outlive the request for background jobs. The caller must close it.
+    Returns (success: bool, message: str, source: file object | None)
+    """
     if not file or file.filename == "":
-        return False, "No file selected.", 0
+        return False, "No file selected.", None
 
     if not allowed_file(file.filename):
-        return False, "Invalid file type. Only CSV, XLSX, XLS allowed.", 0
+        return False, "Invalid file type. Only CSV, XLSX, XLS, Parquet, Feather/Arrow allowed.", None
+
+    source = file.stream
+    # Request teardown closes file streams; hand it a placeholder instead
+    file.stream = io.BytesIO()
+    source.seek(0)
+    return True, "File staged.", source
 
-    filename = secure_filename(file.filename)
-    upload_folder = current_app.config.get("UPLOAD_FOLDER", "uploads")
-    os.makedirs(upload_folder, exist_ok=True)
-    filepath = os.path.join(upload_folder, filename)
-    file.save(filepath)
 
+def ingest_file(source, filename: str, data_type: str, uploaded_by: int,
+                skip_invalid: bool = False, dedupe: bool = False, progress=None):
+    """
+    Runs the read -> validate -> insert pipeline on a staged upload.
+    source is a path or a seekable binary file object; filename supplies
+    the format. progress, if given, is called with rows_parsed /
+    rows_validated / rows_inserted / rows_skipped keyword counts.
+    Returns (success: bool, message: str, row_count: int)
+    """
+    if _should_stream(source, filename):
+        return stream_upload(
+            source, filename, data_type, uploaded_by, skip_invalid, dedupe, progress
+        )
+    return _ingest_whole_file(
+        source, filename, data_type, uploaded_by, skip_invalid, dedupe, progress
+    )
+
+
+def _ingest_whole_file(source, filename: str, data_type: str, uploaded_by: int,
+                       skip_invalid: bool = False, dedupe: bool = False, progress=None):
     try:
-        df = read_file(filepath)
+        df = read_file(source, data_type, filename)
     except Exception as e:
         return False, f"Could not read file: {str(e)}", 0
 
-    # Normalize columns
-    df.columns = [col.strip().lower().replace(" ", "_") for col in df.columns]
+    _report(progress, rows_parsed=len(df))
 
-    # Validate
-    is_valid, errors = validate_file(df, data_type)
-    if not is_valid:
+    # Validate and coerce in one pass
+    typed, errors, bad_lines = coerce_and_validate(df, data_type, skip_invalid)
+    del df
+    if errors:
         return False, " | ".join(errors), 0
+    _report(progress, rows_validated=len(typed), rows_skipped=len(bad_lines))
 
     # Save to DB
     try:
-        row_count = save_to_db(df, data_type, uploaded_by)
+        result = save_to_db(typed, data_type, uploaded_by, dedupe=dedupe)
+        result["skipped"] = len(bad_lines)
+        row_count = result["rows"]
+        _report(progress, rows_inserted=row_count)
         current_app.logger.info(
-            f"Upload success: {data_type} | {row_count} rows | user_id:{uploaded_by}"
+            f"Upload success: {data_type} | {row_count} rows | "
+            f"{result['rows_per_sec']} rows/sec | user_id:{uploaded_by}"
         )
-        return True, f"Successfully uploaded {row_count} records.", row_count
+        return True, _success_message(result, bad_lines), row_count
     except Exception as e:
         db.session.rollback()
         current_app.logger.error(f"Upload DB error: {str(e)}")
         return False, f"Database error: {str(e)}", 0
-    finally:
-        # Clean up temp file
-        if os.path.exists(filepath):
-            os.remove(filepath)
 
 
-def read_file(filepath: str) -> pd.DataFrame:
-    ext = filepath.rsplit(".", 1)[-1].lower()
+ARROW_EXTENSIONS = {"parquet", "feather", "arrow"}
+STREAMABLE_EXTENSIONS = {"csv", "xlsx"} | ARROW_EXTENSIONS
+
+
+def read_file(source, data_type: str = None, filename: str = None) -> pd.DataFrame:
+    """
+    Reads the whole file from a path or a seekable binary file object
+    (filename is then needed for the format). When data_type is given, only
+    the columns in its schema are loaded (projection happens in the reader).
+    """
+    ext = _extension(filename or source)
+    wanted = _column_filter(data_type)
+    _rewind(source)
     if ext == "csv":
-        return pd.read_csv(filepath)
+        return pd.read_csv(source, usecols=wanted)
     elif ext in ["xlsx", "xls"]:
-        return pd.read_excel(filepath)
+        return pd.read_excel(source, usecols=wanted)
+    elif ext in ARROW_EXTENSIONS:
+        return _arrow_to_frame(_read_arrow_table(source, ext, wanted))
     else:
         raise ValueError("Unsupported file format.")
 
 
-def save_to_db(df: pd.DataFrame, data_type: str, uploaded_by: int) -> int:
+def _extension(filename: str) -> str:
+    return filename.rsplit(".", 1)[-1].lower()
+
+
+def _rewind(source):
+    if not isinstance(source, str):
+        source.seek(0)
+
+
+def _source_size(source) -> int:
+    if isinstance(source, str):
+        return os.path.getsize(source)
+    source.seek(0, io.SEEK_END)
+    size = source.tell()
+    source.seek(0)
+    return size
+
+
+def _column_filter(data_type: str = None):
+    """Callable for usecols-style projection onto the data type's schema."""
+    if data_type not in COLUMN_TYPES:
+        return None
+    schema = set(COLUMN_TYPES[data_type])
+    return lambda col: normalize_columns([col])[0] in schema
+
+
+# ----------------------------------
+# PARQUET / ARROW IPC (FEATHER)
+# ----------------------------------
+def _require_pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.feather
+        import pyarrow.parquet
+    except ImportError:
+        raise ValueError("Parquet/Arrow uploads require the 'pyarrow' package.")
+    return pyarrow
+
+
+def _projected_names(names: list, wanted) -> list:
+    return [name for name in names if wanted is None or wanted(name)]
+
+
+def _arrow_input(source):
+    """
+    Random-access Arrow input. Paths are memory-mapped; file objects are
+    wrapped so only the byte ranges of projected columns are read.
+    """
+    pa = _require_pyarrow()
+    if isinstance(source, str):
+        return pa.memory_map(source)
+    source.seek(0)
+    return pa.PythonFile(source, mode="r")
+
+
+def _read_arrow_table(source, ext: str, wanted=None):
+    pa = _require_pyarrow()
+    if ext == "parquet":
+        parquet_file = pa.parquet.ParquetFile(_arrow_input(source))
+        columns = _projected_names(parquet_file.schema_arrow.names, wanted)
+        return parquet_file.read(columns=columns)
+
+    # Feather v2 is the Arrow IPC file format
+    names = pa.ipc.open_file(_arrow_input(source)).schema.names
+    columns = _projected_names(names, wanted)
+    return pa.feather.read_table(_arrow_input(source), columns=columns)
+
+
+def _iter_arrow_batches(source, ext: str, chunk_rows: int, wanted=None):
+    pa = _require_pyarrow()
+    if ext == "parquet":
+        parquet_file = pa.parquet.ParquetFile(_arrow_input(source))
+        columns = _projected_names(parquet_file.schema_arrow.names, wanted)
+        yield from parquet_file.iter_batches(batch_size=chunk_rows, columns=columns)
+        return
+
+    reader = pa.ipc.open_file(_arrow_input(source))
+    columns = _projected_names(reader.schema.names, wanted)
+    for i in range(reader.num_record_batches):
+        batch = reader.get_batch(i).select(columns)
+        for offset in range(0, batch.num_rows, chunk_rows):
+            yield batch.slice(offset, chunk_rows)
+
+
+def _arrow_to_frame(table) -> pd.DataFrame:
+    # Keep date32 columns as datetime64 so the validator doesn't re-parse them
+    return table.to_pandas(date_as_object=False)
+
+
+# ----------------------------------
+# READ-ONLY XLSX
+# ----------------------------------
+def _iter_xlsx_batches(source, chunk_rows: int, wanted=None):
+    """
+    Streams the first sheet with openpyxl's read-only reader, so memory
+    tracks chunk_rows instead of the workbook's full object model.
+    """
+    from openpyxl import load_workbook
+
+    _rewind(source)
+    workbook = load_workbook(source, read_only=True, data_only=True)
+    try:
+        rows = workbook.worksheets[0].iter_rows(values_only=True)
+        header = next(rows, None)
+        if header is None:
+            return
+        keep = [
+            i for i, name in enumerate(header)
+            if name is not None and (wanted is None or wanted(str(name)))
+        ]
+        names = [str(header[i]) for i in keep]
+
+        batch = []
+        for row in rows:
+            values = [row[i] if i < len(row) else None for i in keep]
+            batch.append(values)
+            if len(batch) >= chunk_rows:
+                yield _xlsx_frame(batch, names)
+                batch = []
+        if batch:
+            yield _xlsx_frame(batch, names)
+    finally:
+        workbook.close()
+
+
+def _xlsx_frame(batch: list, names: list) -> pd.DataFrame:
+    # Read-only sheets often report trailing blank rows
+    return pd.DataFrame(batch, columns=names).dropna(how="all")
+
+
+# ----------------------------------
+# STREAMING (CHUNKED) UPLOADS
+# ----------------------------------
+def _should_stream(source, filename: str) -> bool:
+    ext = _extension(filename)
+    if ext == "xlsx":
+        # The in-memory workbook is many times the zipped file size
+        threshold = current_app.config.get("STREAM_XLSX_THRESHOLD", 8 * 1024 * 1024)
+    else:
+        threshold = current_app.config.get("STREAM_UPLOAD_THRESHOLD", 64 * 1024 * 1024)
+    return ext in STREAMABLE_EXTENSIONS and _source_size(source) > threshold
+
+
+def iter_file_chunks(source, chunk_rows: int, data_type: str = None, filename: str = None):
+    """Yields DataFrames of at most chunk_rows rows with normalized columns."""
+    ext = _extension(filename or source)
+    wanted = _column_filter(data_type)
+    _rewind(source)
+
+    if ext == "csv":
+        with pd.read_csv(source, chunksize=chunk_rows, usecols=wanted) as reader:
+            for chunk in reader:
+                chunk.columns = normalize_columns(chunk.columns)
+                yield chunk
+    elif ext in ARROW_EXTENSIONS:
+        for batch in _iter_arrow_batches(source, ext, chunk_rows, wanted):
+            chunk = _arrow_to_frame(batch)
+            chunk.columns = normalize_columns(chunk.columns)
+            yield chunk
+    elif ext == "xlsx":
+        for chunk in _iter_xlsx_batches(source, chunk_rows, wanted):
+            chunk.columns = normalize_columns(chunk.columns)
+            yield chunk
+    else:
+        raise ValueError("Streaming mode supports CSV, XLSX, Parquet and Arrow files.")
+
+
+def stream_upload(source, filename: str, data_type: str, uploaded_by: int,
+                  skip_invalid: bool = False, dedupe: bool = False, progress=None):
+    """
+    Reads, validates and inserts the file one bounded chunk at a time so
+    peak memory tracks STREAM_CHUNK_ROWS rather than the file size.
+    Progress is checkpointed in the same transaction as each committed
+    batch; re-uploading the same file after a failure resumes from there.
+    Returns (success: bool, message: str, row_count: int)
+    """
+    chunk_rows = current_app.config.get("STREAM_CHUNK_ROWS", 100000)
+    commit_every = max(1, current_app.config.get("STREAM_COMMIT_EVERY", 1))
+
+    filename = secure_filename(os.path.basename(filename))
+    file_key = _file_fingerprint(source, data_type)
+    checkpoint = get_checkpoint(file_key, data_type)
+    if checkpoint is None:
+        checkpoint = create_checkpoint(file_key, data_type, filename, uploaded_by)
+    resume_from = checkpoint.rows_committed
+    if resume_from:
+        current_app.logger.info(
+            f"Resuming streamed upload: {filename} | from row {resume_from}"
+        )
+
+    totals = {"rows": 0}
+    bad_lines = []
+    rows_seen = 0
+    rows_validated = 0
+    rows_committed = resume_from
+    chunks = checkpoint.chunks_committed
+    pending = 0
+    started = time.perf_counter()
+    # repeat counts per sales row, so fingerprints match a whole-file upload
+    occurrences = {} if dedupe and data_type == "sales" else None
+
+    try:
+        for chunk in iter_file_chunks(source, chunk_rows, data_type, filename):
+            chunk_start = rows_seen
+            rows_seen += len(chunk)
+
+            # Skip what an earlier, interrupted run already committed
+            if chunk_start < resume_from:
+                committed = chunk.iloc[:resume_from - chunk_start]
+                if occurrences is not None:
+                    typed, _, _ = coerce_and_validate(committed, data_type, skip_invalid=True)
+                    if typed is not None:
+                        count_sales_occurrences(typed, occurrences)
+                if rows_seen <= resume_from:
+                    continue
+                chunk = chunk.iloc[resume_from - chunk_start:]
+                chunk_start = resume_from
+
+            typed, errors, chunk_bad = coerce_and_validate(
+                chunk, data_type, skip_invalid,
+                first_line=chunk_start + 2  # header is line 1
+            )
+            bad_lines.extend(chunk_bad)
+            if errors and not (skip_invalid and chunk_bad):
+                db.session.rollback()
+                return False, (
+                    " | ".join(errors)
+                    + f" ({rows_committed} rows were already committed.)"
+                ), rows_committed - resume_from
+
+            if typed is not None:
+                rows_validated += len(typed)
+                _merge_stats(totals, save_to_db(
+                    typed, data_type, uploaded_by, commit=False,
+                    dedupe=dedupe, occurrences=occurrences
+                ))
+            chunks += 1
+            pending += 1
+
+            if pending >= commit_every:
+                advance_checkpoint(checkpoint, rows_seen, chunks)
+                db.session.commit()
+                rows_committed = rows_seen
+                pending = 0
+                current_app.logger.info(
+                    f"Streamed chunk committed: {filename} | {rows_committed} rows"
+                )
+                _report(
+                    progress, rows_parsed=rows_seen, rows_validated=rows_validated,
+                    rows_inserted=totals["rows"], rows_skipped=len(bad_lines)
+                )
+
+        if pending:
+            advance_checkpoint(checkpoint, rows_seen, chunks)
+            db.session.commit()
+            rows_committed = rows_seen
+            _report(
+                progress, rows_parsed=rows_seen, rows_validated=rows_validated,
+                rows_inserted=totals["rows"], rows_skipped=len(bad_lines)
+            )
+
+    except Exception as e:
+        db.session.rollback()
+        current_app.logger.error(f"Streamed upload error: {str(e)}")
+        return False, (
+            f"Upload stopped after {rows_committed} committed rows: {str(e)}. "
+            "Re-upload the same file to resume."
+        ), rows_committed - resume_from
+
+    if rows_seen == 0:
+        delete_checkpoint(checkpoint)
+        return False, "File contains no data rows.", 0
+    if rows_validated == 0 and not resume_from:
+        delete_checkpoint(checkpoint)
+        return False, "File contains no valid data rows.", 0
+
+    delete_checkpoint(checkpoint)
+    row_count = totals["rows"]
+    stats = _ingest_stats(row_count, started)
+    current_app.logger.info(
+        f"Streamed upload success: {data_type} | {row_count} rows | "
+        f"{stats['rows_per_sec']} rows/sec | {chunks} chunks | user_id:{uploaded_by}"
+    )
+    message = _success_message(totals, bad_lines)
+    if resume_from:
+        message += f" (Resumed after {resume_from} previously committed rows.)"
+    return True, message, row_count
+
+
+def _file_fingerprint(source, data_type: str, sample_bytes: int = 1024 * 1024) -> str:
+    """Cheap identity for resume: size plus the first and last MB of content."""
+    size = _source_size(source)
+    digest = hashlib.sha256(f"{data_type}:{size}".encode())
+    fh = open(source, "rb") if isinstance(source, str) else source
+    try:
+        digest.update(fh.read(sample_bytes))
+        if size > sample_bytes:
+            fh.seek(max(sample_bytes, size - sample_bytes))
+            digest.update(fh.read(sample_bytes))
+    finally:
+        if isinstance(source, str):
+            fh.close()
+        else:
+            fh.seek(0)
+    return digest.hexdigest()
+
+
+def _success_message(result: dict, bad_lines: list = None) -> str:
+    message = f"Successfully uploaded {result['rows']} records."
+    if "updated" in result:
+        message += f" ({result['inserted']} new, {result['updated']} updated)"
+    if result.get("duplicates"):
+        message += f" Skipped {result['duplicates']} rows that were already uploaded."
+    if bad_lines:
+        sample = ", ".join(str(line) for line in bad_lines[:MAX_REPORTED_LINES])
+        more = " ..." if len(bad_lines) > MAX_REPORTED_LINES else ""
+        message += f" Skipped {len(bad_lines)} invalid rows (lines {sample}{more})."
+    return message
+
+
+def _report(progress, **counts):
+    if progress is not None:
+        progress(**counts)
+
+
+def _merge_stats(totals: dict, result: dict):
+    for key, value in result.items():
+        if key in ("elapsed_sec", "rows_per_sec"):
+            continue
+        totals[key] = totals.get(key, 0) + value
+
+
+# ----------------------------------
+# WRITERS
+# ----------------------------------
+def save_to_db(df: pd.DataFrame, data_type: str, uploaded_by: int,
+               commit: bool = True, dedupe: bool = False, occurrences: dict = None) -> dict:
+    """
+    Dispatches to the per-type writer.
+    Returns ingest stats: {"rows", "elapsed_sec", "rows_per_sec", ...}
+    With commit=False the caller owns the transaction (streaming mode).
+    occurrences carries sales fingerprint counts across the chunks of one
+    file (see sales_row_hash).
+    Bumps the dataset version when rows were written so cached analytics
+    are recomputed; an upload that was entirely duplicates keeps them.
+    """
     if data_type == "sales":
-        return save_sales(df, uploaded_by)
+        result = save_sales(df, uploaded_by, dedupe, occurrences)
     elif data_type == "inventory":
-        return save_inventory(df, uploaded_by)
+        result = save_inventory(df, uploaded_by)
     elif data_type == "employees":
-        return save_employees(df, uploaded_by)
+        result = save_employees(df, uploaded_by)
     elif data_type == "expenses":
-        return save_expenses(df, uploaded_by)
+        result = save_expenses(df, uploaded_by)
     else:
         raise ValueError(f"Unknown data type: {data_type}")
 
+    if result["rows"]:
+        bump_version(data_type)
+    if commit:
+        db.session.commit()
+    return result
+
+
+def save_sales(df: pd.DataFrame, uploaded_by: int, dedupe: bool = False,
+               occurrences: dict = None) -> dict:
+    """
+    Expects the typed frame produced by coerce_and_validate.
+    With dedupe=True every row is fingerprinted and rows whose fingerprint
+    is already stored are skipped; identical rows within the upload are
+    kept, since they can be real repeat transactions.
+    Without it rows are stored with a NULL fingerprint.
+    Rows are written with a conflict-ignoring insert, so a concurrent
+    upload of the same rows turns them into duplicates instead of failing.
+    Inserted rows are folded into sales_daily_rollup and the seasonal
+    statistics in the same transaction, and the seasonal factors of the
+    scopes they touch are recomputed; stored forecast states covering
+    their periods are dropped.
+    """
+    started = time.perf_counter()
+    frame = df[list(COLUMN_TYPES["sales"])].copy()
+    duplicates = 0
+
+    if dedupe:
+        frame["row_hash"] = sales_row_hash(frame, occurrences)
+        received = len(frame)
+        frame = frame[~frame["row_hash"].isin(_existing_hashes(frame["row_hash"]))]
+        duplicates = received - len(frame)
+    else:
+        frame["row_hash"] = None
 
-def save_sales(df: pd.DataFrame, uploaded_by: int) -> int:
-    rows = []
-    for _, row in df.iterrows():
-        sale = Sale(
-            date=pd.to_datetime(row["date"]).date(),
-            product_name=str(row["product_name"]),
-            category=str(row["category"]),
-            quantity_sold=int(row["quantity_sold"]),
-            unit_price=float(row["unit_price"]),
-            total_revenue=float(row["total_revenue"]),
-            cost_price=float(row["cost_price"]),
-            gross_profit=float(row["gross_profit"]),
-            region=str(row.get("region", "")) or None,
-            store_id=str(row.get("store_id", "")) or None,
-            uploaded_by=uploaded_by,
-            uploaded_at=datetime.utcnow()
+    frame["month_bucket"] = month_bucket(frame["date"])
+    frame["week_start"] = week_start(frame["date"])
+    frame["date"] = frame["date"].dt.date
+    frame["uploaded_by"] = uploaded_by
+    frame["uploaded_at"] = datetime.utcnow()
+
+    if dedupe:
+        stored = _insert_new_hashes(frame)
+        received = len(frame)
+        frame = frame[frame["row_hash"].isin(stored)]
+        duplicates += received - len(frame)
+    else:
+        _bulk_insert(Sale.__table__, frame)
+    inserted = len(frame)
+    add_sales_to_seasonal_stats(frame)
+    add_sales_to_rollup(frame)
+    if inserted:
+        refresh_seasonal_factors(stat_scopes(frame))
+        invalidate_forecast_states(frame["date"].min())
+    return _ingest_stats(inserted, started, inserted=inserted, duplicates=duplicates)
+
+
+def sales_row_hash(frame: pd.DataFrame, occurrences: dict = None) -> np.ndarray:
+    """
+    64-bit fingerprint of (date, product, category, region, store,
+    quantity, unit price, occurrence). Fields are canonicalized first (day
+    number, trimmed text, price in cents) so the same sale hashes
+    identically whether it came from CSV, Excel, Parquet or the database.
+    occurrence numbers identical rows 0, 1, 2, ... in file order: a file
+    that repeats a sale keeps every copy, and uploading it again matches
+    each of them. occurrences carries the per-row counts across the chunks
+    of one file and is updated in place.
+    """
+    content = pd.Series(_sales_content_hash(frame))
+    occurrence = content.groupby(content).cumcount().to_numpy(dtype="int64")
+    if occurrences is not None:
+        occurrence += np.fromiter(
+            (occurrences.get(h, 0) for h in content.tolist()), dtype="int64", count=len(content)
         )
-        rows.append(sale)
-    db.session.bulk_save_objects(rows)
-    db.session.commit()
-    return len(rows)
-
-
-def save_inventory(df: pd.DataFrame, uploaded_by: int) -> int:
-    rows = []
-    for _, row in df.iterrows():
-        # Check if SKU already exists — update if yes
-        existing = Inventory.query.filter_by(sku=str(row["sku"])).first()
-        if existing:
-            existing.current_stock = int(row["current_stock"])
-            existing.unit_cost = float(row["unit_cost"])
-            existing.uploaded_at = datetime.utcnow()
+        for h, n in content.value_counts().items():
+            occurrences[h] = occurrences.get(h, 0) + n
+
+    key = pd.DataFrame({"content": content.to_numpy(), "occurrence": occurrence})
+    return pd.util.hash_pandas_object(key, index=False).to_numpy().view("int64")
+
+
+def count_sales_occurrences(frame: pd.DataFrame, occurrences: dict):
+    """Records rows an earlier run committed, so resumed numbering matches."""
+    for h, n in pd.Series(_sales_content_hash(frame)).value_counts().items():
+        occurrences[h] = occurrences.get(h, 0) + n
+
+
+def _sales_content_hash(frame: pd.DataFrame) -> np.ndarray:
+    key = pd.DataFrame({
+        "date": frame["date"].to_numpy(dtype="datetime64[D]").astype("int64"),
+        "product_name": frame["product_name"].astype(str).str.strip(),
+        "category": frame["category"].astype(str).str.strip(),
+        "region": frame["region"].fillna("").astype(str).str.strip(),
+        "store_id": frame["store_id"].fillna("").astype(str).str.strip(),
+        "quantity_sold": frame["quantity_sold"].astype("int64"),
+        "unit_price": np.round(frame["unit_price"].astype("float64") * 100).astype("int64"),
+    })
+    return pd.util.hash_pandas_object(key, index=False).to_numpy()
+
+
+def _existing_hashes(hashes: pd.Series) -> set:
+    """Anti-join probe: which fingerprints are already stored."""
+    chunk_size = current_app.config.get("INGEST_CHUNK_SIZE", 5000)
+    values = hashes.tolist()
+    existing = set()
+    for start in range(0, len(values), chunk_size):
+        batch = values[start:start + chunk_size]
+        existing.update(
+            db.session.execute(select(Sale.row_hash).where(Sale.row_hash.in_(batch))).scalars()
+        )
+    return existing
+
+
+def _insert_new_hashes(frame: pd.DataFrame) -> set:
+    """
+    Inserts fingerprinted sales rows, skipping any whose row_hash another
+    upload stored after the anti-join probe. Returns the fingerprints this
+    call actually inserted: from RETURNING on SQLite/PostgreSQL; on MySQL
+    by re-probing after a no-op ON DUPLICATE KEY UPDATE (InnoDB's
+    consistent read shows this transaction's rows, not the other upload's).
+    Only key conflicts are skipped; INSERT IGNORE would also turn bad
+    values into warnings and store them altered.
+    """
+    dialect = db.session.get_bind().dialect.name
+    chunk_size = current_app.config.get("INGEST_CHUNK_SIZE", 5000)
+    table = Sale.__table__
+
+    if dialect in ("sqlite", "postgresql"):
+        if dialect == "sqlite":
+            from sqlalchemy.dialects.sqlite import insert as upsert_insert
         else:
-            inv = Inventory(
-                product_name=str(row["product_name"]),
-                category=str(row["category"]),
-                sku=str(row["sku"]),
-                current_stock=int(row["current_stock"]),
-                reorder_level=int(row.get("reorder_level", 50)),
-                unit_cost=float(row["unit_cost"]),
-                supplier_name=str(row.get("supplier_name", "")) or None,
-                uploaded_by=uploaded_by,
-                uploaded_at=datetime.utcnow()
-            )
-            rows.append(inv)
-    if rows:
-        db.session.bulk_save_objects(rows)
-    db.session.commit()
-    return len(df)
-
-
-def save_employees(df: pd.DataFrame, uploaded_by: int) -> int:
-    rows = []
-    for _, row in df.iterrows():
-        existing = Employee.query.filter_by(
-            employee_code=str(row["employee_code"])
-        ).first()
-        if existing:
-            existing.salary = float(row["salary"])
-            existing.department = str(row["department"])
-            existing.designation = str(row["designation"])
-            existing.uploaded_at = datetime.utcnow()
+            from sqlalchemy.dialects.postgresql import insert as upsert_insert
+        stmt = upsert_insert(table).on_conflict_do_nothing(
+            index_elements=["row_hash"]
+        ).returning(table.c.row_hash)
+    elif dialect == "mysql":
+        from sqlalchemy.dialects.mysql import insert as upsert_insert
+        stmt = upsert_insert(table)
+        stmt = stmt.on_duplicate_key_update(row_hash=table.c.row_hash)
+    else:
+        _bulk_insert(table, frame)
+        return set(frame["row_hash"])
+
+    stored = set()
+    for start in range(0, len(frame), chunk_size):
+        chunk = frame.iloc[start:start + chunk_size].astype(object)
+        chunk = chunk.where(chunk.notnull(), None)
+        result = db.session.execute(stmt, chunk.to_dict(orient="records"))
+        if dialect != "mysql":
+            stored.update(result.scalars())
         else:
-            emp = Employee(
-                employee_code=str(row["employee_code"]),
-                full_name=str(row["full_name"]),
-                department=str(row["department"]),
-                designation=str(row["designation"]),
-                salary=float(row["salary"]),
-                sales_target=float(row["sales_target"]) if "sales_target" in row and pd.notnull(row.get("sales_target")) else None,
-                sales_achieved=float(row["sales_achieved"]) if "sales_achieved" in row and pd.notnull(row.get("sales_achieved")) else None,
-                attendance_percent=float(row["attendance_percent"]) if "attendance_percent" in row and pd.notnull(row.get("attendance_percent")) else None,
-                uploaded_by=uploaded_by,
-                uploaded_at=datetime.utcnow()
-            )
-            rows.append(emp)
-    if rows:
-        db.session.bulk_save_objects(rows)
-    db.session.commit()
-    return len(df)
-
-
-def save_expenses(df: pd.DataFrame, uploaded_by: int) -> int:
-    rows = []
-    for _, row in df.iterrows():
-        exp = Expense(
-            date=pd.to_datetime(row["date"]).date(),
-            category=str(row["category"]),
-            description=str(row.get("description", "")) or None,
-            amount=float(row["amount"]),
-            department=str(row.get("department", "")) or None,
-            approved_by=str(row.get("approved_by", "")) or None,
-            uploaded_by=uploaded_by,
-            uploaded_at=datetime.utcnow()
+            # rowcount can't tell skipped rows apart (the driver reports found rows)
+            stored.update(_existing_hashes(chunk["row_hash"]))
+    return stored
+
+
+def save_inventory(df: pd.DataFrame, uploaded_by: int) -> dict:
+    started = time.perf_counter()
+    frame = df[list(COLUMN_TYPES["inventory"])].copy()
+    frame["uploaded_by"] = uploaded_by
+    frame["uploaded_at"] = datetime.utcnow()
+
+    # Existing SKUs only get stock and cost refreshed
+    inserted, updated = _upsert(
+        Inventory, "sku", frame,
+        update_cols=["current_stock", "unit_cost", "uploaded_at"]
+    )
+    return _ingest_stats(inserted + updated, started, inserted=inserted, updated=updated)
+
+
+def save_employees(df: pd.DataFrame, uploaded_by: int) -> dict:
+    started = time.perf_counter()
+    frame = df[list(COLUMN_TYPES["employees"])].copy()
+    frame["uploaded_by"] = uploaded_by
+    frame["uploaded_at"] = datetime.utcnow()
+
+    inserted, updated = _upsert(
+        Employee, "employee_code", frame,
+        update_cols=["salary", "department", "designation", "uploaded_at"]
+    )
+    return _ingest_stats(inserted + updated, started, inserted=inserted, updated=updated)
+
+
+def save_expenses(df: pd.DataFrame, uploaded_by: int) -> dict:
+    started = time.perf_counter()
+    frame = df[list(COLUMN_TYPES["expenses"])].copy()
+    frame["date"] = frame["date"].dt.date
+    frame["uploaded_by"] = uploaded_by
+    frame["uploaded_at"] = datetime.utcnow()
+
+    inserted = _bulk_insert(Expense.__table__, frame)
+    return _ingest_stats(inserted, started, inserted=inserted)
+
+
+# ----------------------------------
+# BULK INSERT HELPERS
+# ----------------------------------
+def _bulk_insert(table, frame: pd.DataFrame) -> int:
+    """
+    Writes a coerced frame with Core executemany inserts,
+    INGEST_CHUNK_SIZE rows at a time.
+    """
+    chunk_size = current_app.config.get("INGEST_CHUNK_SIZE", 5000)
+    for start in range(0, len(frame), chunk_size):
+        chunk = frame.iloc[start:start + chunk_size].astype(object)
+        chunk = chunk.where(chunk.notnull(), None)
+        db.session.execute(table.insert(), chunk.to_dict(orient="records"))
+    return len(frame)
+
+
+def _upsert(model, key: str, frame: pd.DataFrame, update_cols: list):
+    """
+    Set-based upsert on a unique business key: existing keys are fetched in
+    INGEST_CHUNK_SIZE batches, then rows are split into one bulk INSERT and
+    one bulk UPDATE-by-primary-key. The last occurrence of a duplicated key
+    in the file wins. Returns (inserted, updated).
+    """
+    chunk_size = current_app.config.get("INGEST_CHUNK_SIZE", 5000)
+    frame = frame.drop_duplicates(subset=key, keep="last")
+    key_col = getattr(model, key)
+
+    keys = frame[key].tolist()
+    existing = {}
+    for start in range(0, len(keys), chunk_size):
+        batch = keys[start:start + chunk_size]
+        existing.update(
+            db.session.execute(select(key_col, model.id).where(key_col.in_(batch))).all()
         )
-        rows.append(exp)
-    db.session.bulk_save_objects(rows)
-    db.session.commit()
-    return len(rows)
\ No newline at end of file
+
+    is_existing = frame[key].isin(existing.keys())
+    inserted = _bulk_insert(model.__table__, frame[~is_existing])
+
+    updates = frame.loc[is_existing, update_cols].copy()
+    updates["id"] = frame.loc[is_existing, key].map(existing)
+    for start in range(0, len(updates), chunk_size):
+        chunk = updates.iloc[start:start + chunk_size].astype(object)
+        chunk = chunk.where(chunk.notnull(), None)
+        db.session.execute(update(model), chunk.to_dict(orient="records"))
+
+    return inserted, len(updates)
+
+
+def _ingest_stats(rows: int, started: float, **counts) -> dict:
+    elapsed = time.perf_counter() - started
+    return {
+        "rows": rows,
+        **counts,
+        "elapsed_sec": round(elapsed, 3),
+        "rows_per_sec": round(rows / elapsed, 1) if elapsed > 0 else float(rows),
+    }
@@ -0,0 +1,61 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from app.extensions import db
+
+
+class JobExecutor:
+    """
+    In-memory worker pool for one kind of background job (uploads, batch
+    forecasts), created on first use with app.config[workers_key] threads.
+    """
+
+    def __init__(self, kind: str, workers_key: str, default_workers: int, thread_name_prefix: str):
+        self.kind = kind
+        self.workers_key = workers_key
+        self.default_workers = default_workers
+        self.thread_name_prefix = thread_name_prefix
+        self._executor = None
+        self._lock = threading.Lock()
+
+    def _get_executor(self, app) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=app.config.get(self.workers_key, self.default_workers),
+                    thread_name_prefix=self.thread_name_prefix
+                )
+        return self._executor
+
+    def submit(self, app, run, job_id: int, *args):
+        """Runs run(app, job_id, *args) on the pool; errors escaping it are logged."""
+        future = self._get_executor(app).submit(run, app, job_id, *args)
+        future.add_done_callback(lambda f: self._log_crash(app, job_id, f))
+        return future
+
+    def _log_crash(self, app, job_id: int, future):
+        if not future.cancelled() and future.exception() is not None:
+            app.logger.error(f"{self.kind.capitalize()} job {job_id} worker failed: {future.exception()!r}")
+
+    def recover_on_first_request(self, app, recover):
+        """
+        Runs recover() once, before the first request this process serves:
+        the pool lives in memory, so jobs still queued or running belonged
+        to a process that is gone. CLI commands (migrations, backfills)
+        never serve requests, so they leave a live server's jobs alone.
+        """
+        state = {"done": False}
+        lock = threading.Lock()
+
+        @app.before_request
+        def _recover_interrupted_jobs():
+            if state["done"]:
+                return
+            with lock:
+                if not state["done"]:
+                    try:
+                        recover()
+                    except Exception as e:
+                        db.session.rollback()
+                        app.logger.error(f"Interrupted {self.kind} job recovery failed: {str(e)}")
+                    state["done"] = True
@@ -1,33 +1,25 @@
 from flask import current_app
-from app.models.sales import Sale
 from app.ai_engine.profit_driver import analyze_profit_drivers
-from app import db
+from app.repositories.sales_frame_repo import load_sales_frame
+from app.services.cache_service import cached_by_version
 
 
+@cached_by_version(["sales"])
 def get_profit_driver_report() -> dict:
     """
-    Fetches sales data from DB and runs profit driver analysis.
+    Fetches per-product totals from the sales rollup and runs profit
+    driver analysis.
     """
     try:
-        sales = Sale.query.all()
-        if not sales:
+        sales = load_sales_frame(
+            ["total_revenue", "gross_profit", "quantity_sold"],
+            by=["product_name", "category"],
+            source="rollup"
+        )
+        if sales.empty:
             return {"error": "No sales data found. Ask HR to upload sales data first."}
 
-        sales_data = [
-            {
-                "product_name": s.product_name,
-                "category": s.category,
-                "quantity_sold": s.quantity_sold,
-                "unit_price": float(s.unit_price),
-                "total_revenue": float(s.total_revenue),
-                "cost_price": float(s.cost_price),
-                "gross_profit": float(s.gross_profit),
-                "date": str(s.date)
-            }
-            for s in sales
-        ]
-
-        report = analyze_profit_drivers(sales_data)
+        report = analyze_profit_drivers(sales)
         return report
 
     except Exception as e:
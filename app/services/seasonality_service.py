@@ -0,0 +1,112 @@
+import numpy as np
+import pandas as pd
+from app.repositories.seasonal_repo import (
+    GRAINS, get_period_stats, get_seasonal_factors,
+    replace_seasonal_factors, stat_scopes
+)
+
+# Periods per seasonal cycle, the width of the centered moving average
+CYCLES = {"month": 12, "week": 52}
+
+# Detrended ratios each slot needs before its factor is trusted. A ratio
+# needs half a cycle of history on both sides, so two full years of months
+# or weeks give one per slot.
+MIN_PERIODS = {"month": 1, "week": 1}
+
+
+def get_seasonal_index(grain: str, scope: str = "all", scope_key: str = "") -> list:
+    """
+    Seasonal factors for one scope ("all", "category" or "region"), as
+    stored by the last ingest that touched it. Index 0 is January / ISO
+    week 1; 1.0 is a typical slot. None until every slot has MIN_PERIODS
+    ratios.
+    """
+    return get_seasonal_factors(grain, scope, scope_key)
+
+
+def refresh_seasonal_factors(scopes: list = None) -> int:
+    """
+    Recomputes and stores the factors of `scopes` ((scope, scope_key)
+    pairs; every stored scope by default) from their per-period revenue.
+    Ingestion calls it for the scopes an upload touched, in the same
+    transaction. Staged only; returns the number of factor rows stored.
+    """
+    if scopes is None:
+        scopes = stat_scopes()
+    factors = {
+        (scope, scope_key, grain): _seasonal_factors(grain, get_period_stats(grain, scope, scope_key))
+        for scope, scope_key in scopes for grain in GRAINS
+    }
+    return replace_seasonal_factors(factors)
+
+
+def _seasonal_factors(grain: str, rows: list) -> list:
+    """
+    Every period's ratio to the centered moving average over one cycle (so
+    growth doesn't leak into the factors), averaged per slot and
+    normalised to a mean of 1. None until every slot has MIN_PERIODS ratios.
+    """
+    if not rows:
+        return None
+    revenue, slots = _continuous(grain, rows)
+    ratio = revenue / _centered_average(revenue, CYCLES[grain])
+
+    valid = np.isfinite(ratio)
+    size = GRAINS[grain]
+    counts = np.bincount(slots[valid] - 1, minlength=size)
+    totals = np.bincount(slots[valid] - 1, weights=ratio[valid], minlength=size)
+    average = np.full(size, np.nan)
+    trusted = counts >= MIN_PERIODS[grain]
+    average[trusted] = totals[trusted] / counts[trusted]
+
+    if grain == "week" and np.isnan(average[52]):
+        # ISO week 53 only exists in some years; borrow from its neighbours
+        average[52] = (average[51] + average[0]) / 2
+    if np.isnan(average).any() or average.mean() <= 0:
+        return None
+    return [round(float(v), 4) for v in average / average.mean()]
+
+
+def get_seasonal_profile(scope: str = "all", scope_key: str = "") -> dict:
+    """Month and ISO week factors for one scope (None where not yet estimable)."""
+    return {grain: get_seasonal_index(grain, scope, scope_key) for grain in GRAINS}
+
+
+def _continuous(grain: str, rows: list):
+    """
+    Revenue on an unbroken run of periods from the first to the last stored
+    one (periods without sales are 0) and each period's slot.
+    """
+    period = np.array([r.period for r in rows], dtype="int64")
+    if grain == "month":
+        step = period // 100 * 12 + period % 100 - 1
+    else:
+        step = period // 7
+    revenue = np.zeros(step[-1] - step[0] + 1)
+    revenue[step - step[0]] = [float(r.revenue) for r in rows]
+
+    index = np.arange(step[0], step[-1] + 1)
+    if grain == "month":
+        slots = index % 12 + 1
+    else:
+        # weeks are stored by their Monday (epoch day 4 is a Monday)
+        slots = pd.to_datetime(index * 7 + 4, unit="D").isocalendar().week.to_numpy()
+    return revenue, np.asarray(slots, dtype="int64")
+
+
+def _centered_average(values: np.ndarray, cycle: int) -> np.ndarray:
+    """
+    Centered moving average over one cycle (2 x cycle for even cycles, so
+    the window stays centred); NaN where the window runs off either end
+    and where it is zero.
+    """
+    if cycle % 2:
+        weights = np.full(cycle, 1 / cycle)
+    else:
+        weights = np.r_[0.5, np.ones(cycle - 1), 0.5] / cycle
+    average = np.full(len(values), np.nan)
+    half = len(weights) // 2
+    if len(values) >= len(weights):
+        average[half:len(values) - half] = np.convolve(values, weights, mode="valid")
+    average[average <= 0] = np.nan
+    return average
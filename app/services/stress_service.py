@@ -1,7 +1,9 @@
 from app.repositories.news_repo import get_recent_news
 from app.ai_engine.impact_mapper import compute_market_stress
+from app.services.cache_service import cached_by_version
 
 
+@cached_by_version(["news"])
 def generate_market_stress():
     # Get last 50 news events
     news_items = get_recent_news(limit=50)
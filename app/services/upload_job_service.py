@@ -0,0 +1,150 @@
+import queue
+import threading
+from flask import current_app
+
+from app.extensions import db, socketio
+from app.repositories.upload_job_repo import (
+    create_job, get_job, get_recent_jobs,
+    update_job, mark_job_started, mark_job_finished,
+    fail_unfinished_jobs
+)
+from app.services.ingestion_service import stage_upload, ingest_file
+from app.services.job_executor import JobExecutor
+
+_jobs = JobExecutor("upload", "INGEST_WORKERS", 2, "ingest")
+
+# Progress events from worker threads, emitted by a Socket.IO background task
+_events = queue.Queue()
+_relay_started = False
+_relay_lock = threading.Lock()
+RELAY_INTERVAL_SEC = 0.25
+
+
+def _start_relay(app):
+    """
+    Worker threads are plain OS threads; under eventlet (never monkey
+    patched here) a socketio.emit from them never reaches clients, so
+    their events are queued and emitted from a task on the server's loop.
+    """
+    global _relay_started
+    with _relay_lock:
+        if not _relay_started:
+            socketio.start_background_task(_relay_events, app)
+            _relay_started = True
+
+
+def enqueue_upload(file, data_type: str, uploaded_by: int,
+                   skip_invalid: bool = False, dedupe: bool = False):
+    """
+    Stages the upload and queues it for the background worker pool.
+    Returns (success: bool, message: str, job: UploadJob | None)
+    """
+    ok, message, source = stage_upload(file)
+    if not ok:
+        return False, message, None
+
+    job = create_job(
+        filename=file.filename,
+        data_type=data_type,
+        uploaded_by=uploaded_by,
+        skip_invalid=skip_invalid,
+        dedupe=dedupe
+    )
+    # The worker takes ownership of the spooled upload buffer
+    app = current_app._get_current_object()
+    _start_relay(app)
+    _jobs.submit(app, _run_job, job.id, source)
+
+    current_app.logger.info(
+        f"Upload queued: job {job.id} | {data_type} | user_id:{uploaded_by}"
+    )
+    return True, f"Upload queued as job #{job.id}.", job
+
+
+def get_job_status(job_id: int):
+    job = get_job(job_id)
+    return job.to_dict() if job else None
+
+
+def get_upload_history(limit: int = 50) -> list:
+    return [job.to_dict() for job in get_recent_jobs(limit)]
+
+
+def init_app(app):
+    """Fails the upload jobs a previous server process left unfinished."""
+    _jobs.recover_on_first_request(app, fail_interrupted_jobs)
+
+
+def fail_interrupted_jobs() -> int:
+    """Called once when a server process starts serving (see init_app)."""
+    count = fail_unfinished_jobs("Interrupted by a server restart. Please upload the file again.")
+    if count:
+        current_app.logger.warning(f"Marked {count} interrupted upload job(s) as failed.")
+    return count
+
+
+def _run_job(app, job_id: int, source):
+    with app.app_context():
+        missing = False
+        success, message = False, "Upload job stopped unexpectedly."
+        try:
+            job = get_job(job_id)
+            if job is None:
+                missing = True
+                return
+            filename, data_type, uploaded_by = job.filename, job.data_type, job.uploaded_by
+            skip_invalid, dedupe = job.skip_invalid, job.dedupe
+            db.session.remove()
+
+            mark_job_started(job_id)
+            _emit(job_id, status="running")
+
+            def progress(**counts):
+                update_job(job_id, **counts)
+                _emit(job_id, status="running", **counts)
+
+            success, message, row_count = ingest_file(
+                source, filename, data_type, uploaded_by, skip_invalid, dedupe,
+                progress=progress
+            )
+        except Exception as e:
+            db.session.rollback()
+            app.logger.error(f"Upload job {job_id} crashed: {str(e)}")
+            success, message = False, f"Unexpected error: {str(e)}"
+        finally:
+            source.close()
+            db.session.remove()
+            if not missing:
+                # always leave the job in a final state, even if reporting fails
+                mark_job_finished(job_id, success, message)
+                _emit(job_id, status="success" if success else "failed", message=message)
+                app.logger.info(f"Upload job {job_id} finished: {message}")
+
+
+def _emit(job_id: int, **payload):
+    """Queues a progress event; safe to call from worker threads."""
+    _events.put((job_id, payload))
+
+
+def _relay_events(app):
+    while True:
+        relay_pending_events(app)
+        socketio.sleep(RELAY_INTERVAL_SEC)
+
+
+def relay_pending_events(app) -> int:
+    """
+    Best effort: a lost progress event must never stop the job.
+    Returns the number of events sent.
+    """
+    sent = 0
+    while True:
+        try:
+            job_id, payload = _events.get_nowait()
+        except queue.Empty:
+            return sent
+        try:
+            socketio.emit("upload_progress", {"job_id": job_id, **payload})
+            sent += 1
+        except Exception as e:
+            app.logger.warning(f"Upload job {job_id} progress event not sent: {str(e)}")
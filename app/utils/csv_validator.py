@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 
 # Required columns for each data type
@@ -22,63 +23,185 @@ REQUIRED_COLUMNS = {
 }
 
 
+# Column kinds used for coercion; optional columns are filled with NULLs
+# when missing so writers always see the full schema.
+#   date   -> datetime64
+#   int    -> int64 (float64 until invalid rows are dropped)
+#   number -> float64
+#   text   -> str, blanks become NULL
+#   key    -> str, integer-like floats rendered without ".0"
+COLUMN_TYPES = {
+    "sales": {
+        "date": "date", "product_name": "text", "category": "text",
+        "quantity_sold": "int", "unit_price": "number",
+        "total_revenue": "number", "cost_price": "number",
+        "gross_profit": "number", "region": "text", "store_id": "key"
+    },
+    "inventory": {
+        "product_name": "text", "category": "text", "sku": "key",
+        "current_stock": "int", "reorder_level": "int",
+        "unit_cost": "number", "supplier_name": "text"
+    },
+    "employees": {
+        "employee_code": "key", "full_name": "text", "department": "text",
+        "designation": "text", "salary": "number", "sales_target": "number",
+        "sales_achieved": "number", "attendance_percent": "number"
+    },
+    "expenses": {
+        "date": "date", "category": "text", "description": "text",
+        "amount": "number", "department": "text", "approved_by": "text"
+    }
+}
+
+_KIND_ERRORS = {
+    "date": "has missing or invalid dates. Use YYYY-MM-DD.",
+    "int": "must contain numeric values only.",
+    "number": "must contain numeric values only.",
+    "text": "has empty values.",
+    "key": "has empty values."
+}
+
+MAX_REPORTED_LINES = 10
+
+
+def normalize_columns(columns) -> list:
+    return [str(col).strip().lower().replace(" ", "_") for col in columns]
+
+
+def coerce_frame(df: pd.DataFrame, data_type: str):
+    """
+    Single vectorized pass over every column of the schema.
+    Returns (typed: DataFrame, row_errors: np.ndarray[uint16]) where bit i of
+    row_errors is set when REQUIRED_COLUMNS[data_type][i] failed to coerce.
+    Already-typed input (e.g. Parquet) skips the string parsing.
+    """
+    required = REQUIRED_COLUMNS[data_type]
+    typed = {}
+    row_errors = np.zeros(len(df), dtype=np.uint16)
+
+    for col, kind in COLUMN_TYPES[data_type].items():
+        if col not in df.columns:
+            typed[col] = _empty_column(kind, df.index)
+            continue
+
+        values = _coerce_column(df[col], kind)
+        typed[col] = values
+        if col in required:
+            bit = np.uint16(1 << required.index(col))
+            row_errors |= np.where(values.isna().to_numpy(), bit, np.uint16(0))
+
+    return pd.DataFrame(typed, index=df.index), row_errors
+
+
+def coerce_and_validate(df: pd.DataFrame, data_type: str,
+                        skip_invalid: bool = False, first_line: int = 2):
+    """
+    Validates and coerces in one pass.
+    Returns (typed: DataFrame | None, errors: list, bad_lines: list)
+    With skip_invalid=True, bad rows are dropped instead of rejecting the
+    file and their line numbers (first data row = first_line) are returned.
+    """
+    errors = _check_structure(df, data_type)
+    if errors:
+        return None, errors, []
+
+    typed, row_errors = coerce_frame(df, data_type)
+    bad = row_errors != 0
+    bad_lines = (np.flatnonzero(bad) + first_line).tolist()
+
+    if bad.any() and not skip_invalid:
+        return None, _row_error_messages(row_errors, data_type, first_line), bad_lines
+
+    if bad.any():
+        typed = typed[~bad]
+        if typed.empty:
+            return None, ["File contains no valid data rows."], bad_lines
+
+    for col, kind in COLUMN_TYPES[data_type].items():
+        if kind == "int" and col in REQUIRED_COLUMNS[data_type]:
+            typed[col] = typed[col].astype("int64")
+
+    return typed, [], bad_lines
+
+
 def validate_file(df: pd.DataFrame, data_type: str):
     """
     Validates a DataFrame against required columns and basic rules.
     Returns (is_valid: bool, errors: list)
     """
+    _, errors, _ = coerce_and_validate(df, data_type)
+    return not errors, errors
+
+
+def _check_structure(df: pd.DataFrame, data_type: str) -> list:
     errors = []
 
     # Normalize column names
-    df.columns = [col.strip().lower().replace(" ", "_") for col in df.columns]
+    df.columns = normalize_columns(df.columns)
 
-    required = REQUIRED_COLUMNS.get(data_type, [])
+    if data_type not in REQUIRED_COLUMNS:
+        return [f"Unknown data type: {data_type}"]
+    required = REQUIRED_COLUMNS[data_type]
 
     # Check required columns exist
     missing_cols = [col for col in required if col not in df.columns]
     if missing_cols:
-        errors.append(f"Missing required columns: {', '.join(missing_cols)}")
-        return False, errors
+        return [f"Missing required columns: {', '.join(missing_cols)}"]
 
     # Check not empty
     if df.empty:
-        errors.append("File contains no data rows.")
-        return False, errors
+        return ["File contains no data rows."]
 
     # Check for completely empty required columns
     for col in required:
         if df[col].isnull().all():
             errors.append(f"Column '{col}' is completely empty.")
 
-    # Type checks per data type
-    if data_type == "sales":
-        try:
-            pd.to_datetime(df["date"])
-        except Exception:
-            errors.append("Column 'date' has invalid date format. Use YYYY-MM-DD.")
-
-        for num_col in ["quantity_sold", "unit_price", "total_revenue", "cost_price", "gross_profit"]:
-            if not pd.to_numeric(df[num_col], errors="coerce").notnull().all():
-                errors.append(f"Column '{num_col}' must contain numeric values only.")
-
-    if data_type == "inventory":
-        for num_col in ["current_stock", "reorder_level", "unit_cost"]:
-            if not pd.to_numeric(df[num_col], errors="coerce").notnull().all():
-                errors.append(f"Column '{num_col}' must contain numeric values only.")
-
-    if data_type == "employees":
-        if not pd.to_numeric(df["salary"], errors="coerce").notnull().all():
-            errors.append("Column 'salary' must contain numeric values only.")
-
-    if data_type == "expenses":
-        try:
-            pd.to_datetime(df["date"])
-        except Exception:
-            errors.append("Column 'date' has invalid date format. Use YYYY-MM-DD.")
-        if not pd.to_numeric(df["amount"], errors="coerce").notnull().all():
-            errors.append("Column 'amount' must contain numeric values only.")
+    return errors
+
+
+def _row_error_messages(row_errors: np.ndarray, data_type: str, first_line: int) -> list:
+    errors = []
+    for i, col in enumerate(REQUIRED_COLUMNS[data_type]):
+        rows = np.flatnonzero(row_errors & np.uint16(1 << i))
+        if not len(rows):
+            continue
+        kind = COLUMN_TYPES[data_type][col]
+        sample = ", ".join(str(r + first_line) for r in rows[:MAX_REPORTED_LINES])
+        more = " ..." if len(rows) > MAX_REPORTED_LINES else ""
+        errors.append(
+            f"Column '{col}' {_KIND_ERRORS[kind]} "
+            f"({len(rows)} rows, lines {sample}{more})"
+        )
+    return errors
+
+
+def _coerce_column(values: pd.Series, kind: str) -> pd.Series:
+    if kind == "date":
+        if pd.api.types.is_datetime64_any_dtype(values):
+            return values.dt.tz_localize(None) if values.dt.tz is not None else values
+        return pd.to_datetime(values, errors="coerce")
+
+    if kind in ("int", "number"):
+        if pd.api.types.is_bool_dtype(values):
+            values = values.astype("float64")
+        if not pd.api.types.is_numeric_dtype(values):
+            values = pd.to_numeric(values, errors="coerce")
+        return values.astype("float64")
+
+    if kind == "key" and pd.api.types.is_float_dtype(values):
+        # Integer-like IDs read as float (because of blanks) would render as "101.0"
+        if (values.dropna() % 1 == 0).all():
+            values = values.astype("Int64")
+
+    missing = values.isna()
+    text = values.astype(str).str.strip()
+    return text.where(~(missing | (text == "")), None)
 
-    if errors:
-        return False, errors
 
-    return True, []
\ No newline at end of file
+def _empty_column(kind: str, index) -> pd.Series:
+    if kind == "date":
+        return pd.Series(pd.NaT, index=index, dtype="datetime64[ns]")
+    if kind in ("int", "number"):
+        return pd.Series(np.nan, index=index, dtype="float64")
+    return pd.Series(None, index=index, dtype=object)
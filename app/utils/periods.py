@@ -0,0 +1,40 @@
+"""
+Persisted period buckets for sales and the daily rollup.
+
+month_bucket is YYYYMM as an integer (202403); week_start is the Monday
+that opens the ISO week. Both format back to exactly the strings pandas
+produces for Period("M") and Period("W"), so trend output is unchanged.
+"""
+from datetime import date, timedelta
+import pandas as pd
+
+
+def month_bucket(dates: pd.Series) -> pd.Series:
+    """YYYYMM integers for a datetime64 series."""
+    return (dates.dt.year * 100 + dates.dt.month).astype("int32")
+
+
+def week_start(dates: pd.Series) -> pd.Series:
+    """Monday of each date's week, as datetime.date objects."""
+    return (dates.dt.normalize() - pd.to_timedelta(dates.dt.weekday, unit="D")).dt.date
+
+
+def month_bucket_of(day: date) -> int:
+    return day.year * 100 + day.month
+
+
+def week_start_of(day: date) -> date:
+    return day - timedelta(days=day.weekday())
+
+
+def format_month(bucket: int) -> str:
+    """202403 -> '2024-03'"""
+    bucket = int(bucket)
+    return f"{bucket // 100}-{bucket % 100:02d}"
+
+
+def format_week(start) -> str:
+    """Monday -> 'YYYY-MM-DD/YYYY-MM-DD', matching str(Period(.., 'W'))"""
+    if isinstance(start, str):
+        start = date.fromisoformat(start)
+    return f"{start.isoformat()}/{(start + timedelta(days=6)).isoformat()}"
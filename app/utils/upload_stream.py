@@ -0,0 +1,22 @@
+import os
+import tempfile
+from flask import Request, current_app
+
+
+class SpooledUploadRequest(Request):
+    """
+    Multipart file parts are written once, into a SpooledTemporaryFile:
+    held in memory up to UPLOAD_SPOOL_MAX_BYTES, then rolled over to an
+    anonymous temp file in UPLOAD_FOLDER. Every upload gets its own buffer,
+    so concurrent uploads with the same filename never share a path.
+    """
+
+    def _get_file_stream(self, total_content_length, content_type,
+                         filename=None, content_length=None):
+        upload_folder = current_app.config.get("UPLOAD_FOLDER", "uploads")
+        os.makedirs(upload_folder, exist_ok=True)
+        return tempfile.SpooledTemporaryFile(
+            max_size=current_app.config.get("UPLOAD_SPOOL_MAX_BYTES", 32 * 1024 * 1024),
+            mode="w+b",
+            dir=upload_folder
+        )
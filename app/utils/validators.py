@@ -1,6 +1,6 @@
 import os
 
-ALLOWED_EXTENSIONS = {"csv", "xlsx", "xls"}
+ALLOWED_EXTENSIONS = {"csv", "xlsx", "xls", "parquet", "feather", "arrow"}
 
 
 def allowed_file(filename: str) -> bool:
@@ -0,0 +1,105 @@
+"""
+Forecast feed latency: row-level run_forecast vs SQL period totals.
+
+For each size, loads synthetic sales into a fresh SQLite database and
+times the old feed (every sale row -> dicts -> run_forecast) against
+get_monthly_trend() + run_forecast_from_totals(). Both forecasts are
+checked for equality.
+
+    python -m benchmarks.forecast_benchmark --sizes 10k 100k 1m
+"""
+import argparse
+import json
+import os
+import tempfile
+import time
+
+from benchmarks.ingest_benchmark import make_app
+from benchmarks.synthetic_data import generate, parse_size
+
+
+def _row_feed(periods: int):
+    from app.models.sales import Sale
+    from app.ai_engine.sales_forecaster import run_forecast
+    sales_data = [
+        {
+            "date": str(s.date),
+            "total_revenue": float(s.total_revenue),
+            "gross_profit": float(s.gross_profit)
+        }
+        for s in Sale.query.all()
+    ]
+    return run_forecast(sales_data, periods=periods, period_type="monthly")
+
+
+def _totals_feed(periods: int):
+    from app.repositories.analytics_repo import get_monthly_trend
+    from app.ai_engine.sales_forecaster import run_forecast_from_totals
+    totals = get_monthly_trend()
+    return run_forecast_from_totals(
+        [t["period"] for t in totals],
+        [t["revenue"] for t in totals],
+        [t["profit"] for t in totals],
+        periods=periods,
+        period_type="monthly"
+    )
+
+
+def run_case(rows: int, periods: int, workdir: str, seed: int) -> dict:
+    from app.extensions import db
+    from app.services.ingestion_service import ingest_file
+
+    data_path = os.path.join(workdir, f"sales_{rows}_{seed}.csv")
+    if not os.path.exists(data_path):
+        generate("sales", rows, data_path, seed=seed)
+    db_path = os.path.join(workdir, f"forecast_{rows}_{os.getpid()}.db")
+    if os.path.exists(db_path):
+        os.remove(db_path)
+    app = make_app(db_path)
+
+    with app.app_context():
+        success, message, _ = ingest_file(data_path, os.path.basename(data_path), "sales",
+                                          uploaded_by=None, dedupe=False)
+        if not success:
+            raise RuntimeError(message)
+
+        started = time.perf_counter()
+        old = _row_feed(periods)
+        row_ms = (time.perf_counter() - started) * 1000
+        db.session.remove()
+
+        started = time.perf_counter()
+        new = _totals_feed(periods)
+        totals_ms = (time.perf_counter() - started) * 1000
+        db.session.remove()
+
+    os.remove(db_path)
+    return {
+        "rows": rows,
+        "row_feed_ms": round(row_ms, 2),
+        "totals_feed_ms": round(totals_ms, 2),
+        "speedup": round(row_ms / totals_ms, 1) if totals_ms else None,
+        "results_match": old == new,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Forecast feed latency benchmark")
+    parser.add_argument("--sizes", nargs="+", default=["10k", "100k"])
+    parser.add_argument("--periods", type=int, default=6)
+    parser.add_argument("--workdir", default=os.path.join(tempfile.gettempdir(), "smartmart_bench"))
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="write the JSON report here")
+    args = parser.parse_args(argv)
+
+    os.makedirs(args.workdir, exist_ok=True)
+    report = {"cases": [run_case(parse_size(s), args.periods, args.workdir, args.seed) for s in args.sizes]}
+    output = json.dumps(report, indent=2, sort_keys=True)
+    if args.output:
+        with open(args.output, "w") as fh:
+            fh.write(output + "\n")
+    print(output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,218 @@
+"""
+Ingestion throughput benchmark.
+
+Generates deterministic synthetic files, loads them into a fresh local
+SQLite database and records rows/sec, peak RSS and per-stage timings.
+Each case runs in its own process so peak RSS is per case.
+
+    python -m benchmarks.ingest_benchmark --sizes 10k 1m --output report.json
+    python -m benchmarks.ingest_benchmark --sizes 10m --mode pipeline
+    python -m benchmarks.ingest_benchmark --compare old.json new.json
+
+Modes:
+    stages   - read_file, structure validation, coerce_and_validate and
+               save_to_db timed separately on the whole frame
+    pipeline - ingest_file end to end (streams files above the configured
+               thresholds), i.e. what a real upload does
+"""
+import argparse
+import json
+import os
+import platform
+import resource
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from datetime import datetime
+from multiprocessing import get_context
+
+from benchmarks.synthetic_data import BUILDERS, SIZES, generate, parse_size
+
+DEFAULT_TYPES = ["sales", "inventory", "employees", "expenses"]
+
+
+def make_app(db_path: str):
+    """Bare Flask app on SQLite: no scheduler, no MySQL, no blueprints."""
+    from flask import Flask
+    from config import BaseConfig
+    from app.extensions import db
+
+    app = Flask("smartmart_benchmark")
+    app.config.from_object(BaseConfig)
+    app.config["SQLALCHEMY_DATABASE_URI"] = f"sqlite:///{db_path}"
+    db.init_app(app)
+    with app.app_context():
+        from app import models  # noqa: F401
+        db.create_all()
+    return app
+
+
+@contextmanager
+def _timed(timings: dict, stage: str):
+    started = time.perf_counter()
+    yield
+    timings[stage] = round(time.perf_counter() - started, 4)
+
+
+def _peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is KB on Linux, bytes on macOS
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+def run_case(data_type: str, rows: int, fmt: str, mode: str, workdir: str, seed: int) -> dict:
+    from app.extensions import db
+    from app.services.ingestion_service import read_file, ingest_file, save_to_db
+    from app.utils.csv_validator import _check_structure, coerce_and_validate
+
+    data_path = os.path.join(workdir, f"{data_type}_{rows}_{seed}.{fmt}")
+    if not os.path.exists(data_path):
+        generate(data_type, rows, data_path, fmt=fmt, seed=seed)
+
+    db_path = os.path.join(workdir, f"bench_{data_type}_{rows}_{os.getpid()}.db")
+    if os.path.exists(db_path):
+        os.remove(db_path)
+    app = make_app(db_path)
+
+    timings = {}
+    case = {
+        "data_type": data_type,
+        "rows": rows,
+        "format": fmt,
+        "mode": mode,
+        "file_mb": round(os.path.getsize(data_path) / (1024 * 1024), 2),
+    }
+
+    with app.app_context():
+        started = time.perf_counter()
+        if mode == "stages":
+            with _timed(timings, "read"):
+                df = read_file(data_path, data_type)
+            with _timed(timings, "validate"):
+                # structure-only pass: required columns, empty file/columns
+                errors = _check_structure(df, data_type)
+            with _timed(timings, "coerce"):
+                typed, errors, bad_lines = coerce_and_validate(df, data_type)
+            if errors:
+                raise RuntimeError(" | ".join(errors))
+            del df
+            with _timed(timings, "insert"):
+                result = save_to_db(typed, data_type, uploaded_by=None)
+            case["inserted"] = result.get("inserted", result["rows"])
+            case["duplicates"] = result.get("duplicates", 0)
+        else:
+            with _timed(timings, "pipeline"):
+                success, message, row_count = ingest_file(
+                    data_path, os.path.basename(data_path), data_type, uploaded_by=None
+                )
+            if not success:
+                raise RuntimeError(message)
+            case["inserted"] = row_count
+        total = time.perf_counter() - started
+        db.session.remove()
+
+    os.remove(db_path)
+    case.update({
+        "stages_sec": timings,
+        "total_sec": round(total, 4),
+        "rows_per_sec": round(rows / total, 1) if total > 0 else None,
+        "peak_rss_mb": _peak_rss_mb(),
+    })
+    return case
+
+
+def run_benchmarks(types, sizes, fmt, mode, workdir, seed) -> dict:
+    cases = []
+    spawn = get_context("spawn")
+    for data_type in types:
+        for size in sizes:
+            rows = parse_size(size)
+            # Fresh process per case keeps ru_maxrss meaningful
+            with ProcessPoolExecutor(max_workers=1, mp_context=spawn) as pool:
+                case = pool.submit(run_case, data_type, rows, fmt, mode, workdir, seed).result()
+            print(
+                f"{data_type:<10} {rows:>10,} rows  {case['rows_per_sec']:>12,.0f} rows/sec  "
+                f"peak {case['peak_rss_mb']:>8,.1f} MB  {case['stages_sec']}"
+            )
+            cases.append(case)
+
+    return {
+        "generated_at": datetime.utcnow().isoformat(timespec="seconds"),
+        "environment": _environment(),
+        "seed": seed,
+        "cases": cases,
+    }
+
+
+def _environment() -> dict:
+    import numpy
+    import pandas
+    import sqlalchemy
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "pandas": pandas.__version__,
+        "numpy": numpy.__version__,
+        "sqlalchemy": sqlalchemy.__version__,
+    }
+
+
+def compare_reports(old_path: str, new_path: str):
+    """Prints rows/sec and peak RSS deltas for cases present in both reports."""
+    with open(old_path) as fh:
+        old = {_case_key(c): c for c in json.load(fh)["cases"]}
+    with open(new_path) as fh:
+        new = {_case_key(c): c for c in json.load(fh)["cases"]}
+
+    for key in sorted(set(old) & set(new)):
+        before, after = old[key], new[key]
+        speed = _pct_change(before["rows_per_sec"], after["rows_per_sec"])
+        memory = _pct_change(before["peak_rss_mb"], after["peak_rss_mb"])
+        print(f"{' / '.join(map(str, key)):<40} rows/sec {speed:>+8.1f}%   peak RSS {memory:>+8.1f}%")
+
+
+def _case_key(case: dict) -> tuple:
+    return case["data_type"], case["rows"], case["format"], case["mode"]
+
+
+def _pct_change(before, after) -> float:
+    if not before:
+        return 0.0
+    return (after - before) / before * 100
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="SmartMart ingestion benchmark")
+    parser.add_argument("--types", nargs="+", default=DEFAULT_TYPES, choices=sorted(BUILDERS))
+    parser.add_argument("--sizes", nargs="+", default=["10k", "1m"],
+                        help="row counts or: " + ", ".join(SIZES))
+    parser.add_argument("--format", default="csv", choices=["csv", "parquet"])
+    parser.add_argument("--mode", default="stages", choices=["stages", "pipeline"])
+    parser.add_argument("--workdir", default=os.path.join(tempfile.gettempdir(), "smartmart_bench"))
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="write the JSON report here")
+    parser.add_argument("--compare", nargs=2, metavar=("OLD", "NEW"),
+                        help="diff two reports instead of running")
+    args = parser.parse_args(argv)
+
+    if args.compare:
+        compare_reports(*args.compare)
+        return
+
+    os.makedirs(args.workdir, exist_ok=True)
+    report = run_benchmarks(args.types, args.sizes, args.format, args.mode, args.workdir, args.seed)
+
+    output = json.dumps(report, indent=2, sort_keys=True)
+    if args.output:
+        with open(args.output, "w") as fh:
+            fh.write(output + "\n")
+        print(f"Report written to {args.output}")
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Partitioned forecast scaling: run_partitioned_forecast at 1..N workers.
+
+Builds synthetic per-(store, product, month) totals in memory, warms the
+process pool for each worker count, then times the forecast and checks
+that every run matches the single-process result exactly.
+
+    python -m benchmarks.parallel_forecast_benchmark --stores 64 --products 2000 --workers 1 2 4 8 16 32
+"""
+import argparse
+import json
+import time
+
+import numpy as np
+import pandas as pd
+
+FIELDS = ["revenue", "profit", "lower_bound", "upper_bound", "growth_rate", "accuracy_score", "risk_score"]
+
+
+def build_frame(stores: int, products: int, months: int, seed: int) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    store = np.repeat(np.arange(stores), products * months)
+    product = np.tile(np.repeat(np.arange(products), months), stores)
+    month = np.tile(np.arange(months), stores * products)
+    keep = rng.random(len(month)) > 0.1
+    return pd.DataFrame({
+        "store_id": pd.Categorical.from_codes(store[keep], [f"S{i:04d}" for i in range(stores)]),
+        "product_name": pd.Categorical.from_codes(product[keep], [f"P{i:05d}" for i in range(products)]),
+        "month_bucket": ((2020 + month[keep] // 12) * 100 + month[keep] % 12 + 1).astype("int32"),
+        "total_revenue": rng.gamma(2.0, 500.0, keep.sum()).round(2),
+        "gross_profit": rng.gamma(2.0, 120.0, keep.sum()).round(2),
+    })
+
+
+def _same(a: dict, b: dict) -> bool:
+    return all(np.array_equal(a[f], b[f], equal_nan=True) for f in FIELDS) and a["series"] == b["series"]
+
+
+def main(argv=None):
+    from app.ai_engine.parallel_forecaster import run_partitioned_forecast
+
+    parser = argparse.ArgumentParser(description="Partitioned forecast scaling benchmark")
+    parser.add_argument("--stores", type=int, default=32)
+    parser.add_argument("--products", type=int, default=1000)
+    parser.add_argument("--months", type=int, default=60)
+    parser.add_argument("--periods", type=int, default=6)
+    parser.add_argument("--workers", nargs="+", type=int, default=[1, 2, 4])
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="write the JSON report here")
+    args = parser.parse_args(argv)
+
+    frame = build_frame(args.stores, args.products, args.months, args.seed)
+    cases = []
+    baseline = None
+    for workers in args.workers:
+        run_partitioned_forecast(frame.head(1000), "store_id", "product_name", args.periods, workers)
+        started = time.perf_counter()
+        result = run_partitioned_forecast(frame, "store_id", "product_name", args.periods, workers)
+        elapsed = (time.perf_counter() - started) * 1000
+        if baseline is None:
+            baseline = (elapsed, result)
+        speedup = baseline[0] / elapsed if elapsed else None
+        cases.append({
+            "workers": workers,
+            "series": len(result["series"]),
+            "ms": round(elapsed, 2),
+            "speedup": round(speedup, 2) if speedup else None,
+            "efficiency": round(speedup / workers, 2) if speedup else None,
+            "results_match": _same(baseline[1], result),
+        })
+
+    report = {"rows": len(frame), "cases": cases}
+    output = json.dumps(report, indent=2, sort_keys=True)
+    if args.output:
+        with open(args.output, "w") as fh:
+            fh.write(output + "\n")
+    print(output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+"""
+Business summary latency: consolidated query layer vs the per-metric path.
+
+Loads synthetic sales and expenses into a fresh SQLite database, then times
+get_business_summary() against the previous sequence of per-metric
+analytics_repo calls. The summary is timed uncached (its version cache
+would turn every repeat into a hit). Both results are checked for
+equality, apart from the "filters" echo the legacy path never had, and
+each path's query count is recorded.
+
+    python -m benchmarks.summary_benchmark --rows 1m --repeat 5
+"""
+import argparse
+import json
+import os
+import statistics
+import tempfile
+import time
+from contextlib import contextmanager
+
+from sqlalchemy import event
+
+from benchmarks.ingest_benchmark import make_app
+from benchmarks.synthetic_data import generate, parse_size
+
+
+def legacy_summary():
+    """The per-metric call sequence get_business_summary used to make."""
+    from app.repositories.analytics_repo import (
+        get_total_revenue, get_total_profit,
+        get_total_expenses, get_total_units_sold,
+        get_top_products, get_category_performance,
+        get_monthly_trend, get_low_stock_items,
+        get_expense_by_category, get_employee_kpi_summary,
+        get_profit_margin, get_sales_count
+    )
+    revenue = get_total_revenue()
+    profit = get_total_profit()
+    expenses = get_total_expenses()
+    return {
+        "financials": {
+            "total_revenue": revenue,
+            "total_gross_profit": profit,
+            "total_expenses": expenses,
+            "net_profit": profit - expenses,
+            "profit_margin_percent": get_profit_margin(),
+            "total_units_sold": get_total_units_sold(),
+            "total_transactions": get_sales_count()
+        },
+        "top_products": get_top_products(5),
+        "category_performance": get_category_performance(),
+        "monthly_trend": get_monthly_trend(),
+        "low_stock_alerts": get_low_stock_items(5),
+        "expense_breakdown": get_expense_by_category(),
+        "employee_kpis": get_employee_kpi_summary()
+    }
+
+
+@contextmanager
+def count_queries(engine, counter: list):
+    def _count(*args):
+        counter[0] += 1
+    event.listen(engine, "before_cursor_execute", _count)
+    try:
+        yield
+    finally:
+        event.remove(engine, "before_cursor_execute", _count)
+
+
+def _load(app, workdir: str, rows: int, seed: int):
+    from app.services.ingestion_service import ingest_file
+    for data_type, count in (("sales", rows), ("expenses", max(rows // 100, 1000))):
+        path = os.path.join(workdir, f"{data_type}_{count}_{seed}.csv")
+        if not os.path.exists(path):
+            generate(data_type, count, path, seed=seed)
+        with app.app_context():
+            success, message, _ = ingest_file(path, os.path.basename(path), data_type,
+                                              uploaded_by=None, dedupe=False)
+        if not success:
+            raise RuntimeError(message)
+
+
+def _time(fn, app, repeat: int) -> dict:
+    from app.extensions import db
+    timings, queries, result = [], [0], None
+    with app.app_context():
+        for _ in range(repeat):
+            queries[0] = 0
+            with count_queries(db.engine, queries):
+                started = time.perf_counter()
+                result = fn()
+                timings.append(time.perf_counter() - started)
+            db.session.remove()
+    return {
+        "median_ms": round(statistics.median(timings) * 1000, 2),
+        "min_ms": round(min(timings) * 1000, 2),
+        "queries": queries[0],
+        "result": result,
+    }
+
+
+def run(rows: int, repeat: int, workdir: str, seed: int) -> dict:
+    from app.services.analytics_service import get_business_summary
+
+    db_path = os.path.join(workdir, f"summary_{rows}_{os.getpid()}.db")
+    if os.path.exists(db_path):
+        os.remove(db_path)
+    app = make_app(db_path)
+    _load(app, workdir, rows, seed)
+
+    legacy = _time(legacy_summary, app, repeat)
+    consolidated = _time(get_business_summary.__wrapped__, app, repeat)
+    os.remove(db_path)
+
+    consolidated_result = consolidated.pop("result")
+    consolidated_result.pop("filters", None)
+
+    return {
+        "rows": rows,
+        "repeat": repeat,
+        "results_match": legacy.pop("result") == consolidated_result,
+        "legacy": legacy,
+        "consolidated": consolidated,
+        "speedup": round(legacy["median_ms"] / consolidated["median_ms"], 2)
+        if consolidated["median_ms"] else None,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Business summary latency benchmark")
+    parser.add_argument("--rows", default="100k")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--workdir", default=os.path.join(tempfile.gettempdir(), "smartmart_bench"))
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="write the JSON report here")
+    args = parser.parse_args(argv)
+
+    os.makedirs(args.workdir, exist_ok=True)
+    report = run(parse_size(args.rows), args.repeat, args.workdir, args.seed)
+    output = json.dumps(report, indent=2, sort_keys=True)
+    if args.output:
+        with open(args.output, "w") as fh:
+            fh.write(output + "\n")
+    print(output)
+
+
+if __name__ == "__main__":
+    main()
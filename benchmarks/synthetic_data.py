@@ -0,0 +1,160 @@
+"""
+Deterministic synthetic upload files for the ingestion benchmarks.
+
+The same (data_type, rows, seed) always produces byte-identical files, so
+results from different releases are comparable. Files are written in
+chunks, so generating 10M rows never holds the whole frame in memory.
+
+    python -m benchmarks.synthetic_data sales 1m /tmp/sales_1m.csv
+"""
+import argparse
+import os
+import numpy as np
+import pandas as pd
+
+SIZES = {"10k": 10_000, "100k": 100_000, "1m": 1_000_000, "10m": 10_000_000}
+
+CATEGORIES = ["Grocery", "Dairy", "Beverages", "Snacks", "Household",
+              "Personal Care", "Frozen", "Bakery"]
+REGIONS = ["North", "South", "East", "West"]
+DEPARTMENTS = ["Sales", "Operations", "Finance", "HR", "Logistics"]
+EXPENSE_CATEGORIES = ["rent", "utilities", "salaries", "marketing",
+                      "logistics", "maintenance"]
+
+N_PRODUCTS = 1000
+N_STORES = 50
+START_DATE = np.datetime64("2022-01-01")
+N_DAYS = 3 * 365
+
+GENERATION_CHUNK = 500_000
+
+
+def parse_size(size) -> int:
+    if isinstance(size, int):
+        return size
+    size = str(size).lower()
+    if size in SIZES:
+        return SIZES[size]
+    multiplier = {"k": 1_000, "m": 1_000_000}.get(size[-1:])
+    return int(float(size[:-1]) * multiplier) if multiplier else int(size)
+
+
+def generate(data_type: str, rows, path: str, fmt: str = None, seed: int = 42) -> str:
+    """Writes `rows` synthetic rows of data_type to path (csv or parquet)."""
+    rows = parse_size(rows)
+    fmt = fmt or path.rsplit(".", 1)[-1].lower()
+    builder = BUILDERS[data_type]
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+
+    writer = None
+    try:
+        for index, start in enumerate(range(0, rows, GENERATION_CHUNK)):
+            count = min(GENERATION_CHUNK, rows - start)
+            rng = np.random.default_rng([seed, index])
+            frame = builder(rng, start, count)
+
+            if fmt == "csv":
+                frame.to_csv(path, mode="w" if index == 0 else "a",
+                             header=index == 0, index=False)
+            elif fmt == "parquet":
+                import pyarrow as pa
+                import pyarrow.parquet as pq
+                table = pa.Table.from_pandas(frame, preserve_index=False)
+                if writer is None:
+                    writer = pq.ParquetWriter(path, table.schema)
+                writer.write_table(table)
+            else:
+                raise ValueError(f"Unsupported format: {fmt}")
+    finally:
+        if writer is not None:
+            writer.close()
+    return path
+
+
+def _products(rng, count):
+    product_ids = rng.integers(0, N_PRODUCTS, count)
+    # Price and category are fixed per product so aggregates look realistic
+    base_price = 20 + (product_ids * 7919 % 480)
+    categories = np.array(CATEGORIES)[product_ids % len(CATEGORIES)]
+    names = np.char.add("Product ", (product_ids + 1).astype(str))
+    return product_ids, names, categories, base_price.astype("float64")
+
+
+def _sales(rng, start, count):
+    _, names, categories, price = _products(rng, count)
+    quantity = rng.integers(1, 21, count)
+    cost = np.round(price * rng.uniform(0.6, 0.9, count), 2)
+    revenue = np.round(quantity * price, 2)
+    store = rng.integers(1, N_STORES + 1, count)
+    dates = START_DATE + rng.integers(0, N_DAYS, count).astype("timedelta64[D]")
+    return pd.DataFrame({
+        "date": pd.to_datetime(dates).strftime("%Y-%m-%d"),
+        "product_name": names,
+        "category": categories,
+        "quantity_sold": quantity,
+        "unit_price": price,
+        "total_revenue": revenue,
+        "cost_price": cost,
+        "gross_profit": np.round(revenue - quantity * cost, 2),
+        "region": np.array(REGIONS)[store % len(REGIONS)],
+        "store_id": np.char.add("S", np.char.zfill(store.astype(str), 3)),
+    })
+
+
+def _inventory(rng, start, count):
+    _, names, categories, price = _products(rng, count)
+    skus = np.char.add("SKU", np.char.zfill(np.arange(start, start + count).astype(str), 8))
+    return pd.DataFrame({
+        "product_name": names,
+        "category": categories,
+        "sku": skus,
+        "current_stock": rng.integers(0, 500, count),
+        "reorder_level": rng.integers(20, 100, count),
+        "unit_cost": np.round(price * 0.7, 2),
+        "supplier_name": np.char.add("Supplier ", rng.integers(1, 40, count).astype(str)),
+    })
+
+
+def _employees(rng, start, count):
+    codes = np.char.add("EMP", np.char.zfill(np.arange(start, start + count).astype(str), 8))
+    target = np.round(rng.uniform(50_000, 500_000, count), 2)
+    return pd.DataFrame({
+        "employee_code": codes,
+        "full_name": np.char.add("Employee ", np.arange(start, start + count).astype(str)),
+        "department": np.array(DEPARTMENTS)[rng.integers(0, len(DEPARTMENTS), count)],
+        "designation": np.array(["Associate", "Lead", "Manager"])[rng.integers(0, 3, count)],
+        "salary": np.round(rng.uniform(20_000, 150_000, count), 2),
+        "sales_target": target,
+        "sales_achieved": np.round(target * rng.uniform(0.5, 1.3, count), 2),
+        "attendance_percent": np.round(rng.uniform(70, 100, count), 2),
+    })
+
+
+def _expenses(rng, start, count):
+    dates = START_DATE + rng.integers(0, N_DAYS, count).astype("timedelta64[D]")
+    return pd.DataFrame({
+        "date": pd.to_datetime(dates).strftime("%Y-%m-%d"),
+        "category": np.array(EXPENSE_CATEGORIES)[rng.integers(0, len(EXPENSE_CATEGORIES), count)],
+        "description": "Synthetic expense",
+        "amount": np.round(rng.uniform(100, 50_000, count), 2),
+        "department": np.array(DEPARTMENTS)[rng.integers(0, len(DEPARTMENTS), count)],
+        "approved_by": "Finance",
+    })
+
+
+BUILDERS = {
+    "sales": _sales,
+    "inventory": _inventory,
+    "employees": _employees,
+    "expenses": _expenses,
+}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("data_type", choices=sorted(BUILDERS))
+    parser.add_argument("rows", help="row count or one of: " + ", ".join(SIZES))
+    parser.add_argument("path")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+    print(generate(args.data_type, args.rows, args.path, seed=args.seed))
@@ -8,7 +8,31 @@ class BaseConfig:
     SQLALCHEMY_TRACK_MODIFICATIONS = False
     JWT_SECRET_KEY = os.getenv("JWT_SECRET_KEY", "fallback_jwt")
     UPLOAD_FOLDER = os.getenv("UPLOAD_FOLDER", "uploads")
-    MAX_CONTENT_LENGTH = 16 * 1024 * 1024
+    MAX_CONTENT_LENGTH = int(os.getenv("MAX_CONTENT_LENGTH", str(4 * 1024 * 1024 * 1024)))
+    INGEST_CHUNK_SIZE = int(os.getenv("INGEST_CHUNK_SIZE", "5000"))
+
+    # Uploads above these sizes are read, validated and committed in chunks
+    STREAM_UPLOAD_THRESHOLD = int(os.getenv("STREAM_UPLOAD_THRESHOLD", str(64 * 1024 * 1024)))
+    STREAM_XLSX_THRESHOLD = int(os.getenv("STREAM_XLSX_THRESHOLD", str(8 * 1024 * 1024)))
+    STREAM_CHUNK_ROWS = int(os.getenv("STREAM_CHUNK_ROWS", "100000"))
+    STREAM_COMMIT_EVERY = int(os.getenv("STREAM_COMMIT_EVERY", "1"))
+
+    # Uploads stay in memory up to this size, then spill to a temp file
+    UPLOAD_SPOOL_MAX_BYTES = int(os.getenv("UPLOAD_SPOOL_MAX_BYTES", str(32 * 1024 * 1024)))
+
+    # Background ingestion worker pool size
+    INGEST_WORKERS = int(os.getenv("INGEST_WORKERS", "2"))
+
+    # Background batch forecast jobs run one at a time by default
+    FORECAST_JOB_WORKERS = int(os.getenv("FORECAST_JOB_WORKERS", "1"))
+
+    # Process pool size for store/region partitioned forecasts (0 = all cores)
+    FORECAST_WORKERS = int(os.getenv("FORECAST_WORKERS", "0"))
+
+    # Analytics result cache: "lru" (per worker), "sqlite" (shared file) or "none"
+    ANALYTICS_CACHE_BACKEND = os.getenv("ANALYTICS_CACHE_BACKEND", "lru")
+    ANALYTICS_CACHE_PATH = os.getenv("ANALYTICS_CACHE_PATH", os.path.join("instance", "analytics_cache.sqlite"))
+    ANALYTICS_CACHE_MAX_ENTRIES = int(os.getenv("ANALYTICS_CACHE_MAX_ENTRIES", "128"))
     LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
 
     DB_USER = os.getenv("DB_USER")
@@ -32,9 +56,18 @@ class ProductionConfig(BaseConfig):
     DEBUG = False
 
 
+class TestingConfig(BaseConfig):
+    TESTING = True
+
+    @property
+    def SQLALCHEMY_DATABASE_URI(self):
+        return os.getenv("TEST_DATABASE_URL", "sqlite://")
+
+
 config_map = {
     "development": DevelopmentConfig,
     "production": ProductionConfig,
+    "testing": TestingConfig,
 }
 
 def get_config():
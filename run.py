@@ -1,7 +1,10 @@
 from app import create_app
 from app.extensions import socketio
 
-app = create_app()
+# Spawned forecast pool workers import this module as __mp_main__;
+# they must not start a second app and scheduler each
+if __name__ != "__mp_main__":
+    app = create_app()
 
 if __name__ == "__main__":
     socketio.run(app, debug=True, use_reloader=False)
\ No newline at end of file
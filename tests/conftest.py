@@ -0,0 +1,58 @@
+import pytest
+
+from app.extensions import db
+from tests.helpers import upload_file
+
+
+@pytest.fixture
+def app(tmp_path, monkeypatch):
+    """Full app on a fresh SQLite file (threads and workers share it)."""
+    monkeypatch.setenv("FLASK_ENV", "testing")
+    monkeypatch.setenv("TEST_DATABASE_URL", f"sqlite:///{tmp_path / 'smartmart.db'}")
+
+    from app import create_app
+    from app.services import cache_service
+    # The analytics cache is per process; versions restart with each database
+    monkeypatch.setattr(cache_service, "_cache", None)
+
+    app = create_app()
+    app.config["UPLOAD_FOLDER"] = str(tmp_path / "uploads")
+    with app.app_context():
+        db.create_all()
+        yield app
+        db.session.remove()
+
+
+@pytest.fixture
+def upload(app):
+    """Uploads a list of row dicts the way the HR upload form does."""
+    from werkzeug.datastructures import FileStorage
+    from app.services.ingestion_service import handle_upload
+
+    def _upload(data_type, rows, filename="upload.csv", **kwargs):
+        file = FileStorage(upload_file(rows, filename), filename=filename)
+        return handle_upload(file, data_type, uploaded_by=None, **kwargs)
+
+    return _upload
+
+
+@pytest.fixture
+def login(app):
+    """Returns a test client signed in as a new user with the given role."""
+    from app.models.role import Role
+    from app.models.user import User
+
+    def _login(role_name):
+        role = Role.query.filter_by(name=role_name).first() or Role(name=role_name)
+        user = User(full_name=f"{role_name} user", email=f"{role_name.lower()}@example.com", role=role)
+        user.set_password("secret")
+        db.session.add(user)
+        db.session.commit()
+
+        client = app.test_client()
+        with client.session_transaction() as session:
+            session["_user_id"] = str(user.id)
+            session["_fresh"] = True
+        return client
+
+    return _login
@@ -0,0 +1,44 @@
+"""Row builders, upload payloads and polling helpers shared by the tests."""
+import io
+import time
+
+import pandas as pd
+
+
+def sale(day="2024-01-01", product="Milk", category="Dairy", quantity=1, price=7.0,
+         region=None, store_id=None, cost=5.0):
+    return {
+        "date": day, "product_name": product, "category": category,
+        "quantity_sold": quantity, "unit_price": price,
+        "total_revenue": quantity * price, "cost_price": cost,
+        "gross_profit": quantity * (price - cost),
+        "region": region, "store_id": store_id,
+    }
+
+
+def upload_file(rows, filename="upload.csv"):
+    """Row dicts serialized in the format the filename asks for."""
+    frame = pd.DataFrame(rows)
+    buffer = io.BytesIO()
+    ext = filename.rsplit(".", 1)[-1]
+    if ext == "xlsx":
+        frame.to_excel(buffer, index=False)
+    elif ext == "parquet":
+        frame.to_parquet(buffer, index=False)
+    elif ext in ("feather", "arrow"):
+        frame.to_feather(buffer)
+    else:
+        buffer.write(frame.to_csv(index=False).encode())
+    buffer.seek(0)
+    return buffer
+
+
+def wait_for(fetch, timeout=30):
+    """Polls fetch() until it returns a finished job dict."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        job = fetch()
+        if job and job["status"] in ("success", "failed"):
+            return job
+        time.sleep(0.05)
+    raise AssertionError("job did not finish in time")
@@ -0,0 +1,116 @@
+"""
+Query-plan guard for the analytics and news hot paths (used by
+test_query_plans; point TEST_DATABASE_URL at MySQL or PostgreSQL to check
+their plans).
+
+Each hot path is executed once with a statement listener attached; every
+captured SELECT is then EXPLAINed on the live database. A plan that reads
+a table without any index (SQLite "SCAN <table>", MySQL type "ALL",
+PostgreSQL "Seq Scan") is reported as a full scan. Whole-index scans are
+accepted, since a whole-table aggregate has to read every entry of some
+structure, except for the SEEK_REQUIRED queries, which must be answered
+by an index seek.
+"""
+import json
+import re
+from contextlib import contextmanager
+from sqlalchemy import event
+from app.extensions import db
+
+_SQLITE_SCAN = re.compile(r"^SCAN (?:TABLE )?(\w+)(?: AS \w+)?( USING (?:COVERING )?INDEX \w+)?$")
+_POSTGRES_INDEX_SCANS = ("Index Scan", "Index Only Scan", "Bitmap Index Scan")
+
+# Selective lookups: reading a whole index is as much a regression as a full scan
+SEEK_REQUIRED = {"headline_exists", "get_low_stock_items"}
+
+
+def hot_queries() -> list:
+    """(name, callable) pairs for every query guarded by the plan check."""
+    from datetime import date
+    from app.repositories import analytics_repo, news_repo
+    from app.services.market_service import get_market_intelligence
+
+    quarter = {"start": date(2024, 1, 1), "end": date(2024, 3, 31)}
+
+    return [
+        ("headline_exists", lambda: news_repo.headline_exists("https://example.com/plan-check")),
+        ("get_recent_news", lambda: news_repo.get_recent_news(50)),
+        ("get_market_intelligence", get_market_intelligence),
+        ("get_sales_summary", analytics_repo.get_sales_summary),
+        ("get_total_revenue", analytics_repo.get_total_revenue),
+        ("get_top_products", analytics_repo.get_top_products),
+        ("get_category_performance", analytics_repo.get_category_performance),
+        ("get_monthly_trend", analytics_repo.get_monthly_trend),
+        ("get_weekly_trend", analytics_repo.get_weekly_trend),
+        ("get_low_stock_items", analytics_repo.get_low_stock_items),
+        ("get_expense_summary", analytics_repo.get_expense_summary),
+        ("get_employee_kpi_summary", analytics_repo.get_employee_kpi_summary),
+        ("get_sales_summary[date]", lambda: analytics_repo.get_sales_summary(**quarter)),
+        ("get_sales_summary[region]", lambda: analytics_repo.get_sales_summary(region="South", **quarter)),
+        ("get_sales_summary[store]", lambda: analytics_repo.get_sales_summary(store_id="S001", **quarter)),
+        ("get_expense_summary[date]", lambda: analytics_repo.get_expense_summary(**quarter)),
+    ]
+
+
+@contextmanager
+def _capture(engine, statements: list):
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append((statement, parameters))
+    event.listen(engine, "before_cursor_execute", _record)
+    try:
+        yield
+    finally:
+        event.remove(engine, "before_cursor_execute", _record)
+
+
+def explain(statement: str, parameters) -> list:
+    """
+    Table reads in the plan of one statement that are not index seeks, as
+    (table, "full" | "index") pairs: "index" reads a whole index.
+    """
+    conn = db.session.connection()
+    dialect = conn.dialect.name
+
+    if dialect == "sqlite":
+        rows = conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters).all()
+        return [(m.group(1), "index" if m.group(2) else "full")
+                for m in (_SQLITE_SCAN.match(r[-1]) for r in rows) if m]
+    if dialect == "mysql":
+        rows = conn.exec_driver_sql(f"EXPLAIN {statement}", parameters).mappings().all()
+        kinds = {"ALL": "full", "INDEX": "index"}
+        return [(r["table"], kinds[t]) for r in rows if (t := (r.get("type") or "").upper()) in kinds]
+    if dialect == "postgresql":
+        row = conn.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {statement}", parameters).scalar()
+        plan = row if isinstance(row, list) else json.loads(row)
+        return list(_postgres_scans(plan[0]["Plan"]))
+    raise NotImplementedError(f"Query plan check does not support {dialect}.")
+
+
+def _postgres_scans(node: dict):
+    if node["Node Type"] == "Seq Scan":
+        yield node["Relation Name"], "full"
+    elif node["Node Type"] in _POSTGRES_INDEX_SCANS and "Index Cond" not in node:
+        yield node.get("Relation Name") or node["Index Name"], "index"
+    for child in node.get("Plans", ()):
+        yield from _postgres_scans(child)
+
+
+def check_query_plans() -> dict:
+    """
+    Returns {query name: [tables read without an index]} for every hot
+    query (SEEK_REQUIRED queries also list tables read by a whole-index
+    scan); an empty list means the query is fully index-backed.
+    """
+    report = {}
+    for name, run in hot_queries():
+        statements = []
+        with _capture(db.engine, statements):
+            run()
+        scans = []
+        for statement, parameters in statements:
+            scans.extend(table for table, kind in explain(statement, parameters)
+                         if kind == "full" or name in SEEK_REQUIRED)
+        report[name] = sorted(set(scans))
+    db.session.rollback()
+    return report
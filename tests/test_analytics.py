@@ -0,0 +1,118 @@
+from datetime import date
+
+from app.extensions import db
+from app.models.sales import Sale
+from app.models.sales_rollup import SalesDailyRollup
+from app.repositories.analytics_repo import get_weekly_trend
+from app.repositories.dataset_version_repo import get_versions
+from app.repositories.rollup_repo import check_rollup, rebuild_rollup
+from app.services.analytics_service import get_business_summary
+from tests.helpers import sale
+
+
+def _seed(upload):
+    assert upload("sales", [
+        sale("2024-01-03", quantity=2, region="North", store_id="S1"),
+        sale("2024-01-03", quantity=1, region="North", store_id="S1"),
+        sale("2024-01-20", product="Bread", category="Bakery", price=3.0, cost=1.0, region="South", store_id="S2"),
+        sale("2024-02-05", quantity=4, region="South", store_id="S2"),
+    ])[0]
+    assert upload("expenses", [
+        {"date": "2024-01-10", "category": "Rent", "amount": 10},
+        {"date": "2024-02-10", "category": "Rent", "amount": 10},
+    ])[0]
+
+
+def test_business_summary_totals(upload):
+    _seed(upload)
+
+    summary = get_business_summary.__wrapped__()
+
+    assert summary["financials"] == {
+        "total_revenue": 52.0,
+        "total_gross_profit": 16.0,
+        "total_expenses": 20.0,
+        "net_profit": -4.0,
+        "profit_margin_percent": 30.77,
+        "total_units_sold": 8,
+        "total_transactions": 4,
+    }
+    assert summary["top_products"][0] == {"product": "Milk", "revenue": 49.0, "units": 7}
+    assert [c["category"] for c in summary["category_performance"]] == ["Dairy", "Bakery"]
+    assert summary["monthly_trend"] == [
+        {"period": "2024-01", "revenue": 24.0, "profit": 8.0},
+        {"period": "2024-02", "revenue": 28.0, "profit": 8.0},
+    ]
+
+
+def test_business_summary_filters(upload):
+    _seed(upload)
+
+    by_region = get_business_summary.__wrapped__(region="South")
+    by_range = get_business_summary.__wrapped__(start=date(2024, 2, 1), end=date(2024, 2, 29))
+
+    assert by_region["financials"]["total_revenue"] == 31.0
+    assert by_region["financials"]["total_expenses"] == 20.0
+    assert by_range["financials"]["total_transactions"] == 1
+    assert by_range["financials"]["total_expenses"] == 10.0
+    assert by_range["filters"]["start"] == "2024-02-01"
+
+
+def test_analytics_api_rejects_bad_filters(login):
+    client = login("CEO")
+
+    assert client.get("/ceo/api/analytics?start=2024-13-01").status_code == 400
+    assert client.get("/ceo/api/analytics?start=2024-02-01&end=2024-01-01").status_code == 400
+    assert client.get("/ceo/api/analytics?start=2024-01-01").status_code == 200
+
+
+def test_sales_carry_their_period_buckets(upload):
+    _seed(upload)
+
+    buckets = db.session.query(Sale.date, Sale.month_bucket, Sale.week_start).order_by(Sale.date).all()
+
+    assert buckets[0] == (date(2024, 1, 3), 202401, date(2024, 1, 1))
+    assert buckets[-1] == (date(2024, 2, 5), 202402, date(2024, 2, 5))
+
+
+def test_weekly_trend_buckets_on_monday(upload):
+    _seed(upload)
+
+    weeks = [w["period"] for w in get_weekly_trend()]
+
+    assert weeks == ["2024-01-01/2024-01-07", "2024-01-15/2024-01-21", "2024-02-05/2024-02-11"]
+
+
+def test_rollup_matches_raw_sales_across_uploads(upload):
+    _seed(upload)
+    assert upload("sales", [sale("2024-01-03", quantity=5, region="North", store_id="S1")])[0]
+
+    assert check_rollup() == []
+    rolled = db.session.query(SalesDailyRollup).filter_by(date=date(2024, 1, 3)).one()
+    assert (rolled.units, rolled.row_count) == (8, 3)
+
+
+def test_rebuild_repairs_a_drifted_rollup(upload):
+    _seed(upload)
+    db.session.query(Sale).filter(Sale.date == date(2024, 2, 5)).delete()
+    db.session.commit()
+
+    drift = check_rollup()
+    assert [m["date"] for m in drift] == [date(2024, 2, 5)]
+
+    rebuild_rollup(start=date(2024, 2, 1), end=date(2024, 2, 29))
+    db.session.commit()
+
+    assert check_rollup() == []
+
+
+def test_rollup_repair_bumps_the_sales_version(app, upload):
+    _seed(upload)
+    db.session.query(Sale).filter(Sale.date == date(2024, 2, 5)).delete()
+    db.session.commit()
+    before = get_versions(["sales"])["sales"]
+
+    result = app.test_cli_runner().invoke(args=["check-sales-rollup", "--repair"])
+
+    assert "Repaired 1 day(s)." in result.output
+    assert get_versions(["sales"])["sales"] == before + 1
@@ -0,0 +1,72 @@
+import numpy as np
+import pandas as pd
+
+from app.ai_engine.batch_forecaster import forecast_weekly_matrix, run_batch_forecast
+from tests.helpers import sale
+
+
+def _weekly(first: str, last: str, peak_week: int):
+    weeks = pd.period_range(pd.Period(first, freq="W"), pd.Period(last, freq="W"), freq="W")
+    iso = weeks.start_time.isocalendar().week.to_numpy()
+    revenue = np.where(iso == peak_week, 300.0, 100.0)[None, :]
+    return weeks, revenue
+
+
+def test_batch_forecast_is_per_series_and_sorted():
+    frame = pd.DataFrame({
+        "product_name": ["Milk", "Bread", "Milk", "Bread", "Milk", "Bread"],
+        "month_bucket": [202401, 202401, 202402, 202402, 202403, 202403],
+        "total_revenue": [100.0, 50.0, 110.0, 50.0, 120.0, 50.0],
+        "gross_profit": [30.0, 10.0, 33.0, 10.0, 36.0, 10.0],
+    })
+
+    result = run_batch_forecast(frame, "product_name", periods=2)
+
+    assert result["series"] == ["Bread", "Milk"]
+    assert result["revenue"].shape == (2, 2)
+    assert result["revenue"][1, 0] > result["revenue"][0, 0]
+
+
+def test_short_series_are_flagged_not_forecast():
+    frame = pd.DataFrame({
+        "product_name": ["Milk", "Milk", "Milk", "Bread"],
+        "month_bucket": [202401, 202402, 202403, 202403],
+        "total_revenue": [100.0, 110.0, 120.0, 50.0],
+        "gross_profit": [30.0, 33.0, 36.0, 10.0],
+    })
+
+    result = run_batch_forecast(frame, "product_name", periods=2)
+
+    assert list(result["status"]) == ["insufficient_history", "ok"]
+    assert np.isnan(result["revenue"][0]).all()
+
+
+def test_weekly_forecast_extends_the_trend():
+    revenue = (100.0 + 5 * np.arange(30))[None, :]
+
+    result = forecast_weekly_matrix(revenue, revenue * 0.3, pd.Period("2024-01-01", freq="W"), periods=3)
+
+    np.testing.assert_allclose(result["revenue"][0], [250.0, 255.0, 260.0])
+    assert result["accuracy_score"][0] == 100
+
+
+def test_weekly_seasonality_follows_iso_weeks_across_53_week_years():
+    # 2020 ends with ISO week 53, so a 52-slot cycle puts 2021's peak a week early
+    weeks, revenue = _weekly("2018-01-01", "2021-10-25", peak_week=50)
+
+    result = forecast_weekly_matrix(revenue, revenue * 0.3, weeks[0], periods=10)
+
+    future = pd.period_range(weeks[-1] + 1, periods=10, freq="W")
+    peak = future[int(np.argmax(result["revenue"][0]))]
+    assert peak.start_time.isocalendar().week == 50
+
+
+def test_weekly_forecast_api(login, upload):
+    rows = [sale(f"2024-01-{d:02d}", price=10 + d) for d in range(1, 29)]
+    assert upload("sales", rows)[0]
+    client = login("CEO")
+
+    result = client.get("/ceo/api/forecast?period_type=weekly&periods=2").get_json()
+
+    assert "error" not in result
+
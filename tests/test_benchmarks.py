@@ -0,0 +1,29 @@
+import pytest
+
+from benchmarks import summary_benchmark
+from benchmarks.ingest_benchmark import run_case
+from benchmarks.synthetic_data import generate
+
+
+def test_synthetic_files_are_deterministic(tmp_path):
+    first = generate("sales", 300, str(tmp_path / "a.csv"), seed=7)
+    second = generate("sales", 300, str(tmp_path / "b.csv"), seed=7)
+
+    with open(first, "rb") as a, open(second, "rb") as b:
+        assert a.read() == b.read()
+
+
+@pytest.mark.parametrize("mode", ["stages", "pipeline"])
+@pytest.mark.parametrize("data_type", ["sales", "inventory", "employees", "expenses"])
+def test_case_ingests_every_row(tmp_path, data_type, mode):
+    case = run_case(data_type, 300, "csv", mode, str(tmp_path), seed=42)
+
+    assert case["inserted"] == 300
+    assert case["rows_per_sec"] > 0
+
+
+def test_summary_benchmark_compares_like_for_like(tmp_path):
+    report = summary_benchmark.run(500, 2, str(tmp_path), seed=42)
+
+    assert report["results_match"]
+    assert report["consolidated"]["queries"] < report["legacy"]["queries"]
@@ -0,0 +1,85 @@
+import pytest
+
+from app.services import cache_service
+from app.services.analytics_service import get_business_summary
+from app.services.cache_service import cached_by_version, get_cache_stats
+from tests.helpers import sale
+
+
+@pytest.fixture(params=["lru", "sqlite"])
+def backend(request, app, tmp_path, monkeypatch):
+    app.config["ANALYTICS_CACHE_BACKEND"] = request.param
+    app.config["ANALYTICS_CACHE_PATH"] = str(tmp_path / "analytics_cache.sqlite")
+    monkeypatch.setattr(cache_service, "_cache", None)
+    return request.param
+
+
+def _counts(name="get_business_summary"):
+    stats = get_cache_stats()["functions"][name]
+    return stats["hits"], stats["misses"]
+
+
+def test_repeat_calls_hit_until_a_dataset_changes(backend, upload):
+    assert upload("sales", [sale()])[0]
+
+    first = get_business_summary()
+    assert get_business_summary() == first
+    assert _counts() == (1, 1)
+
+    assert upload("sales", [sale(product="Bread")])[0]
+    assert get_business_summary()["financials"]["total_transactions"] == 2
+    assert _counts() == (1, 2)
+
+    # Inventory feeds the low-stock alerts, so it invalidates too
+    assert upload("inventory", [{"product_name": "Milk", "category": "Dairy", "sku": "M-1",
+                                 "current_stock": 1, "reorder_level": 5, "unit_cost": 1}])[0]
+    assert get_business_summary()["low_stock_alerts"]
+    assert _counts() == (1, 3)
+
+
+def test_arguments_are_part_of_the_key(backend, upload):
+    assert upload("sales", [sale(region="North"), sale(region="South", price=9.0)])[0]
+
+    north = get_business_summary(region="North")
+    south = get_business_summary(region="South")
+
+    assert north["financials"]["total_revenue"] == 7.0
+    assert south["financials"]["total_revenue"] == 9.0
+
+
+def test_duplicate_only_upload_keeps_entries(backend, upload):
+    assert upload("sales", [sale()], dedupe=True)[0]
+    get_business_summary()
+
+    assert upload("sales", [sale()], dedupe=True)[2] == 0
+    get_business_summary()
+
+    assert _counts() == (1, 1)
+
+
+def test_errors_are_not_cached(backend):
+    @cached_by_version(["sales"])
+    def failing_report():
+        return {"error": "Not enough data."}
+
+    assert "error" in failing_report()
+    assert "error" in failing_report()
+
+    assert _counts("failing_report") == (0, 2)
+    assert get_cache_stats()["entries"] == 0
+
+
+# one client per test: requests share the test's app context, which keeps the loaded user
+def test_stats_endpoints_need_a_login(app):
+    assert app.test_client().get("/health/cache").status_code == 302
+
+
+def test_stats_endpoints_are_ceo_only(login):
+    assert login("HR").get("/health/forecast-cache").status_code == 403
+
+
+def test_stats_say_which_workers_they_cover(login):
+    client = login("CEO")
+
+    assert client.get("/health/cache").get_json()["data"]["scope"] == "process"
+    assert client.get("/health/forecast-cache").get_json()["data"]["scope"] == "process"
@@ -0,0 +1,39 @@
+import threading
+
+from app.extensions import db
+from app.repositories.dataset_version_repo import bump_version, get_versions
+
+
+def test_bump_creates_then_increments(app):
+    assert get_versions(["sales"]) == {"sales": 0}
+
+    bump_version("sales")
+    bump_version("sales")
+    db.session.commit()
+
+    assert get_versions(["sales", "news"]) == {"sales": 2, "news": 0}
+
+
+def test_concurrent_first_bumps_both_count(app):
+    errors = []
+    start = threading.Barrier(4)
+
+    def bump():
+        with app.app_context():
+            try:
+                start.wait()
+                bump_version("inventory")
+                db.session.commit()
+            except Exception as e:
+                errors.append(e)
+            finally:
+                db.session.remove()
+
+    threads = [threading.Thread(target=bump) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert errors == []
+    assert get_versions(["inventory"]) == {"inventory": 4}
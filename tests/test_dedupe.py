@@ -0,0 +1,62 @@
+from sqlalchemy import func
+
+from app.extensions import db
+from app.models.sales import Sale
+from tests.helpers import sale
+
+
+def _stored_sales():
+    return db.session.query(func.count(Sale.id), func.sum(Sale.total_revenue)).one()
+
+
+def _rows():
+    return [sale(), sale(product="Bread", price=3.0), sale(store_id="S1")]
+
+
+def test_reupload_skips_stored_rows(upload):
+    ok, message, count = upload("sales", _rows(), dedupe=True)
+    assert ok, message
+    assert count == 3
+
+    ok, message, count = upload("sales", _rows() + [sale("2024-01-02")], dedupe=True)
+    assert ok, message
+    assert count == 1
+    assert "Skipped 3 rows that were already uploaded" in message
+    assert _stored_sales() == (4, 24)
+
+
+def test_repeated_rows_are_kept(upload):
+    rows = [sale(), sale(), sale(), sale(region="North"), sale(category="Bakery")]
+
+    ok, message, count = upload("sales", rows, dedupe=True)
+    assert ok, message
+    assert count == 5
+    assert _stored_sales() == (5, 35)
+
+    # each stored copy matches one row of the re-upload; the extra copy is new
+    ok, message, count = upload("sales", rows + [sale()], dedupe=True)
+    assert ok, message
+    assert count == 1
+    assert "Skipped 5 rows that were already uploaded" in message
+    assert _stored_sales() == (6, 42)
+
+
+def test_streamed_reupload_counts_repeats_across_chunks(app, upload):
+    app.config["STREAM_UPLOAD_THRESHOLD"] = 0
+    app.config["STREAM_CHUNK_ROWS"] = 2
+    rows = [sale()] * 3 + [sale(product="Bread")] * 2
+    assert upload("sales", rows, dedupe=True)[2] == 5
+
+    ok, message, count = upload("sales", rows, dedupe=True)
+
+    assert ok, message
+    assert count == 0
+    assert _stored_sales()[0] == 5
+
+
+def test_dedupe_is_opt_in(upload):
+    assert upload("sales", _rows())[2] == 3
+    assert upload("sales", _rows())[2] == 3
+
+    assert _stored_sales() == (6, 34)
+    assert db.session.query(Sale.row_hash).filter(Sale.row_hash.isnot(None)).count() == 0
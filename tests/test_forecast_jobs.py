@@ -0,0 +1,72 @@
+import pytest
+
+from app.extensions import db
+from app.models.forecast_job import ForecastJob
+from app.models.series_forecast import SeriesForecast
+from app.repositories.forecast_job_repo import create_job
+from tests.helpers import sale, wait_for
+
+
+def _history(upload):
+    rows = [sale(f"{2022 + m // 12}-{m % 12 + 1:02d}-10", product=product, price=10 + m)
+            for m in range(24) for product in ("Milk", "Bread")]
+    assert upload("sales", rows)[0]
+
+
+def test_get_reads_without_computing(login, upload):
+    _history(upload)
+    client = login("CEO")
+
+    response = client.get("/ceo/api/forecast/batch")
+
+    assert response.status_code == 404
+    assert db.session.query(SeriesForecast).count() == 0
+
+
+def test_post_queues_a_job_that_stores_the_batch(login, upload):
+    _history(upload)
+    client = login("CEO")
+
+    response = client.post("/ceo/api/forecast/batch", json={"periods": 3})
+    assert response.status_code == 202
+    job_id = response.get_json()["job"]["id"]
+
+    job = wait_for(lambda: client.get(f"/ceo/api/forecast/jobs/{job_id}").get_json())
+    assert job["status"] == "success", job["message"]
+
+    stored = client.get("/ceo/api/forecast/batch?periods=3").get_json()
+    assert stored["batch_id"] == job["batch_id"]
+    assert sorted(stored["series"]) == ["Bread", "Milk"]
+    assert stored["stale"] is False
+
+
+@pytest.mark.parametrize("params", [
+    {"level": "sku"}, {"periods": "abc"}, {"periods": 2.5}, {"periods": -1}, {"periods": 1000},
+    {"period_type": "yearly"}, {"model": "arima"},
+])
+def test_post_rejects_bad_parameters(login, params):
+    client = login("CEO")
+
+    response = client.post("/ceo/api/forecast/batch", json=params)
+
+    assert response.status_code == 400
+    assert response.get_json()["error"]
+
+
+def test_get_rejects_bad_periods(login):
+    client = login("CEO")
+
+    assert client.get("/ceo/api/forecast/batch?periods=abc").status_code == 400
+    assert client.get("/ceo/api/forecast/batch?periods=0").status_code == 400
+
+
+def test_jobs_left_running_fail_on_first_request(login):
+    client = login("CEO")
+    job_id = create_job("product_name", "monthly", 6).id
+    db.session.remove()
+
+    client.get("/ceo/api/forecast/jobs/999")
+
+    stored = db.session.get(ForecastJob, job_id)
+    assert stored.status == "failed"
+    assert "server restart" in stored.message
@@ -0,0 +1,228 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.ai_engine.backtester import run_backtest
+from app.ai_engine.holt_winters import run_holt_winters_batch
+from app.ai_engine.parallel_forecaster import run_partitioned_forecast
+from app.ai_engine.sales_forecaster import run_forecast, run_forecast_from_totals
+from app.models.forecast_state import ForecastState
+from app.models.sales import Sale
+from app.repositories.analytics_repo import get_monthly_trend
+from app.repositories.sales_frame_repo import load_sales_frame
+from app.services.forecast_service import generate_backtest, get_forecast_cache_stats
+from tests.helpers import sale
+
+SEASON = np.array([0.8, 0.85, 0.9, 1.0, 1.05, 1.1, 1.1, 1.05, 1.0, 0.95, 1.05, 1.3])
+
+
+def _monthly(products=("Milk", "Bread"), stores=("S1",), months=36, first=202001):
+    """Seasonal monthly totals per (store, product), scaled per series."""
+    rows = []
+    for s, store in enumerate(stores):
+        for p, product in enumerate(products):
+            for m in range(months):
+                bucket = (first // 100 + m // 12) * 100 + m % 12 + 1
+                revenue = 100.0 * (1 + p + s) * (1 + 0.01 * m) * SEASON[m % 12]
+                rows.append({"store_id": store, "product_name": product, "month_bucket": bucket,
+                             "total_revenue": round(revenue, 2), "gross_profit": round(revenue * 0.3, 2)})
+    return pd.DataFrame(rows)
+
+
+def _history(upload, months=24):
+    # the default monthly model ignores months under 100k revenue
+    rows = [sale(f"{2022 + m // 12}-{m % 12 + 1:02d}-10", product=product, quantity=10000, price=10 + m)
+            for m in range(months) for product in ("Milk", "Bread")]
+    assert upload("sales", rows)[0]
+
+
+# ----------------------------------
+# ENGINES
+# ----------------------------------
+def test_partitioned_forecast_is_identical_for_any_worker_count():
+    frame = _monthly(stores=("S1", "S2", "S3"))
+
+    serial = run_partitioned_forecast(frame, "store_id", "product_name", periods=3, workers=1)
+    pooled = run_partitioned_forecast(frame, "store_id", "product_name", periods=3, workers=2)
+
+    assert pooled["partition"] == serial["partition"] == ["S1", "S1", "S2", "S2", "S3", "S3"]
+    assert pooled["series"] == serial["series"]
+    np.testing.assert_array_equal(pooled["revenue"], serial["revenue"])
+    np.testing.assert_array_equal(pooled["upper_bound"], serial["upper_bound"])
+
+
+def test_backtest_scores_each_horizon():
+    frame = _monthly(months=30)
+
+    result = run_backtest(frame, "product_name", horizon=3, cutoffs=6)
+
+    assert result["series"] == 2
+    assert result["cutoffs"] == ["2021-12", "2022-01", "2022-02", "2022-03", "2022-04", "2022-05"]
+    assert list(result["by_horizon"]["horizon"]) == [1, 2, 3]
+    # later origins run out of actuals for the longer horizons
+    assert list(result["by_horizon"]["count"]) == [12, 10, 8]
+    assert 0 <= result["overall"]["coverage"] <= 100
+
+
+def test_backtest_of_a_clean_trend_is_exact_for_holt_winters():
+    frame = _monthly(months=30)
+    frame["total_revenue"] = 100.0 + frame["month_bucket"].rank(method="dense")
+    frame["gross_profit"] = frame["total_revenue"] * 0.3
+
+    result = run_backtest(frame, "product_name", horizon=3, cutoffs=6, model="holt_winters_additive")
+
+    assert result["model"] == "holt_winters_additive"
+    assert result["overall"]["mape"] == pytest.approx(0, abs=0.01)
+    assert result["overall"]["coverage"] == 100
+
+
+def test_backtest_mape_skips_immaterial_actuals():
+    weeks = pd.period_range("2023-01-02", periods=60, freq="W")
+    revenue = np.where(np.arange(60) % 3 == 2, 0.5, 1000.0)
+    frame = pd.DataFrame({"product_name": "Milk", "week_start": weeks.start_time,
+                          "total_revenue": revenue, "gross_profit": revenue * 0.3})
+
+    result = run_backtest(frame, "product_name", horizon=2, cutoffs=12, period_type="weekly")
+
+    # near-zero weeks would put MAPE in the ten thousands; WAPE weighs them by size
+    assert result["overall"]["mape"] < 100
+    assert 0 < result["overall"]["wape"] < 100
+
+
+def test_backtest_needs_two_periods():
+    frame = _monthly(months=1)
+
+    assert run_backtest(frame, "product_name") == {"error": "Not enough periods to backtest."}
+
+
+@pytest.mark.parametrize("kind", ["additive", "multiplicative"])
+def test_holt_winters_follows_the_season(kind):
+    frame = _monthly(products=("Milk",), months=48)
+
+    result = run_holt_winters_batch(frame, "product_name", periods=12, kind=kind)
+
+    # history ends in December 2023, so the forecast runs Jan..Dec 2024
+    assert result["forecast_start"] == ["2024-01"]
+    assert int(np.argmax(result["revenue"][0])) == 11
+    assert int(np.argmin(result["revenue"][0])) == 0
+
+
+def test_holt_winters_states_only_fold_in_new_periods():
+    frame = _monthly(months=36)
+    fitted = run_holt_winters_batch(frame, "product_name", periods=3)
+    states = {("", s): state for s, state in zip(fitted["series"], fitted["state"])}
+
+    again = run_holt_winters_batch(frame, "product_name", periods=3, states=states)
+    np.testing.assert_array_equal(again["revenue"], fitted["revenue"])
+    assert not again["state_changed"].any()
+
+    longer = _monthly(months=37)
+    advanced = run_holt_winters_batch(longer, "product_name", periods=3, states=states)
+    assert advanced["state_changed"].all()
+    for old, new in zip(fitted["state"], advanced["state"]):
+        assert new["through"] == old["through"] + 1
+        # stored smoothing parameters are kept, not refitted
+        assert (new["alpha"], new["beta"], new["gamma"]) == (old["alpha"], old["beta"], old["gamma"])
+
+
+# ----------------------------------
+# SERVICE
+# ----------------------------------
+def test_period_totals_forecast_like_the_raw_rows(upload):
+    _history(upload)
+
+    rows = [{"date": str(s.date), "total_revenue": float(s.total_revenue),
+             "gross_profit": float(s.gross_profit)} for s in Sale.query.all()]
+    totals = get_monthly_trend()
+    from_totals = run_forecast_from_totals(
+        [t["period"] for t in totals],
+        [t["revenue"] for t in totals],
+        [t["profit"] for t in totals],
+        periods=3,
+    )
+
+    assert "error" not in from_totals
+    assert from_totals == run_forecast(rows, periods=3)
+
+
+def test_rollup_frame_matches_raw_sales(upload):
+    _history(upload)
+
+    columns = ["total_revenue", "gross_profit"]
+    by = ["product_name", "month_bucket"]
+    raw = load_sales_frame(columns, by=by, source="sales")
+    rolled = load_sales_frame(columns, by=by, source="rollup")
+
+    key = by + columns
+    pd.testing.assert_frame_equal(
+        raw[key].astype({"product_name": str}).sort_values(by).reset_index(drop=True),
+        rolled[key].astype({"product_name": str}).sort_values(by).reset_index(drop=True),
+    )
+    assert list(rolled.columns) == key
+
+
+def test_frame_is_projected_and_typed(upload):
+    assert upload("sales", [sale(region="North"), sale("2024-02-01", product="Bread", region="South")])[0]
+
+    frame = load_sales_frame(["date", "product_name", "total_revenue"], region="South")
+
+    assert list(frame.columns) == ["date", "product_name", "total_revenue"]
+    assert frame["product_name"].dtype == "category"
+    assert frame["total_revenue"].dtype == "float64"
+    assert list(frame["date"]) == [pd.Timestamp("2024-02-01")]
+
+
+def test_forecast_api(login, upload):
+    _history(upload)
+    client = login("CEO")
+
+    result = client.get("/ceo/api/forecast?periods=3").get_json()
+
+    assert "error" not in result
+    assert client.get("/ceo/api/forecast?period_type=yearly").get_json() == {"error": "Unsupported period type."}
+
+
+def test_forecast_is_reused_until_sales_change(login, upload):
+    _history(upload)
+    client = login("CEO")
+    before = get_forecast_cache_stats()
+
+    first = client.get("/ceo/api/forecast?periods=3").get_json()
+    second = client.get("/ceo/api/forecast?periods=3").get_json()
+    assert second == first
+    assert "error" not in first
+
+    assert upload("sales", [sale("2024-01-10", quantity=10000, price=99.0)])[0]
+    third = client.get("/ceo/api/forecast?periods=3").get_json()
+    assert third != first
+
+    after = get_forecast_cache_stats()
+    assert after["hits"] - before["hits"] == 1
+    assert after["misses"] - before["misses"] == 2
+
+
+def test_backfilled_sales_drop_holt_winters_states(login, upload):
+    _history(upload)
+    client = login("CEO")
+
+    result = client.get("/ceo/api/forecast?model=holt_winters_additive").get_json()
+    assert "error" not in result
+    assert ForecastState.query.count() == 1
+
+    # a newer period leaves the state alone, an older one invalidates it
+    assert upload("sales", [sale("2024-02-10")])[0]
+    assert ForecastState.query.count() == 1
+    assert upload("sales", [sale("2022-06-10")])[0]
+    assert ForecastState.query.count() == 0
+
+
+def test_total_backtest_drops_small_months_like_the_served_model(upload):
+    _history(upload)
+    assert upload("sales", [sale("2024-01-10"), sale("2024-02-10", quantity=10000, price=40.0)])[0]
+
+    result = generate_backtest(level="total", horizon=1, cutoffs=3)
+
+    # the small January is neither a usable origin nor a material actual
+    assert result["cutoffs"] == ["2023-11", "2023-12", "2024-01"]
+    assert result["overall"]["count"] == 2
+    assert result["overall"]["mape"] < 100
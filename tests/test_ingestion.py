@@ -0,0 +1,129 @@
+import io
+
+import pytest
+from sqlalchemy import func
+from werkzeug.datastructures import FileStorage
+
+from app.extensions import db
+from app.models.employee import Employee
+from app.models.expense import Expense
+from app.models.inventory import Inventory
+from app.models.sales import Sale
+from app.services.ingestion_service import read_file, stage_upload
+from tests.helpers import sale, upload_file
+
+
+def _stored_sales():
+    return db.session.query(func.count(Sale.id), func.sum(Sale.total_revenue)).one()
+
+
+def test_sales_and_expenses_are_stored(upload):
+    ok, message, count = upload("sales", [sale(quantity=2), sale(product="Bread", price=3.0)])
+    assert ok, message
+    assert count == 2
+    assert _stored_sales() == (2, 17)
+
+    ok, message, count = upload("expenses", [
+        {"date": "2024-01-05", "category": "Rent", "amount": 900},
+        {"date": "2024-01-06", "category": "Power", "amount": 120.5},
+    ])
+    assert ok, message
+    assert float(db.session.query(func.sum(Expense.amount)).scalar()) == 1020.5
+
+
+def test_inserts_are_chunked(app, upload):
+    app.config["INGEST_CHUNK_SIZE"] = 2
+    rows = [sale(f"2024-01-{d:02d}", price=d) for d in range(1, 8)]
+
+    ok, message, count = upload("sales", rows)
+
+    assert ok, message
+    assert count == 7
+    assert _stored_sales() == (7, 28)
+
+
+def test_inventory_upsert_updates_existing_skus(upload):
+    item = {"product_name": "Milk", "category": "Dairy", "sku": "M-1",
+            "current_stock": 10, "reorder_level": 5, "unit_cost": 1.5}
+    assert upload("inventory", [item])[0]
+
+    ok, message, count = upload("inventory", [
+        {**item, "current_stock": 7},
+        {**item, "current_stock": 3},  # last duplicate in the file wins
+        {**item, "sku": "B-1", "product_name": "Bread"},
+    ])
+
+    assert ok, message
+    assert "(1 new, 1 updated)" in message
+    assert count == 2
+    assert db.session.query(Inventory.current_stock).filter_by(sku="M-1").scalar() == 3
+    assert Inventory.query.count() == 2
+
+
+def test_employee_codes_keep_their_numeric_form(upload):
+    employee = {"employee_code": 1001, "full_name": "Asha", "department": "Sales",
+                "designation": "Clerk", "salary": 3000}
+    assert upload("employees", [employee])[0]
+    assert upload("employees", [{**employee, "salary": 3500}])[0]
+
+    stored = Employee.query.one()
+    assert stored.employee_code == "1001"
+    assert float(stored.salary) == 3500
+
+
+def test_invalid_rows_reject_the_file_unless_skipped(upload):
+    rows = [sale(), sale(day="not a date"), {**sale(), "quantity_sold": "many"}]
+
+    ok, message, _ = upload("sales", rows)
+    assert not ok
+    assert "(1 rows, lines 3)" in message and "(1 rows, lines 4)" in message
+    assert _stored_sales()[0] == 0
+
+    ok, message, count = upload("sales", rows, skip_invalid=True)
+    assert ok, message
+    assert count == 1
+    assert "Skipped 2 invalid rows (lines 3, 4)" in message
+
+
+@pytest.mark.parametrize("filename", ["sales.parquet", "sales.feather"])
+def test_arrow_formats_are_ingested(upload, filename):
+    ok, message, count = upload("sales", [sale(), sale(product="Bread", price=3.0)], filename=filename)
+
+    assert ok, message
+    assert count == 2
+    assert _stored_sales() == (2, 10)
+
+
+def test_arrow_reads_only_schema_columns(tmp_path):
+    rows = [{**sale(), "internal_note": "dropped"}]
+    path = tmp_path / "sales.parquet"
+    path.write_bytes(upload_file(rows, path.name).getvalue())
+
+    frame = read_file(str(path), "sales")
+
+    assert "internal_note" not in frame.columns
+    assert len(frame) == 1
+
+
+def test_uploads_are_parsed_without_a_saved_copy(upload, monkeypatch):
+    def save(*args, **kwargs):
+        raise AssertionError("upload was copied to disk")
+
+    monkeypatch.setattr(FileStorage, "save", save)
+
+    ok, message, count = upload("sales", [sale()])
+
+    assert ok, message
+    assert count == 1
+
+
+def test_stage_upload_takes_the_stream_and_rejects_unknown_types():
+    stream = io.BytesIO(b"date\n")
+    ok, _, source = stage_upload(FileStorage(stream, filename="sales.csv"))
+    assert ok
+    assert source is stream
+
+    ok, message, source = stage_upload(FileStorage(io.BytesIO(b"x"), filename="sales.txt"))
+    assert not ok
+    assert source is None
+    assert "Invalid file type" in message
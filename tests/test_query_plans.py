@@ -0,0 +1,36 @@
+from sqlalchemy import text
+
+from app.extensions import db
+from tests import query_plans
+from tests.helpers import sale
+
+
+def test_hot_queries_are_index_backed(app, upload):
+    upload("sales", [sale(f"2024-0{m}-1{d}", region="South", store_id="S001")
+                     for m in range(1, 4) for d in range(5)])
+    upload("expenses", [{"date": "2024-02-01", "category": "Rent", "amount": 900}])
+
+    report = query_plans.check_query_plans()
+
+    assert report
+    assert {name: tables for name, tables in report.items() if tables} == {}
+
+
+def test_unindexed_query_is_flagged(app, monkeypatch):
+    def by_cost_price():
+        db.session.execute(text("SELECT id FROM sales WHERE cost_price > 10")).all()
+
+    monkeypatch.setattr(query_plans, "hot_queries", lambda: [("by_cost_price", by_cost_price)])
+
+    assert query_plans.check_query_plans() == {"by_cost_price": ["sales"]}
+
+
+def test_whole_index_scan_fails_a_seek_query(app, monkeypatch):
+    def product_names():
+        db.session.execute(text("SELECT DISTINCT product_name FROM sales")).all()
+
+    monkeypatch.setattr(query_plans, "hot_queries", lambda: [("names", product_names), ("lookup", product_names)])
+    monkeypatch.setattr(query_plans, "SEEK_REQUIRED", {"lookup"})
+
+    # a covering-index scan is fine for a whole-table read, not for a lookup
+    assert query_plans.check_query_plans() == {"names": [], "lookup": ["sales"]}
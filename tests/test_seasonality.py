@@ -0,0 +1,71 @@
+import datetime
+import json
+
+import numpy as np
+import pytest
+
+from app.extensions import db
+from app.models.seasonal_factor import SeasonalFactor
+from app.models.seasonal_stat import SeasonalStat
+from app.repositories.seasonal_repo import rebuild_seasonal_stats
+from app.services.seasonality_service import get_seasonal_index, refresh_seasonal_factors
+from tests.helpers import sale
+
+SEASON = np.array([0.8, 0.85, 0.9, 1.0, 1.05, 1.1, 1.1, 1.05, 1.0, 0.95, 1.05, 1.15])
+
+
+def _growing_history(upload, years=4, growth=0.03):
+    rows = []
+    for m in range(years * 12):
+        revenue = 1000 * (1 + growth) ** m * SEASON[m % 12]
+        rows.append(sale(f"{2020 + m // 12}-{m % 12 + 1:02d}-15", price=round(revenue, 2)))
+    assert upload("sales", rows)[0]
+
+
+def test_monthly_factors_ignore_growth(upload):
+    _growing_history(upload)
+
+    factors = np.array(get_seasonal_index("month"))
+
+    # Raw slot averages would rank December far above January on growth alone
+    assert factors == pytest.approx(SEASON / SEASON.mean(), abs=0.03)
+
+
+def test_rebuild_matches_incremental_stats(app, upload):
+    _growing_history(upload)
+    incremental = get_seasonal_index("month")
+
+    rebuild_seasonal_stats()
+    assert get_seasonal_index("month") is None
+    refresh_seasonal_factors()
+    db.session.commit()
+
+    assert get_seasonal_index("month") == incremental
+
+
+def test_no_factors_before_two_years(upload):
+    _growing_history(upload, years=1)
+
+    assert get_seasonal_index("month") is None
+
+
+def test_factors_are_stored_per_touched_scope(upload):
+    _growing_history(upload)
+
+    stored = SeasonalFactor.query.filter_by(scope="category", scope_key="Dairy", grain="month").one()
+    assert get_seasonal_index("month", "category", "Dairy") == json.loads(stored.factors)
+
+    # readers get the stored row as is, nothing is recomputed on read
+    stored.factors = json.dumps([1.0] * 12)
+    db.session.commit()
+    assert get_seasonal_index("month", "category", "Dairy") == [1.0] * 12
+
+
+def test_week_factors_cover_iso_week_53(upload):
+    start = datetime.date(2022, 1, 3)
+    rows = [sale((start + datetime.timedelta(weeks=w)).isoformat(), price=round(100 * (1 + w / 200), 2))
+            for w in range(3 * 52)]
+    assert upload("sales", rows)[0]
+
+    assert len(get_seasonal_index("week")) == 53
+    assert {grain for grain, in db.session.query(SeasonalStat.grain).distinct()} == {"month", "week"}
@@ -0,0 +1,75 @@
+import pytest
+from sqlalchemy import func
+
+from app.extensions import db
+from app.models.ingest_checkpoint import IngestCheckpoint
+from app.models.sales import Sale
+from app.services import ingestion_service
+from tests.helpers import sale
+
+
+@pytest.fixture
+def streamed(app):
+    """Every upload streams, two rows per chunk."""
+    app.config["STREAM_UPLOAD_THRESHOLD"] = 0
+    app.config["STREAM_XLSX_THRESHOLD"] = 0
+    app.config["STREAM_CHUNK_ROWS"] = 2
+    return app
+
+
+def _stored_sales():
+    return db.session.query(func.count(Sale.id), func.sum(Sale.total_revenue)).one()
+
+
+def _week():
+    return [sale(f"2024-01-{d:02d}", price=d) for d in range(1, 8)]
+
+
+def test_streamed_csv_matches_whole_file(streamed, upload):
+    ok, message, count = upload("sales", _week())
+
+    assert ok, message
+    assert count == 7
+    assert _stored_sales() == (7, 28)
+    assert IngestCheckpoint.query.count() == 0
+
+
+def test_interrupted_stream_resumes_from_checkpoint(streamed, upload, monkeypatch):
+    save_to_db = ingestion_service.save_to_db
+    calls = []
+
+    def failing_save(*args, **kwargs):
+        calls.append(1)
+        if len(calls) == 3:
+            raise RuntimeError("connection lost")
+        return save_to_db(*args, **kwargs)
+
+    monkeypatch.setattr(ingestion_service, "save_to_db", failing_save)
+    ok, message, count = upload("sales", _week())
+    assert not ok
+    assert count == 4
+    assert "Re-upload the same file to resume" in message
+
+    monkeypatch.setattr(ingestion_service, "save_to_db", save_to_db)
+    ok, message, count = upload("sales", _week())
+    assert ok, message
+    assert count == 3
+    assert "Resumed after 4" in message
+    assert _stored_sales() == (7, 28)
+    assert IngestCheckpoint.query.count() == 0
+
+
+def test_streamed_parquet(streamed, upload):
+    ok, message, count = upload("sales", _week(), filename="sales.parquet")
+
+    assert ok, message
+    assert count == 7
+    assert _stored_sales() == (7, 28)
+
+
+def test_streamed_xlsx(streamed, upload):
+    ok, message, count = upload("sales", _week(), filename="sales.xlsx")
+
+    assert ok, message
+    assert count == 7
+    assert _stored_sales() == (7, 28)
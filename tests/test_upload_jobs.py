@@ -0,0 +1,71 @@
+from app.extensions import db, socketio
+from app.models.upload_job import UploadJob
+from app.repositories.upload_job_repo import create_job
+from app.services import upload_job_service
+from app.services.upload_job_service import relay_pending_events
+from tests.helpers import sale, upload_file, wait_for
+
+
+def _post(client, data_type, rows, filename="sales.csv", **form):
+    return client.post("/hr/upload", data={
+        "data_type": data_type, "file": (upload_file(rows, filename), filename), **form
+    })
+
+
+def test_queued_upload_reports_progress_to_socket_clients(app, login):
+    client = login("HR")
+    relay_pending_events(app)  # drop events left by earlier tests
+    listener = socketio.test_client(app)
+
+    response = _post(client, "sales", [sale(), sale(product="Bread")])
+    assert response.status_code == 302
+
+    job_id = UploadJob.query.one().id
+    job = wait_for(lambda: client.get(f"/hr/api/upload-jobs/{job_id}").get_json())
+    assert job["status"] == "success", job["message"]
+    assert (job["rows_parsed"], job["rows_validated"], job["rows_inserted"]) == (2, 2, 2)
+
+    # Worker threads only queue events; the relay emits them on the server loop
+    assert relay_pending_events(app) > 0
+    updates = [event["args"][0] for event in listener.get_received()
+               if event["name"] == "upload_progress"]
+    assert {u["job_id"] for u in updates} == {job_id}
+    assert updates[-1]["status"] == "success"
+
+
+def test_failed_upload_keeps_the_error(login):
+    client = login("HR")
+
+    _post(client, "sales", [{**sale(), "quantity_sold": "many"}])
+
+    job_id = UploadJob.query.one().id
+    job = wait_for(lambda: client.get(f"/hr/api/upload-jobs/{job_id}").get_json())
+    assert job["status"] == "failed"
+    assert "quantity_sold" in job["message"]
+
+
+def test_crashed_upload_still_finishes(login, monkeypatch):
+    def crash(*args, **kwargs):
+        raise RuntimeError("disk full")
+
+    monkeypatch.setattr(upload_job_service, "ingest_file", crash)
+    client = login("HR")
+
+    _post(client, "sales", [sale()])
+
+    job_id = UploadJob.query.one().id
+    job = wait_for(lambda: client.get(f"/hr/api/upload-jobs/{job_id}").get_json())
+    assert job["status"] == "failed"
+    assert "disk full" in job["message"]
+
+
+def test_jobs_left_running_fail_on_first_request(app, login):
+    client = login("HR")
+    job_id = create_job("sales.csv", "sales", uploaded_by=None).id
+    db.session.remove()
+
+    client.get("/hr/upload/history")
+
+    stored = db.session.get(UploadJob, job_id)
+    assert stored.status == "failed"
+    assert "server restart" in stored.message